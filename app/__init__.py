@@ -17,6 +17,8 @@ Application Architecture:
 - API Documentation: OpenAPI 3.1 with Flask-SMOREST
 - Error Handling: Centralized JSON error responses
 - Permission System: Role-based access control
+- Background Jobs: Thread pool for slow maintenance tasks
+- Migrations: Online conversion of the records of previous versions
 
 Environment Support:
 - Development: Local development with debug features
@@ -24,13 +26,19 @@ Environment Support:
 - Production: Optimized for deployment with Gunicorn
 """
 
+import os
+
 from flask import Flask
 
 from app import config
+from app.tools import acl
 from app.tools import authentication
 from app.tools import database
 from app.tools import exceptions
+from app.tools import jobs
+from app.tools import migrations
 from app.tools import openapi
+from app.tools import writebehind
 
 
 def create_app(**kwds):
@@ -53,7 +61,8 @@ def create_app(**kwds):
     Application Initialization Order:
         1. Create Flask app and load configuration
         2. Initialize authentication system (FLAAT/JWT)
-        3. Initialize database connection (MongoDB)
+        3. Initialize database connection (MongoDB), experiments ACL,
+           background jobs, migrations and drifts writer
         4. Setup error handlers for consistent JSON responses  
         5. Initialize API documentation (OpenAPI/Swagger)
         6. Register health check route
@@ -69,9 +78,15 @@ def create_app(**kwds):
     settings = config.Settings(**kwds)  # type: ignore
     app = Flask(__name__)
     app.config.from_object(settings)
+    if app.config["CACHE_SQLITE_PATH"] is None:  # Private to the application
+        app.config["CACHE_SQLITE_PATH"] = os.path.join(app.instance_path, "cache.sqlite3")
     # Server modules init
     authentication.init_app(app)
     database.init_app(app)
+    acl.init_app(app)
+    jobs.init_app(app)
+    migrations.init_app(app)
+    writebehind.init_app(app)
     exceptions.init_app(app)
     openapi.init_app(app)
     # Add empty response to root route
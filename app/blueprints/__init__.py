@@ -2,8 +2,10 @@
 
 from app.blueprints import entitlement as _entitlement
 from app.blueprints import experiment as _experiment
+from app.blueprints import job as _job
 from app.blueprints import user as _user
 
 entitlement = _entitlement.blp
 experiment = _experiment.blp
+job = _job.blp
 user = _user.blp
@@ -7,7 +7,6 @@ from flask.views import MethodView
 
 from app import schemas, utils
 from app.config import Blueprint
-from app.tools import authentication
 from app.tools.authentication import Authentication
 
 blp = Blueprint("Entitlements", __name__, description=__doc__)
@@ -35,8 +34,8 @@ class Entitlements(MethodView):
             401: If the user is not authenticated or registered.
             403: If the user does not have the required permissions.
         """
-        # Search for users based on the provided JSON query.
-        _ = utils.get_user(user_infos)
+        # Check if the user is registered and retrieve the context.
+        context = utils.get_context(user_infos)
 
-        # Return the paginated list of users.
-        return {"items": authentication.get_entitlements(user_infos)}
+        # Return the sorted list of entitlements.
+        return {"items": sorted(context.entitlements)}
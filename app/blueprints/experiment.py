@@ -3,16 +3,29 @@
 """
 
 import uuid
-from datetime import datetime as dt
 
 import marshmallow as ma
-from flask import abort, current_app
+from flask import Response, abort, current_app, request, stream_with_context, url_for
 from flask.views import MethodView
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from app import schemas, utils
 from app.config import Blueprint
+from app.tools import acl, apikeys, jobs, ndjson, pagination, parameters, writebehind
 from app.tools.authentication import FORBIDDEN, Authentication
-from app.tools.database import CONFLICT, NOT_FOUND
+from app.tools.database import (
+    ACTIVE_EXPERIMENTS,
+    CONFLICT,
+    NOT_FOUND,
+    PAYLOAD_TOO_LARGE,
+    PRECONDITION_FAILED,
+    SHARED_DRIFTS,
+    UNSUPPORTED_MEDIA_TYPE,
+    create_drift_collection,
+    is_timeseries,
+    timeseries_meta,
+    utcnow,
+)
 
 blp = Blueprint("Experiments", __name__, description=__doc__)
 auth = Authentication(blueprint=blp)
@@ -23,14 +36,17 @@ class ExperimentsSearch(MethodView):
     """Experiments API Custom method Search."""
 
     @auth.access_level("everyone")
+    @auth.inject_user_infos(strict=False)
     @blp.arguments(ma.Schema(), location="json", unknown="include")
     @blp.arguments(schemas.SortExperiments, location="query", unknown="include")
+    @blp.doc(responses={"403": FORBIDDEN})
     @blp.response(200, schemas.Experiment(many=True))
     @blp.paginate()
-    def post(self, json, query_args, pagination_parameters):
+    def post(self, json, query_args, pagination_parameters, user_infos=None):
         """
         Get a paginated list of experiments based on the provided JSON query
-        and MongoDB format.
+        and MongoDB format. Use `accessible=true` to list only experiments
+        the user can read.
         ---
         Internal comment not meant to be exposed.
 
@@ -38,29 +54,26 @@ class ExperimentsSearch(MethodView):
             json: A JSON object representing the query parameters.
             query_args: A dictionary of query parameters.
             pagination_parameters: An object containing pagination parameters.
+            user_infos: User information obtained from authentication process.
 
         Returns:
             A paginated list of experiments matching the query.
 
         Raises:
+            403: If accessible is requested and the user is not registered.
             422: If the JSON query is not in the correct format.
         """
-        # Extract sort_by and order_by from query_args
-        sort_by, order_by = query_args["sort_by"], query_args["order_by"]
-        sort_order = 1 if order_by == "asc" else -1
-
-        # Search for experiments based on the provided JSON query.
+        # Restrict the query to the experiments the user can read.
+        json = utils.parse_dates(json)
+        if query_args["accessible"]:
+            context = utils.get_context(user_infos) if user_infos else None
+            access = utils.access_filter(context)
+            json = {"$and": [json, access]} if access else json
+
+        # Return the page of experiments matching the JSON query.
         experiments = current_app.config["db"]["app.experiments"]
-        search = experiments.find(json).sort(sort_by, sort_order)
-
-        # Return the paginated list of experiments.
-        page = pagination_parameters.page
-        page_size = pagination_parameters.page_size
-        item_count = experiments.count_documents(json)
-
-        # Return the paginated list of experiments.
-        pagination_parameters.item_count = item_count
-        return search.skip((page - 1) * page_size).limit(page_size)
+        json = {"$and": [json, ACTIVE_EXPERIMENTS]}
+        return pagination.paginate(experiments, json, query_args, pagination_parameters)
 
 
 @blp.route("")
@@ -92,20 +105,26 @@ class Experiments(MethodView):
             422: If the JSON query is not in the correct format.
         """
         # Check if the user is registered and retrieve the user object.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos)
 
         # Modify the JSON object to include the user ID and permissions.
-        json["created_at"] = dt.now().isoformat()
+        json["created_at"] = utcnow()
         json["_id"] = str(uuid.uuid4())
+        json["revision"] = 1
+        if current_app.config["DATABASE_SHARED_DRIFTS"] and not is_timeseries(json):
+            json["drifts_collection"] = SHARED_DRIFTS
         # Note MongoDB does not allow dots in keys.
-        if utils.get_permission(json, user["_id"], user_infos) != "Manage":
-            owner_permission = {"level": "Manage", "entity": user["_id"]}
+        if utils.get_permission(json, context) != "Manage":
+            owner_permission = {"level": "Manage", "entity": context.user["_id"]}
             json["permissions"].append(owner_permission)
-        # Insert it into the database.
+        # Insert it into the database, names are unique.
         experiments = current_app.config["db"]["app.experiments"]
-        if experiments.find_one({"name": json["name"]}):
+        try:
+            experiments.insert_one(json)
+        except DuplicateKeyError:
             abort(409, "Name conflict.")
-        experiments.insert_one(json)
+        acl.sync(json)
+        create_drift_collection(current_app.config["db"], json)
 
         # Return the updated user object.
         return json
@@ -164,59 +183,150 @@ class Experiment(MethodView):
             422: If the JSON query is not in the correct format.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos)
         experiment_id = str(experiment_id)
-        experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user["_id"], user_infos, level="Manage")
-
-        # Check for conflicts in the database.
-        experiments = current_app.config["db"]["app.experiments"]
-        if "name" in json and json["name"] != experiment["name"]:
-            if experiments.find_one({"name": json["name"]}):
-                abort(409, "Name conflict.")
+        experiment = utils.get_experiment(experiment_id, use_cache=False)
+        utils.check_access(experiment, context, level="Manage")
 
         # Modify the JSON object to include the user ID and permissions.
+        revision = experiment.get("revision")
         experiment.update(json)
+        experiment["revision"] = (revision or 0) + 1
         # Note MongoDB does not allow dots in keys.
-        if utils.get_permission(json, user["_id"], user_infos) != "Manage":
-            owner_permission = {"level": "Manage", "entity": user["_id"]}
+        if utils.get_permission(json, context) != "Manage":
+            owner_permission = {"level": "Manage", "entity": context.user["_id"]}
             json["permissions"].append(owner_permission)
 
-        # Replace the drift record in the database.
-        experiments.replace_one({"_id": experiment_id}, experiment)
+        # Replace the experiment unless modified since it was read.
+        experiments = current_app.config["db"]["app.experiments"]
+        query = {"_id": experiment_id, "revision": revision}
+        try:
+            result = experiments.replace_one(query, experiment)
+        except DuplicateKeyError:
+            abort(409, "Name conflict.")
+        utils.invalidate_experiment(experiment_id)
+        if result.matched_count == 0:
+            abort(409, "Experiment modified concurrently.")
+        acl.sync(experiment)
 
         # Return the updated drift record.
         return experiment
 
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.arguments(schemas.PatchExperiment, location="json", unknown="raise")
+    @blp.doc(responses={"404": NOT_FOUND, "409": CONFLICT, "412": PRECONDITION_FAILED})
+    @blp.response(200, schemas.Experiment)
+    def patch(self, json, experiment_id, user_infos):
+        """
+        Partially update a experiment record with the given JSON data.
+        Send the experiment revision in the `If-Match` header to update
+        it only if it was not modified since it was read.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            json (dict): JSON data containing the fields to update.
+            experiment_id (str): ID of the experiment to update.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The updated experiment record.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment specified is not found.
+            409: If the a experiment with the same name already exists.
+            412: If the experiment revision does not match If-Match.
+            422: If the JSON query is not in the correct format.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Manage")
+
+        # Build the update, the owner keeps managing replaced permissions.
+        update = {}
+        if "permissions" in json and utils.get_permission(json, context) != "Manage":
+            owner_permission = {"level": "Manage", "entity": context.user["_id"]}
+            json["permissions"].append(owner_permission)
+        if "add_permissions" in json:
+            new_permissions = json.pop("add_permissions")
+            update["$push"] = {"permissions": {"$each": new_permissions}}
+        if json:
+            update["$set"] = json
+
+        # Update the experiment unless modified since the given revision.
+        experiments = current_app.config["db"]["app.experiments"]
+        try:
+            experiment = utils.patch_document(
+                experiments, experiment_id, update, revision=utils.if_match(), scope=ACTIVE_EXPERIMENTS
+            )
+        except DuplicateKeyError:
+            abort(409, "Name conflict.")
+        finally:
+            utils.invalidate_experiment(experiment_id)
+        if experiment is None:
+            abort(404, "Experiment not found.")
+        acl.sync(experiment)  # Rows of the new revision
+
+        # Return the updated experiment record.
+        return experiment
+
     @auth.access_level("user")
     @auth.inject_user_infos()
     @blp.doc(responses={"404": NOT_FOUND})
-    @blp.response(204)
+    @blp.response(202, schemas.Job)
     def delete(self, experiment_id, user_infos):
         """
-        Delete a experiment record from the database.
+        Delete a experiment record from the database. The drift records
+        are removed by a background job, follow it at `/job/{job_id}`.
         ---
         Internal comment not meant to be exposed.
 
         Args:
-            json (dict): JSON data containing the updated drift information.
-            experiment_id (str): ID of the experiment to retrieve drifts from.
+            experiment_id (str): ID of the experiment to delete.
             user_infos (dict): User information from the authentication token.
 
+        Returns:
+            dict: The job removing the drift records of the experiment.
+
         Raises:
             401: If the user is not authenticated or registered.
             403: If the user does not have the required permissions.
-            404: If the drift or experiment specified are not found.
+            404: If the experiment specified is not found.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos)
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user["_id"], user_infos, level="Manage")
+        utils.check_access(experiment, context, level="Manage")
 
-        # Replace the drift record in the database.
+        # Mark the experiment as deleting, its drifts are not reachable after.
+        # The record is deleted by the job, once the drifts are dropped.
         experiments = current_app.config["db"]["app.experiments"]
-        experiments.delete_one({"_id": experiment_id})
+        update = {"$set": {"deleting": True, "deleted_at": utcnow()}, "$inc": {"revision": 1}}
+        result = experiments.update_one({"_id": experiment_id, **ACTIVE_EXPERIMENTS}, update)
+        utils.invalidate_experiment(experiment_id)
+        if result.matched_count == 0:
+            abort(404, "Experiment not found.")
+        acl.remove(experiment_id)
+
+        # Remove the API keys granting access to the experiment.
+        api_keys = current_app.config["db"]["app.api_keys"]
+        for api_key in api_keys.find({"experiment_id": experiment_id}):
+            apikeys.invalidate_key(api_key)
+        api_keys.delete_many({"experiment_id": experiment_id})
+
+        # Drop the drift records in the background and return the job.
+        job = jobs.submit(
+            "delete_experiment",
+            user_id=context.user["_id"],
+            experiment_id=experiment_id,
+        )
+        return job, 202, {"Location": url_for("Jobs.Job", job_id=job["_id"])}
 
 
 @blp.route("/<uuid:experiment_id>/drift/search")
@@ -253,28 +363,21 @@ class DriftSearch(MethodView):
             422: If the JSON query is not in the correct format.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos) if user_infos else None
-        user_id = user.get("_id") if user else None
+        context = utils.get_context(user_infos, api_key=True) if user_infos else None
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user_id, user_infos, level="Read")
-
-        # Extract sort_by and order_by from query_args
-        sort_by, order_by = query_args["sort_by"], query_args["order_by"]
-        sort_order = 1 if order_by == "asc" else -1
+        utils.check_access(experiment, context, level="Read")
 
         # Search for drifts based on the provided JSON query.
-        drifts = current_app.config["db"][f"app.{experiment_id}"]
-        search = drifts.find(json).sort(sort_by, sort_order)
+        json = utils.parse_drift_ids(utils.parse_dates(json))
+        drifts, scope = utils.drift_collection(experiment)
+        json.update(scope)  # Other conditions are not allowed to widen it
+        exclude = query_args["exclude_parameters"]
+        projection = {"parameters": 0, "parameters_id": 0} if exclude else None
 
-        # Return the paginated list of drifts.
-        page = pagination_parameters.page
-        page_size = pagination_parameters.page_size
-        item_count = drifts.count_documents(json)
-
-        # Return the paginated list of drifts.
-        pagination_parameters.item_count = item_count
-        return search.skip((page - 1) * page_size).limit(page_size)
+        # Return the page of drifts, with their offloaded parameters.
+        page = pagination.paginate(drifts, json, query_args, pagination_parameters, projection)
+        return page if exclude else parameters.load(page)
 
 
 @blp.route("/<uuid:experiment_id>/drift")
@@ -284,15 +387,20 @@ class Drifts(MethodView):
     @auth.access_level("user")
     @auth.inject_user_infos()
     @blp.arguments(schemas.CreateDrift, location="json", unknown="raise")
-    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.arguments(schemas.IdempotencyHeaders, location="headers")
+    @blp.doc(responses={"404": NOT_FOUND, "409": CONFLICT})
     @blp.response(201, schemas.Drift)
-    def post(self, json, experiment_id, user_infos):
+    def post(self, json, headers, experiment_id, user_infos):
         """Create a new drift Job record in the database.
+        Send an `Idempotency-Key` header or set the drift `id` to retry
+        the creation safely. A retried request returns the original drift
+        with the `Idempotent-Replayed` header.
         ---
         Internal comment not meant to be exposed.
 
         Args:
             json (dict): The JSON payload containing the drift information.
+            headers (dict): Request headers with the idempotency key.
             user_infos (dict): User information obtained from the
                                authentication process.
 
@@ -303,25 +411,208 @@ class Drifts(MethodView):
             401: If the user is not authenticated or registered.
             403: If the user does not have the required permissions.
             404: If the experiment with the specified ID is not found.
+            409: If the drift id exists with other idempotency key, or an
+                 idempotent creation targets a time-series experiment.
             422: If the JSON query is not in the correct format.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos, api_key=True)
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user["_id"], user_infos, level="Edit")
+        utils.check_access(experiment, context, level="Edit")
+
+        # Insert the drift record, grouped with others if write-behind.
+        drifts, scope = utils.drift_collection(experiment)
+        key, client_id = headers.get("idempotency_key"), "_id" in json
+        drift = utils.new_drift(json, experiment)
+        document, record = parameters.split(drift, experiment_id)
+        if key is None and not client_id:
+            writebehind.insert(drifts, document)
+            parameters.save(record)
+            return drift
+        if is_timeseries(experiment):  # Unique indexes are not supported
+            abort(409, "Idempotent creation not supported by time-series storage.")
+
+        # Insert the drift unless it exists, in a single round trip.
+        query = {"idempotency_key": key} if key else {"_id": drift["_id"]}
+        query.update(scope)
+        drift.update(query)
+        update = {"$setOnInsert": {k: v for k, v in document.items() if k not in query}}
+        try:  # The drift found before the update, None when inserted
+            stored = drifts.find_one_and_update(query, update, upsert=True)
+        except DuplicateKeyError:  # Concurrent retry or id of other drift
+            stored = drifts.find_one(query) or abort(409, "Drift id conflict.")
+
+        # Return the new drift, or the original one when replayed.
+        if stored is None:
+            parameters.save(record)
+            return drift
+        return parameters.load([stored])[0], 201, {"Idempotent-Replayed": "true"}
+
+
+@blp.route("/<uuid:experiment_id>/drift/batch")
+class DriftsBatch(MethodView):
+    """Drifts API Custom method Batch."""
 
-        # Append the schema version to the drift object.
-        json["schema_version"] = "1.0.0"
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.arguments(ma.Schema(many=True), location="json", unknown="include")
+    @blp.doc(responses={"404": NOT_FOUND, "413": PAYLOAD_TOO_LARGE})
+    @blp.response(207, schemas.DriftsBatch)
+    def post(self, json, experiment_id, user_infos):
+        """Create a batch of drift Job records in the database.
+        Send an array of drift payloads, as in the creation of a single
+        drift. Each item is validated and inserted independently, so the
+        response reports the result of every item in the request order.
+        ---
+        Internal comment not meant to be exposed.
 
-        # Insert the drift record into the database.
-        drifts = current_app.config["db"][f"app.{experiment_id}"]
-        json["created_at"] = dt.now().isoformat()
-        json["_id"] = str(uuid.uuid4())
-        drifts.insert_one(json)
+        Args:
+            json (list): The JSON array of drift payloads.
+            experiment_id (str): ID of the experiment to add drifts to.
+            user_infos (dict): User information obtained from the
+                               authentication process.
 
-        # Return the updated drift object.
-        return json
+        Returns:
+            dict: The number of drifts created and failed and the result
+            of each item.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment with the specified ID is not found.
+            413: If the batch has more than DRIFTS_BATCH_MAXSIZE items.
+        """
+        # Check if the user is registered and validate access level once.
+        context = utils.get_context(user_infos, api_key=True)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Edit")
+        if len(json) > current_app.config["DRIFTS_BATCH_MAXSIZE"]:
+            abort(413, "Too many drifts in batch.")
+
+        # Validate the payloads, invalid items are reported and skipped.
+        results, documents, records, schema = [], [], [], schemas.CreateDrift()
+        for index, item in enumerate(json):
+            try:
+                drift = utils.new_drift(schema.load(item, unknown=ma.RAISE), experiment)
+                document, record = parameters.split(drift, experiment_id)
+                documents.append(document)
+                records.append(record)
+                results.append({"index": index, "status": 201, "_id": drift["_id"]})
+            except ma.ValidationError as err:
+                results.append({"index": index, "status": 422, "errors": err.messages})
+
+        # Insert the valid drifts, failed writes do not stop the others.
+        drifts, _ = utils.drift_collection(experiment)
+        inserted = [result for result in results if result["status"] == 201]
+        try:
+            if documents:
+                drifts.insert_many(documents, ordered=False)
+        except BulkWriteError as err:
+            for error in err.details["writeErrors"]:
+                result = inserted[error["index"]]
+                result["status"] = 409 if error["code"] == 11000 else 500
+                result["message"] = error["errmsg"]
+                records[error["index"]] = None
+        parameters.save(*records)
+
+        # Return the result of each item in the request order.
+        created = sum(1 for result in results if result["status"] == 201)
+        return {"created": created, "failed": len(results) - created, "items": results}
+
+
+@blp.route("/<uuid:experiment_id>/drift/stream")
+class DriftsStream(MethodView):
+    """Drifts API Custom method Stream."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.doc(
+        requestBody={"content": {ndjson.MIMETYPE: {"schema": {"type": "string"}}}},
+        responses={
+            "200": {"description": "Progress", "content": {ndjson.MIMETYPE: {}}},
+            "404": NOT_FOUND,
+            "415": UNSUPPORTED_MEDIA_TYPE,
+        },
+    )
+    def post(self, experiment_id, user_infos):
+        """Create drift Job records from a stream of NDJSON lines.
+        Send one drift payload per line with the `application/x-ndjson`
+        content type. Lines are read and inserted in chunks while the
+        request is uploaded, and the response streams one NDJSON line per
+        rejected drift, one per inserted chunk and a final summary.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            experiment_id (str): ID of the experiment to add drifts to.
+            user_infos (dict): User information obtained from the
+                               authentication process.
+
+        Returns:
+            Response: Streamed NDJSON with the ingestion progress.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment with the specified ID is not found.
+            415: If the request content type is not NDJSON.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos, api_key=True)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Edit")
+        if request.mimetype != ndjson.MIMETYPE:
+            abort(415, f"Expected {ndjson.MIMETYPE} content.")
+
+        # Stream the results while the drifts are read and inserted.
+        lines = ndjson.read_lines(request.stream, current_app.config["DRIFTS_STREAM_MAX_LINE"])
+        chunk_size = current_app.config["DRIFTS_STREAM_CHUNKSIZE"]
+        results = _ingest(experiment, lines, chunk_size)
+        return Response(stream_with_context(results), mimetype=ndjson.MIMETYPE)
+
+
+def _ingest(experiment, lines, chunk_size):
+    drifts, _ = utils.drift_collection(experiment)
+    schema, chunk, records, numbers = schemas.CreateDrift(), [], [], []
+    progress = {"lines": 0, "created": 0, "failed": 0}
+    for number, line in lines:
+        progress["lines"] = number
+        try:
+            if line is None:
+                raise ma.ValidationError("Line too long.")
+            drift = utils.new_drift(schema.loads(line, unknown=ma.RAISE), experiment)
+            document, record = parameters.split(drift, experiment["_id"])
+            chunk.append(document)
+            records.append(record)
+            numbers.append(number)
+        except (ma.ValidationError, ValueError) as err:
+            progress["failed"] += 1
+            errors = err.messages if isinstance(err, ma.ValidationError) else ["Invalid JSON."]
+            yield ndjson.dumps({"line": number, "status": 422, "errors": errors})
+        if len(chunk) >= chunk_size:
+            yield from _insert_chunk(drifts, chunk, records, numbers, progress)
+            chunk, records, numbers = [], [], []
+    if chunk:
+        yield from _insert_chunk(drifts, chunk, records, numbers, progress)
+    yield ndjson.dumps({**progress, "done": True})
+
+
+def _insert_chunk(drifts, chunk, records, numbers, progress):
+    failed = {}
+    try:
+        drifts.insert_many(chunk, ordered=False)
+    except BulkWriteError as err:
+        failed = {error["index"]: error for error in err.details["writeErrors"]}
+    parameters.save(*(r for index, r in enumerate(records) if index not in failed))
+    for index, error in failed.items():
+        status = 409 if error["code"] == 11000 else 500
+        yield ndjson.dumps({"line": numbers[index], "status": status, "message": error["errmsg"]})
+    progress["created"] += len(chunk) - len(failed)
+    progress["failed"] += len(failed)
+    yield ndjson.dumps(progress)
 
 
 @blp.route("/<uuid:experiment_id>/drift/<uuid:drift_id>")
@@ -350,15 +641,14 @@ class Drift(MethodView):
             404: If the drift or experiment specified are not found.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos) if user_infos else None
-        user_id = user.get("_id") if user else None
+        context = utils.get_context(user_infos, api_key=True) if user_infos else None
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user_id, user_infos, level="Read")
+        utils.check_access(experiment, context, level="Read")
 
         # Retrieve and return the drift object from the database.
         drift_id = str(drift_id)
-        return utils.get_drifts(experiment_id, drift_id)
+        return parameters.load([utils.get_drifts(experiment, drift_id)])[0]
 
     @auth.access_level("user")
     @auth.inject_user_infos()
@@ -387,23 +677,90 @@ class Drift(MethodView):
             422: If the JSON query is not in the correct format.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos, api_key=True)
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user["_id"], user_infos, level="Edit")
+        utils.check_access(experiment, context, level="Edit")
 
         # Collect the drift record from the database and update it.
         drift_id = str(drift_id)
-        drift = utils.get_drifts(experiment_id, drift_id)
+        drift = utils.get_drifts(experiment, drift_id)
         drift.update(json)
+        drift["revision"] = drift.get("revision", 0) + 1
+        if is_timeseries(experiment):
+            drift["meta"] = timeseries_meta(drift)
 
         # Replace the drift record in the database.
-        drifts = current_app.config["db"][f"app.{experiment_id}"]
-        drifts.replace_one({"_id": str(drift_id)}, drift)
+        drifts, _ = utils.drift_collection(experiment)
+        document, record = parameters.split(drift, experiment_id)
+        drifts.replace_one({"_id": drift["_id"]}, document)
+        if record is not None:
+            parameters.save(record)
+        elif "parameters_id" in drift:  # Parameters moved back inline
+            parameters.discard(experiment_id, drift_id)
 
         # Return the updated drift record.
         return drift
 
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.arguments(schemas.PatchDrift, location="json", unknown="raise")
+    @blp.doc(responses={"404": NOT_FOUND, "412": PRECONDITION_FAILED})
+    @blp.response(200, schemas.Drift)
+    def patch(self, json, experiment_id, drift_id, user_infos):
+        """
+        Partially update a drift job record with the given JSON data.
+        Send the drift revision in the `If-Match` header to update it
+        only if it was not modified since it was read.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            json (dict): JSON data containing the fields to update.
+            experiment_id (str): ID of the experiment to retrieve drifts from.
+            drift_id (str): The ID of the drift record to be updated.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The updated drift record.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the drift or experiment specified are not found.
+            412: If the drift revision does not match If-Match.
+            422: If the JSON query is not in the correct format.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos, api_key=True)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Edit")
+
+        # Build the update without reading the drift record.
+        update = {}
+        if "add_tags" in json:
+            update["$push"] = {"tags": {"$each": json.pop("add_tags")}}
+        if json:
+            update["$set"] = json
+        if is_timeseries(experiment):  # Keep the meta field in sync
+            for operator, fields in list(update.items()):
+                meta = {f"meta.{k}": v for k, v in fields.items() if k in ("model", "tags")}
+                update[operator] = {**fields, **meta}
+        update, record = parameters.split_update(update, experiment_id, drift_id)
+
+        # Update the drift unless modified since the given revision.
+        drifts, scope = utils.drift_collection(experiment)
+        drift_key = utils.drift_key(drift_id)
+        revision = utils.if_match()
+        drift = utils.patch_document(drifts, drift_key, update, revision=revision, scope=scope)
+        if drift is None:
+            abort(404, "Drift not found.")
+        _save_parameters(experiment_id, drift_id, update, record)
+
+        # Return the updated drift record.
+        return parameters.load([drift])[0]
+
     @auth.access_level("user")
     @auth.inject_user_infos()
     @blp.doc(responses={"404": NOT_FOUND})
@@ -428,15 +785,242 @@ class Drift(MethodView):
             404: If the drift specified is not found.
         """
         # Check if the user is registered and validate access level.
-        user = utils.get_user(user_infos)
+        context = utils.get_context(user_infos, api_key=True)
         experiment_id = str(experiment_id)
         experiment = utils.get_experiment(experiment_id)
-        utils.check_access(experiment, user["_id"], user_infos, level="Edit")
+        utils.check_access(experiment, context, level="Edit")
 
         # Collect the drift record from the database.
         drift_id = str(drift_id)
-        _ = utils.get_drifts(experiment_id, drift_id)
+        drift = utils.get_drifts(experiment, drift_id)
+
+        # Delete the drift record and its offloaded parameters.
+        drifts, _ = utils.drift_collection(experiment)
+        drifts.delete_one({"_id": drift["_id"]})
+        if "parameters_id" in drift:
+            parameters.discard(experiment_id, drift_id)
+
+
+@blp.route("/<uuid:experiment_id>/drift/<uuid:drift_id>/parameters")
+class DriftParameters(MethodView):
+    """Drift API Custom method Parameters."""
+
+    @auth.access_level("everyone")
+    @auth.inject_user_infos(strict=False)
+    @blp.doc(responses={"403": FORBIDDEN, "404": NOT_FOUND})
+    @blp.response(200, schemas.DriftParameters)
+    def get(self, experiment_id, drift_id, user_infos=None):
+        """Retrieve the parameters of a drift job.
+        Use it to fetch the parameters of drifts listed by a search with
+        `exclude_parameters`, which leaves them out of the results.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            experiment_id (str): ID of the experiment to retrieve drifts from.
+            drift_id (str): The ID of the drift to retrieve.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The drift parameters.
+
+        Raises:
+            403: If the user does not have the required permissions.
+            404: If the drift or experiment specified are not found.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos, api_key=True) if user_infos else None
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Read")
+
+        # Retrieve the drift parameters, inline or offloaded.
+        drift_id = str(drift_id)
+        drift = utils.get_drifts(experiment, drift_id)
+        return {"parameters": parameters.load([drift])[0].get("parameters", {})}
+
+
+# Drift job statuses from which each transition is allowed
+TRANSITIONS = {"Completed": ["Running"], "Failed": ["Running"]}
+
+
+@blp.route("/<uuid:experiment_id>/drift/<uuid:drift_id>/status")
+class DriftStatus(MethodView):
+    """Drift API Custom method Status."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.arguments(schemas.DriftStatus, location="json", unknown="raise")
+    @blp.doc(responses={"404": NOT_FOUND, "409": CONFLICT})
+    @blp.response(204)
+    def post(self, json, experiment_id, drift_id, user_infos):
+        """
+        Transition a running drift job to Completed or Failed.
+        The status and detection result are written in a single update,
+        without sending or returning the whole drift record.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            json (dict): JSON data with the new status and drift result.
+            experiment_id (str): ID of the experiment to retrieve drifts from.
+            drift_id (str): The ID of the drift record to be updated.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            None
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the drift or experiment specified are not found.
+            409: If the drift status does not allow the transition.
+            422: If the JSON query is not in the correct format.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos, api_key=True)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Edit")
+
+        # Update the drift only if its status allows the transition.
+        drifts, scope = utils.drift_collection(experiment)
+        query = {"_id": utils.drift_key(drift_id), **scope}
+        guard = {"$in": TRANSITIONS[json["job_status"]]}
+        update = {"$set": json, "$inc": {"revision": 1}}
+        update, record = parameters.split_update(update, experiment_id, drift_id)
+        result = drifts.update_one({**query, "job_status": guard}, update)
+
+        # Find out why the drift was not updated, only when it failed.
+        if result.matched_count == 0:
+            if drifts.count_documents(query, limit=1) == 0:
+                abort(404, "Drift not found.")
+            abort(409, "Invalid status transition.")
+        _save_parameters(experiment_id, drift_id, update, record)
+
+
+def _save_parameters(experiment_id, drift_id, update, record):
+    if record is not None:
+        parameters.save(record)
+    elif "parameters_id" in update.get("$unset", {}):  # Moved back inline
+        parameters.discard(experiment_id, drift_id)
+
+
+@blp.route("/<uuid:experiment_id>/api-key")
+class ApiKeys(MethodView):
+    """API Keys API."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.response(200, schemas.ApiKey(many=True))
+    def get(self, experiment_id, user_infos):
+        """List the API keys of an experiment.
+        ---
+        Internal comment not meant to be exposed.
 
-        # Delete the drift record from the database.
-        drifts = current_app.config["db"][f"app.{experiment_id}"]
-        drifts.delete_one({"_id": drift_id})
+        Args:
+            experiment_id (str): ID of the experiment to list API keys from.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            list: The API keys of the experiment, without the keys.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment with the specified ID is not found.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Manage")
+
+        # Return the API keys of the experiment.
+        api_keys = current_app.config["db"]["app.api_keys"]
+        return api_keys.find({"experiment_id": experiment_id})
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.arguments(schemas.CreateApiKey, location="json", unknown="raise")
+    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.response(201, schemas.ApiKey)
+    def post(self, json, experiment_id, user_infos):
+        """Create a new API key to push drifts to the experiment.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            json (dict): The JSON payload containing the API key name.
+            experiment_id (str): ID of the experiment the key grants access to.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The newly created API key, including the key in clear text.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment with the specified ID is not found.
+            422: If the JSON query is not in the correct format.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Manage")
+
+        # Generate the key, only its hash is stored in the database.
+        key, json["hash"] = apikeys.generate_key()
+        json["experiment_id"] = experiment_id
+        json["user_id"] = context.user["_id"]
+        json["created_at"] = utcnow()
+        json["_id"] = str(uuid.uuid4())
+        current_app.config["db"]["app.api_keys"].insert_one(json)
+
+        # Return the API key, this is the only time the key is shown.
+        return {**json, "key": key}
+
+
+@blp.route("/<uuid:experiment_id>/api-key/<uuid:api_key_id>")
+class ApiKey(MethodView):
+    """API Key API."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.response(204)
+    def delete(self, experiment_id, api_key_id, user_infos):
+        """
+        Revoke an API key of an experiment.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            experiment_id (str): ID of the experiment the key belongs to.
+            api_key_id (str): ID of the API key to revoke.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            None
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the user does not have the required permissions.
+            404: If the experiment or API key specified are not found.
+        """
+        # Check if the user is registered and validate access level.
+        context = utils.get_context(user_infos)
+        experiment_id = str(experiment_id)
+        experiment = utils.get_experiment(experiment_id)
+        utils.check_access(experiment, context, level="Manage")
+
+        # Delete the API key and remove it from the cache.
+        api_keys = current_app.config["db"]["app.api_keys"]
+        api_key_id = str(api_key_id)
+        query = {"_id": api_key_id, "experiment_id": experiment_id}
+        api_key = api_keys.find_one_and_delete(query)
+        if api_key is None:
+            abort(404, "API key not found.")
+        apikeys.invalidate_key(api_key)
@@ -0,0 +1,51 @@
+"""
+## API Methods to follow background jobs.
+"""
+
+from flask import abort, current_app
+from flask.views import MethodView
+
+from app import schemas, utils
+from app.config import Blueprint
+from app.tools.authentication import Authentication
+from app.tools.database import NOT_FOUND
+
+blp = Blueprint("Jobs", __name__, description=__doc__)
+auth = Authentication(blueprint=blp)
+
+
+@blp.route("/<uuid:job_id>")
+class Job(MethodView):
+    """Job API."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.response(200, schemas.Job)
+    def get(self, job_id, user_infos):
+        """Retrieve the status of a background job.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            job_id (str): The ID of the job to retrieve.
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The job object.
+
+        Raises:
+            401: If the user is not authenticated or registered.
+            403: If the job was requested by another user.
+            404: If the job with the specified ID is not found.
+        """
+        # Check if the user is registered and retrieve the context.
+        context = utils.get_context(user_infos)
+
+        # Retrieve the job, only visible to its user and admins.
+        job = current_app.config["db"]["app.jobs"].find_one({"_id": str(job_id)})
+        if job is None:
+            abort(404, "Job not found.")
+        if job["user_id"] != context.user["_id"] and not context.is_admin:
+            abort(403, "Insufficient permissions.")
+        return job
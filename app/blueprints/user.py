@@ -4,16 +4,18 @@
 
 import uuid
 from datetime import datetime as dt
+from datetime import timezone
 
 import marshmallow as ma
 from flask import abort, current_app
 from flask.views import MethodView
+from pymongo.errors import DuplicateKeyError
 
 from app import schemas, utils
 from app.config import Blueprint
-from app.tools import authentication
+from app.tools import authentication, pagination, sessions
 from app.tools.authentication import Authentication
-from app.tools.database import CONFLICT
+from app.tools.database import CONFLICT, NOT_FOUND, utcnow
 
 blp = Blueprint("Users", __name__, description=__doc__)
 auth = Authentication(blueprint=blp)
@@ -44,22 +46,10 @@ class UsersSearch(MethodView):
             403: If the user does not have the required permissions.
             422: If the JSON query is not in the correct format.
         """
-        # Extract sort_by and order_by from query_args
-        sort_by, order_by = query_args["sort_by"], query_args["order_by"]
-        sort_order = 1 if order_by == "asc" else -1
-
-        # Search for users based on the provided JSON query.
+        # Return the page of users matching the JSON query.
+        json = utils.parse_dates(json)
         users = current_app.config["db"]["app.users"]
-        search = users.find(json).sort(sort_by, sort_order)
-
-        # Return the paginated list of users.
-        page = pagination_parameters.page
-        page_size = pagination_parameters.page_size
-        item_count = users.count_documents(json)
-
-        # Return the paginated list of users.
-        pagination_parameters.item_count = item_count
-        return search.skip((page - 1) * page_size).limit(page_size)
+        return pagination.paginate(users, json, query_args, pagination_parameters)
 
 
 @blp.route("")
@@ -92,7 +82,7 @@ class Users(MethodView):
         if users.find_one({"subject": sub, "issuer": iss}):
             abort(409, "User already exists.")
 
-        if not authentication.is_user(user_infos):
+        if not authentication.get_context(user_infos).is_user:
             abort(403, "Insufficient permissions.")
 
         # Create the new user from the token information.
@@ -101,11 +91,15 @@ class Users(MethodView):
             "subject": user_infos["sub"],
             "issuer": user_infos["iss"],
             "_id": str(uuid.uuid4()),
-            "created_at": dt.now().isoformat(),
+            "created_at": utcnow(),
         }
 
         # Store the user and return it as response body.
-        users.insert_one(user)
+        try:  # Subject and issuer are unique, also for concurrent requests
+            users.insert_one(user)
+        except DuplicateKeyError:
+            abort(409, "User already exists.")
+        utils.invalidate_user(sub, iss)
         return user
 
 
@@ -154,4 +148,49 @@ class Self(MethodView):
         users = current_app.config["db"]["app.users"]
         user["email"] = user_infos["email"]
         users.update_one({"_id": user["_id"]}, {"$set": user})
+        utils.invalidate_user(user["subject"], user["issuer"])
         return user
+
+
+@blp.route("/session")
+class Session(MethodView):
+    """Session tokens API."""
+
+    @auth.access_level("user")
+    @auth.inject_user_infos()
+    @blp.doc(responses={"404": NOT_FOUND})
+    @blp.response(201, schemas.Session)
+    def post(self, user_infos):
+        """Exchange the access token for a short-lived session token.
+        ---
+        Internal comment not meant to be exposed.
+
+        Args:
+            user_infos (dict): User information from the authentication token.
+
+        Returns:
+            dict: The session token, the user id and the expiration time.
+
+        Raises:
+            401: If the user is not authenticated with a valid token.
+            403: If the user is not registered or already uses a session.
+            404: If session tokens are not enabled.
+        """
+        # Session tokens require a signing secret.
+        if not current_app.config["SESSION_SECRET"]:
+            abort(404, "Session tokens not enabled.")
+
+        # Sessions cannot be extended by exchanging them again.
+        if user_infos.get("session"):
+            abort(403, "Session tokens cannot be exchanged.")
+
+        # Check if the user is registered and has user entitlements.
+        context = utils.get_context(user_infos)
+        if not context.is_user:
+            abort(403, "Insufficient permissions.")
+
+        # Sign the session token with the user identity and entitlements.
+        user = context.user
+        token, expires_at = sessions.issue_token(user_infos, user, context.entitlements)
+        expires_at = dt.fromtimestamp(expires_at, tz=timezone.utc).isoformat()
+        return {"token": token, "user_id": user["_id"], "expires_at": expires_at}
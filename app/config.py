@@ -21,7 +21,9 @@ variables and provides secure secret management through file-based secrets.
 """
 
 # https://docs.pydantic.dev/latest/concepts/pydantic_settings/
+import json
 import os
+from typing import Literal
 
 import flask_smorest
 from marshmallow import INCLUDE, RAISE
@@ -47,12 +49,43 @@ class Settings(BaseSettings):
     Database Settings:
         - DATABASE_*: MongoDB connection parameters
         - Supports authentication and custom ports/hosts
+        - USERS_CACHE_*: Size and TTLs of the registered users cache
+        - EXPERIMENTS_CACHE_*: Size and TTL of the experiments cache
+        - ACL_CACHE_*: Size and TTL of the experiments ACL cache
+        - DATABASE_BINARY_UUIDS: Store new drift ids as BSON UUIDs
+        - DATABASE_SHARED_DRIFTS: Store the drifts of new experiments in
+          a single shared collection
+
+    Jobs Settings:
+        - JOBS_MAX_WORKERS: Background job threads per worker process
+
+    Ingestion Settings:
+        - DRIFTS_BATCH_MAXSIZE: Maximum number of drifts per batch request
+        - DRIFTS_STREAM_*: Insert chunk size and maximum line length of
+          NDJSON uploads
+        - DRIFTS_WRITE_BEHIND: Group concurrent drift inserts per worker
+        - DRIFTS_WRITE_BEHIND_*: Maximum batch size and linger in seconds
+        - DRIFTS_PARAMETERS_MAXSIZE: Size in bytes above which drift
+          parameters are stored apart from the drift record
+
+    Cache Settings:
+        - CACHE_BACKEND: Identity caches backend, "memory" or "sqlite"
+        - CACHE_SQLITE_PATH: Database file shared by workers of a node,
+          defaults to cache.sqlite3 in the Flask instance folder
         
     Authentication Settings:
         - ENTITLEMENTS_PATH: JWT claim path for user roles
         - USERS_ENTITLEMENTS: Required roles for user access
         - ADMIN_ENTITLEMENTS: Required roles for admin access
         - TRUSTED_OP_LIST: List of trusted OpenID providers
+        - AUTH_CACHE_*: Size and TTL of the validated tokens cache
+        - AUTH_LOCAL_JWT: Verify JWT tokens locally with the issuer JWKS
+        - AUTH_JWT_AUDIENCE: Accepted audiences for local JWT verification,
+          required when AUTH_LOCAL_JWT is enabled
+        - AUTH_JWKS_*: JWKS location overrides and refresh period
+        - API_KEYS_CACHE_*: Size and TTL of the API keys cache
+        - SESSION_SECRET: Secret to sign session tokens, None disables them
+        - SESSION_TTL: Maximum lifetime of session tokens in seconds
         
     Environment Variables:
         All settings can be set via environment variables:
@@ -63,6 +96,7 @@ class Settings(BaseSettings):
         Sensitive values are loaded from files in the secrets directory:
         - secrets/app_database_password
         - secrets/app_admin_entitlements (JSON array)
+        - secrets/app_session_secret
     """
     model_config = SettingsConfigDict(
         secrets_dir=os.environ["APP_SECRETS_DIR"],
@@ -82,12 +116,44 @@ class Settings(BaseSettings):
     USERS_ENTITLEMENTS: list[str]
     ADMIN_ENTITLEMENTS: list[str]
     TRUSTED_OP_LIST: list[str]
+    AUTH_CACHE_MAXSIZE: int = 1024
+    AUTH_CACHE_TTL: int = 300
+    AUTH_LOCAL_JWT: bool = False
+    AUTH_JWT_AUDIENCE: list[str] = []
+    AUTH_JWKS_URIS: dict[str, str] = {}
+    AUTH_JWKS_LIFESPAN: int = 3600
+    API_KEYS_CACHE_MAXSIZE: int = 1024
+    API_KEYS_CACHE_TTL: int = 30
+    SESSION_SECRET: str | None = None
+    SESSION_TTL: int = 900
 
     DATABASE_NAME: str = "drifts-data"
     DATABASE_PORT: int = 27017
     DATABASE_HOST: str
     DATABASE_USERNAME: str
     DATABASE_PASSWORD: str
+    DATABASE_BINARY_UUIDS: bool = False
+    DATABASE_SHARED_DRIFTS: bool = False
+    USERS_CACHE_MAXSIZE: int = 4096
+    USERS_CACHE_TTL: int = 300
+    USERS_CACHE_NEGATIVE_TTL: int = 10
+    EXPERIMENTS_CACHE_MAXSIZE: int = 1024
+    EXPERIMENTS_CACHE_TTL: int = 30
+    ACL_CACHE_MAXSIZE: int = 4096
+    ACL_CACHE_TTL: int = 30
+
+    JOBS_MAX_WORKERS: int = 2
+
+    DRIFTS_BATCH_MAXSIZE: int = 1000
+    DRIFTS_STREAM_CHUNKSIZE: int = 500
+    DRIFTS_STREAM_MAX_LINE: int = 1048576
+    DRIFTS_WRITE_BEHIND: bool = False
+    DRIFTS_WRITE_BEHIND_MAXSIZE: int = 100
+    DRIFTS_WRITE_BEHIND_LINGER: float = 0.005
+    DRIFTS_PARAMETERS_MAXSIZE: int = 16384
+
+    CACHE_BACKEND: Literal["memory", "sqlite"] = "memory"
+    CACHE_SQLITE_PATH: str | None = None
 
 
 class MyFlaskParser(FlaskParser):
@@ -126,6 +192,7 @@ class Blueprint(flask_smorest.Blueprint):
     
     Features:
         - Uses MyFlaskParser for consistent request validation
+        - Adds the keyset cursor of the next page to the pagination header
         - Inherits all Flask-SMOREST features (OpenAPI docs, validation, etc.)
         - Provides foundation for all API blueprint definitions
         
@@ -136,3 +203,21 @@ class Blueprint(flask_smorest.Blueprint):
         blp = Blueprint("MyAPI", __name__, description="My API endpoints")
     """
     ARGUMENTS_PARSER = MyFlaskParser()
+
+    def _set_pagination_metadata(self, page_params, result, headers):
+        """
+        Add the pagination metadata, with the cursor of the next page.
+
+        Pages requested with a cursor report only the next cursor, as they
+        are not counted, see `app.tools.pagination`.
+        """
+        if getattr(page_params, "cursor", None) is None:
+            metadata = self._make_pagination_metadata(
+                page_params.page, page_params.page_size, page_params.item_count
+            )
+        else:
+            metadata = {}
+        metadata["next_cursor"] = getattr(page_params, "next_cursor", None)
+        headers = {} if headers is None else headers
+        headers[self.PAGINATION_HEADER_NAME] = json.dumps(metadata)
+        return result, headers
@@ -10,23 +10,37 @@ Schema Categories:
 Base Schemas:
 - _BaseReqSchema: Common fields for request schemas
 - _BaseRespSchema: Common fields for response schemas (ID, timestamps)
+- _BaseSearch: Keyset cursor of search requests
 
 User Management:
 - User: User profile information
 - UsersEmails/UsersIds: Bulk user operations
 - SearchUsers: User search and sorting parameters
+- Session: Session token issued in exchange of an access token
 
 Experiment Management:  
 - Experiment: Complete experiment metadata
 - CreateExperiment: Experiment creation request
+- PatchExperiment: Partial experiment update request
 - Permission: Access control permissions
 - SortExperiments: Experiment search and sorting
 
 Drift Detection:
 - Drift: Complete drift record with metadata
 - CreateDrift: Drift creation request  
+- IdempotencyHeaders: Idempotency key of a drift creation
+- PatchDrift: Partial drift update request
+- DriftStatus: Status transition of a running drift job
+- DriftsBatch: Results of a batch of drift creations
 - SortDrifts: Drift search and sorting parameters
 
+API Keys:
+- ApiKey: API key metadata, with the key only on creation
+- CreateApiKey: API key creation request
+
+Background Jobs:
+- Job: Status of a background job
+
 Entitlements:
 - Entitlements: User role and permission information
 
@@ -38,17 +52,64 @@ The schemas use Marshmallow for validation and serialization, providing:
 - Request/response data transformation
 """
 
+from datetime import datetime as dt
+from datetime import timezone
+
 import marshmallow as ma
 from marshmallow import validate
 
+from app.tools import pagination
+
+
+class _DateTime(ma.fields.DateTime):
+    """
+    BSON date returned in ISO 8601 format with its UTC timezone.
+    Dates not migrated yet are ISO strings and are returned as they are.
+    """
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dt) and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return super()._serialize(value, attr, obj, **kwargs)
+
+
+class _UUID(ma.fields.UUID):
+    """UUID returned as a string, also when stored as a BSON binary UUID."""
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        return None if value is None else str(self._validated(value))
+
 
 class _BaseReqSchema(ma.Schema):
     pass
 
 
 class _BaseRespSchema(ma.Schema):
-    _id = ma.fields.UUID(required=True, data_key="id", dump_only=True)
-    created_at = ma.fields.String(required=True, dump_only=True)
+    _id = _UUID(required=True, data_key="id", dump_only=True)
+    created_at = _DateTime(required=True, dump_only=True)
+
+
+class _Cursor(ma.fields.String):
+    """Opaque keyset cursor, returned as `next_cursor` by the searches."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            return pagination.decode_cursor(super()._deserialize(value, attr, data, **kwargs))
+        except ValueError as err:
+            raise ma.ValidationError(str(err)) from err
+
+
+class _BaseSearch(ma.Schema):
+    cursor = _Cursor()
+
+    @ma.validates_schema
+    def validate_cursor(self, data, **kwargs):
+        """Cursors continue only searches sorted the same way."""
+        cursor = data.get("cursor")
+        if cursor and (cursor["sort_by"], cursor["order_by"]) != (data["sort_by"], data["order_by"]):
+            raise ma.ValidationError("Cursor of a search with other sorting.", "cursor")
 
 
 class Entitlements(ma.Schema):
@@ -90,14 +151,50 @@ class Experiment(_BaseExperiment, _BaseRespSchema):
     Authentication is carried by the groups that point here.
     A name is required for easy identification.
     Includes the list of permissions for the groups.
+    The revision increases on every update of the experiment.
+    The storage of the drifts is timeseries or standard, the default.
     """
 
+    revision = ma.fields.Integer(dump_only=True)
+    storage = ma.fields.String(dump_only=True)
+
+
+storage_options = validate.OneOf(["standard", "timeseries"])
+
 
 class CreateExperiment(_BaseExperiment, _BaseReqSchema):
-    """Create Experiment Schema."""
+    """
+    Create Experiment Schema.
+    Use the `timeseries` storage for experiments with many drift runs,
+    their drifts are stored in a MongoDB time-series collection. The
+    storage cannot be changed once the experiment is created.
+    """
 
+    storage = ma.fields.String(load_default="standard", validate=storage_options)
 
-class SortExperiments(ma.Schema):
+
+class PatchExperiment(_BaseReqSchema):
+    """
+    Partial update of an experiment, only the fields sent are modified.
+    Use `permissions` to replace the permissions or `add_permissions` to
+    append new ones to the existing list.
+    """
+
+    name = ma.fields.String()
+    description = ma.fields.String()
+    public = ma.fields.Boolean()
+    permissions = ma.fields.List(ma.fields.Nested(Permission))
+    add_permissions = ma.fields.List(ma.fields.Nested(Permission))
+
+    @ma.validates_schema
+    def validate_permissions(self, data, **kwargs):
+        """Permissions can be either replaced or appended, not both."""
+        if "permissions" in data and "add_permissions" in data:
+            message = "Cannot be used together with permissions."
+            raise ma.ValidationError(message, "add_permissions")
+
+
+class SortExperiments(_BaseSearch):
     """Schema for sorting experiments."""
 
     sort_by = ma.fields.String(
@@ -108,6 +205,7 @@ class SortExperiments(ma.Schema):
         load_default="desc",
         validate=validate.OneOf(["asc", "desc"]),
     )
+    accessible = ma.fields.Boolean(load_default=False)
 
 
 class User(_BaseRespSchema):
@@ -141,7 +239,7 @@ class UsersIds(ma.Schema):
     )
 
 
-class SearchUsers(ma.Schema):
+class SearchUsers(_BaseSearch):
     """Schema for searching users."""
 
     sort_by = ma.fields.String(
@@ -154,6 +252,17 @@ class SearchUsers(ma.Schema):
     )
 
 
+class Session(ma.Schema):
+    """
+    Session token for dashboards sending many requests.
+    It is verified by the backend without contacting the OP.
+    """
+
+    token = ma.fields.String(required=True, dump_only=True)
+    user_id = ma.fields.UUID(required=True, dump_only=True)
+    expires_at = ma.fields.String(required=True, dump_only=True)
+
+
 class BaseDrift(ma.Schema):
     """Base drift schema"""
 
@@ -177,16 +286,101 @@ class Drift(_BaseDriftJob, _BaseRespSchema):
     """
     Response Job Schema. A drift is the basic unit of the API.
     It contains the drift information for a specific model and job.
+    The revision increases on every update of the drift.
     """
 
     schema_version = ma.fields.String(required=True, dump_only=True)
+    revision = ma.fields.Integer(dump_only=True)
+    idempotency_key = ma.fields.String(dump_only=True)
 
 
 class CreateDrift(_BaseDriftJob, _BaseReqSchema):
-    """Create Job Schema for job."""
+    """
+    Create Job Schema for job.
+    The id is optional, clients can set it to retry creations safely.
+    """
+
+    _id = ma.fields.UUID(data_key="id")
+
+
+class IdempotencyHeaders(ma.Schema):
+    """Headers to retry a creation safely, returning the original record."""
+
+    class Meta:  # pylint: disable=R0903, C0115
+        unknown = ma.EXCLUDE
+
+    idempotency_key = ma.fields.String(
+        data_key="Idempotency-Key",
+        validate=validate.Length(min=1, max=255),
+    )
 
 
-class SortDrifts(ma.Schema):
+class PatchDrift(_BaseReqSchema):
+    """
+    Partial update of a drift job, only the fields sent are modified.
+    Use `tags` to replace the tags or `add_tags` to append new ones.
+    """
+
+    job_status = ma.fields.String(validate=status_options)
+    tags = ma.fields.List(tag)
+    add_tags = ma.fields.List(tag)
+    model = ma.fields.String()
+    drift_detected = ma.fields.Bool()
+    parameters = ma.fields.Dict()
+
+    @ma.validates_schema
+    def validate_tags(self, data, **kwargs):
+        """Tags can be either replaced or appended, not both."""
+        if "tags" in data and "add_tags" in data:
+            raise ma.ValidationError("Cannot be used together with tags.", "add_tags")
+
+
+class DriftStatus(_BaseReqSchema):
+    """
+    Status transition of a running drift job, with its detection result.
+    Only drifts in status Running can be completed or failed.
+    """
+
+    job_status = ma.fields.String(
+        required=True,
+        validate=validate.OneOf(["Completed", "Failed"]),
+    )
+    drift_detected = ma.fields.Bool()
+    parameters = ma.fields.Dict()
+
+
+class DriftParameters(ma.Schema):
+    """
+    Parameters of a drift job, fetched apart from the drift record.
+    Use it together with searches that exclude the parameters.
+    """
+
+    parameters = ma.fields.Dict(required=True, dump_only=True)
+
+
+class DriftResult(ma.Schema):
+    """Result of the creation of one drift in a batch."""
+
+    index = ma.fields.Integer(required=True, dump_only=True)
+    status = ma.fields.Integer(required=True, dump_only=True)
+    _id = _UUID(data_key="id", dump_only=True)
+    errors = ma.fields.Dict(dump_only=True)
+    message = ma.fields.String(dump_only=True)
+
+
+class DriftsBatch(ma.Schema):
+    """
+    Results of a batch of drift creations, in the order of the request.
+    Items are created with status 201 or rejected with status 422 when
+    the payload is not valid.
+    """
+
+    created = ma.fields.Integer(required=True, dump_only=True)
+    failed = ma.fields.Integer(required=True, dump_only=True)
+    items = ma.fields.List(ma.fields.Nested(DriftResult), dump_only=True)
+
+
+class SortDrifts(_BaseSearch):
     """Schema for sorting drift detection instances."""
 
     sort_by = ma.fields.String(
@@ -199,3 +393,40 @@ class SortDrifts(ma.Schema):
         load_default="desc",
         validate=validate.OneOf(["asc", "desc"]),
     )
+    exclude_parameters = ma.fields.Boolean(load_default=False)
+
+
+class _BaseApiKey(ma.Schema):
+    name = ma.fields.String(required=True, validate=validate.Length(min=1, max=100))
+
+
+class ApiKey(_BaseApiKey, _BaseRespSchema):
+    """
+    API key for machine clients pushing drifts to one experiment.
+    The key itself is returned only once, when the API key is created.
+    """
+
+    experiment_id = ma.fields.UUID(required=True, dump_only=True)
+    user_id = ma.fields.UUID(required=True, dump_only=True)
+    key = ma.fields.String(dump_only=True)
+
+
+class CreateApiKey(_BaseApiKey, _BaseReqSchema):
+    """Create API Key Schema."""
+
+
+job_status_options = validate.OneOf(["Pending", "Running", "Completed", "Failed"])
+
+
+class Job(_BaseRespSchema):
+    """
+    Background job started by a request, such as an experiment deletion.
+    The status is updated by the job until it is Completed or Failed.
+    """
+
+    task = ma.fields.String(required=True, dump_only=True)
+    arguments = ma.fields.Dict(dump_only=True)
+    user_id = ma.fields.UUID(required=True, dump_only=True)
+    status = ma.fields.String(required=True, dump_only=True, validate=job_status_options)
+    finished_at = _DateTime(dump_only=True)
+    error = ma.fields.String(dump_only=True)
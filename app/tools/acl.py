@@ -0,0 +1,212 @@
+"""
+Access control list (ACL) module for the Drift Watch Backend.
+
+This module maintains a materialized index of the experiment permissions so
+access checks do not scan the embedded `permissions` list of an experiment,
+which can hold hundreds of entries for large shared experiments.
+
+Every permission becomes a row (entity, experiment_id, level) in the app.acl
+collection, keeping only the highest level of each entity. The rows are
+written whenever an experiment is created or updated, with the experiment
+`revision`, and are loaded per experiment revision into an {entity: level}
+map kept in the ACL cache, so a worker loading a new revision of an
+experiment never uses the map of a previous one. The embedded permissions
+remain the source of truth; `rebuild` regenerates the rows from them, for
+example after a restore. Access checks fall back to the embedded
+permissions when the rows do not match the experiment revision: databases
+upgraded from a version without ACL, which are indexed when the application
+starts, or rows not written because the update failed halfway.
+
+Collections Used:
+- app.acl: One row per entity with access to an experiment
+
+Commands:
+- flask acl rebuild: Regenerate the ACL rows of all experiments
+"""
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from pymongo import DeleteMany, ReplaceOne
+
+from app.tools.cache import create_cache
+from app.tools.database import ACTIVE_EXPERIMENTS
+
+# Permission levels ordered from least to most permissive
+LEVELS = {"Read": 1, "Edit": 2, "Manage": 3}
+
+
+def init_app(app):
+    """
+    Initialize the ACL cache and commands for the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to configure.
+
+    Side Effects:
+        - Sets app.config['acl_cache'] to the experiments ACL cache
+        - Registers the `flask acl rebuild` command
+        - Builds the ACL of databases without one, see `build_missing`
+    """
+    app.config["acl_cache"] = create_cache(
+        app.config,
+        name="acl",
+        maxsize=app.config["ACL_CACHE_MAXSIZE"],
+        ttl=app.config["ACL_CACHE_TTL"],
+    )
+    app.cli.add_command(acl_cli)
+    if app.config["TESTING"]:
+        return  # Testing fixtures will set up the database
+    with app.app_context():
+        if count := build_missing(app.config["db"]):
+            app.logger.info("ACL built for %d experiments.", count)
+
+
+def permissions_map(permissions):
+    """
+    Return the highest level of each entity in a list of permissions.
+
+    Args:
+        permissions (list): Permission objects with `entity` and `level`.
+
+    Returns:
+        dict: Map of entity to its highest permission level.
+    """
+    result = {}
+    for permission in permissions:
+        entity, level = permission["entity"], permission["level"]
+        if LEVELS[level] > LEVELS.get(result.get(entity), 0):
+            result[entity] = level
+    return result
+
+
+def get_map(experiment):
+    """
+    Return the ACL map of an experiment, from the ACL cache when possible.
+
+    The map is cached per experiment revision. It is loaded from the ACL
+    rows if they were all written for that revision, otherwise computed
+    from the embedded permissions of the experiment.
+
+    Args:
+        experiment (dict): Experiment record with `_id`, `revision` and
+            `permissions`.
+
+    Returns:
+        dict: Map of entity to permission level on the experiment.
+    """
+    cache = current_app.config["acl_cache"]
+    key = (experiment["_id"], experiment.get("revision"))
+    result = cache.get(key)
+    if result is None:
+        rows = list(current_app.config["db"]["app.acl"].find({"experiment_id": experiment["_id"]}))
+        if rows and all(row.get("revision") == key[1] for row in rows):
+            result = {row["entity"]: row["level"] for row in rows}
+        else:  # Not indexed yet, or the rows of another revision
+            result = permissions_map(experiment.get("permissions", []))
+        cache.set(key, result)
+    return result
+
+
+def accessible_ids(titles):
+    """
+    Return the ids of the experiments where any of the titles has access.
+
+    Args:
+        titles (Iterable[str]): User id and entitlements of the user.
+
+    Returns:
+        list: Ids of the experiments with a permission for the titles.
+    """
+    collection = current_app.config["db"]["app.acl"]
+    return collection.distinct("experiment_id", {"entity": {"$in": sorted(titles)}})
+
+
+def sync(experiment, database=None):
+    """
+    Write the ACL rows of an experiment from its embedded permissions.
+
+    New rows are upserted before removing the rows of revoked entities, so
+    an entity keeping its access never misses its row during the update.
+    Rows are keyed by experiment and entity, so the operation is idempotent
+    and can be repeated safely if interrupted. Rows carry the experiment
+    revision, so rows left by an interrupted update are not used.
+
+    Args:
+        experiment (dict): Experiment record with `_id`, `revision` and
+            `permissions`.
+        database (Database, optional): Database to write to, defaults to
+            the application database.
+    """
+    database = database if database is not None else current_app.config["db"]
+    experiment_id, revision = experiment["_id"], experiment.get("revision")
+    rows = permissions_map(experiment.get("permissions", []))
+    keys = [f"{experiment_id}/{entity}" for entity in rows]
+    requests = [
+        ReplaceOne(
+            {"_id": key},
+            {"_id": key, "entity": entity, "experiment_id": experiment_id, "level": level, "revision": revision},
+            upsert=True,
+        )
+        for key, (entity, level) in zip(keys, rows.items())
+    ]
+    requests.append(DeleteMany({"experiment_id": experiment_id, "_id": {"$nin": keys}}))
+    database["app.acl"].bulk_write(requests, ordered=True)
+
+
+def remove(experiment_id):
+    """
+    Remove the ACL rows of a deleted experiment.
+
+    Args:
+        experiment_id (str): The unique UUID identifier of the experiment.
+    """
+    current_app.config["db"]["app.acl"].delete_many({"experiment_id": experiment_id})
+
+
+def rebuild(database):
+    """
+    Regenerate the ACL rows of every experiment in a database.
+
+    Args:
+        database (Database): Database with the experiments to index.
+
+    Returns:
+        int: Number of experiments indexed.
+    """
+    count = 0
+    for experiment in database["app.experiments"].find(ACTIVE_EXPERIMENTS, {"permissions": 1, "revision": 1}):
+        sync(experiment, database=database)
+        count += 1
+    experiment_ids = database["app.experiments"].distinct("_id", ACTIVE_EXPERIMENTS)
+    database["app.acl"].delete_many({"experiment_id": {"$nin": experiment_ids}})
+    current_app.config["acl_cache"].clear()
+    return count
+
+
+def build_missing(database):
+    """
+    Build the ACL of a database upgraded from a version without it.
+
+    Nothing is done if the ACL has any row, so workers starting together
+    rebuild it at most once each, and `rebuild` is idempotent.
+
+    Args:
+        database (Database): Database with the experiments to index.
+
+    Returns:
+        int: Number of experiments indexed, 0 if the ACL existed.
+    """
+    if database["app.acl"].find_one({}, {"_id": 1}) is not None:
+        return 0
+    return rebuild(database)
+
+
+acl_cli = AppGroup("acl", help="Manage the materialized experiments ACL.")
+
+
+@acl_cli.command("rebuild")
+def rebuild_command():
+    """Regenerate the ACL rows of all experiments."""
+    count = rebuild(current_app.config["db"])
+    click.echo(f"Indexed the permissions of {count} experiments.")
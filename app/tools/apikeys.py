@@ -0,0 +1,126 @@
+"""
+API keys module for the Drift Watch Backend.
+
+This module implements API keys for machine ingestion clients such as CI
+pipelines and batch drift detectors. An API key grants Edit access to the
+drifts of a single experiment, so those clients can push results without an
+OIDC token and without any round trip to the OP.
+
+Keys are random strings with a recognizable prefix and are returned to the
+client only once, on creation. The database stores only their SHA-256 hash.
+Lookups are served from the API keys cache, keyed by that hash, so a
+revoked key may be accepted by other workers for up to API_KEYS_CACHE_TTL
+seconds, see `invalidate_key`.
+
+Collections Used:
+- app.api_keys: API key metadata and hashes
+"""
+
+import hashlib
+import secrets
+
+from flaat.user_infos import UserInfos  # type: ignore
+from flask import current_app
+
+# Prefix used to recognize API keys in the Authorization header
+API_KEY_PREFIX = "dwk_"
+
+# Issuer set in the user infos of requests authenticated with an API key
+API_KEY_ISSUER = "urn:drift-watch:api-key"
+
+
+def is_api_key(access_token):
+    """
+    Return True if a bearer token has the API key format.
+
+    Args:
+        access_token (str): Bearer token from the Authorization header.
+
+    Returns:
+        bool: True if the token starts with the API key prefix.
+    """
+    return access_token.startswith(API_KEY_PREFIX)
+
+
+def generate_key():
+    """
+    Generate a new random API key.
+
+    Returns:
+        tuple: The API key in clear text and its hash to store.
+    """
+    key = API_KEY_PREFIX + secrets.token_urlsafe(32)
+    return key, hash_key(key)
+
+
+def hash_key(key):
+    """
+    Return the hash stored in the database for an API key.
+
+    Keys have 256 bits of entropy, so a fast hash is enough to protect them.
+
+    Args:
+        key (str): API key in clear text.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of the key.
+    """
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def find_key(key):
+    """
+    Return the stored API key record matching a clear text key.
+
+    Args:
+        key (str): API key in clear text.
+
+    Returns:
+        dict: API key record, or None if the key does not exist.
+    """
+    key_hash = hash_key(key)
+    cache = current_app.config["api_keys_cache"]
+    api_key = cache.get(key_hash)
+    if api_key is None:
+        collection = current_app.config["db"]["app.api_keys"]
+        api_key = collection.find_one({"hash": key_hash})
+        if api_key is None:
+            return None
+        cache.set(key_hash, api_key)
+    return api_key
+
+
+def invalidate_key(api_key):
+    """
+    Remove an API key from the API keys cache after it is deleted.
+
+    Only the cache of this worker is cleared, or of every worker of the node
+    with the `sqlite` cache backend. Other workers may accept the key until
+    their cache entry expires, so API_KEYS_CACHE_TTL is kept short.
+
+    Args:
+        api_key (dict): Stored API key record.
+    """
+    current_app.config["api_keys_cache"].delete(api_key["hash"])
+
+
+def get_user_infos(key):
+    """
+    Return user infos representing a request authenticated with an API key.
+
+    Args:
+        key (str): API key in clear text.
+
+    Returns:
+        UserInfos: User information with the API key issuer and the key
+        record under the `api_key` claim, or None if the key is unknown.
+    """
+    api_key = find_key(key)
+    if api_key is None:
+        return None
+    user_info = {
+        "sub": api_key["_id"],
+        "iss": API_KEY_ISSUER,
+        "api_key": {k: v for k, v in api_key.items() if k != "hash"},
+    }
+    return UserInfos(access_token_info=None, user_info=user_info, introspection_info=None)
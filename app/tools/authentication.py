@@ -11,6 +11,11 @@ The authentication system supports:
 - Multi-level access control (everyone, user, admin)
 - Integration with OpenID Connect providers
 - Flexible entitlement path configuration
+- In-process caching of validated tokens to reduce OP round trips
+- Optional local verification of JWT access tokens with a cached JWKS
+- Request-scoped authorization context computed once per request
+- API keys granting Edit access to the drifts of one experiment
+- Short-lived session tokens signed and verified by the backend
 
 Access Levels:
 - everyone: No authentication required
@@ -21,13 +26,22 @@ The module uses entitlements (roles/groups) from JWT tokens to determine user
 permissions and provides decorators for protecting API endpoints.
 """
 
+import hashlib
 from functools import reduce
 from typing import Callable
 
+import jwt
+from flaat.access_tokens import AccessTokenInfo, get_access_token_info  # type: ignore
 from flaat.config import AccessLevel  # type: ignore
+from flaat.exceptions import FlaatUnauthenticated  # type: ignore
 from flaat.flask import Flaat  # type: ignore
 from flaat.requirements import IsTrue  # type: ignore
-from flask import abort, current_app
+from flaat.user_infos import UserInfos  # type: ignore
+from flask import abort, current_app, g
+
+from app.tools import apikeys, sessions
+from app.tools.cache import create_cache
+from app.tools.jwks import JWKSVerifier
 
 
 def valid_user_infos(user_infos):
@@ -53,7 +67,10 @@ def valid_user_infos(user_infos):
     Validation Rules:
         - All fields must be present in the token
         - email_verified must be True for security
+        - Requests authenticated with an API key are always valid
     """
+    if user_infos.get("iss") == apikeys.API_KEY_ISSUER:
+        return True  # API keys are validated on lookup
     return all(
         [
             "sub" in user_infos.user_info,
@@ -86,14 +103,9 @@ def get_entitlements(user_infos):
     Example:
         # For token with structure: {"realm_access": {"roles": ["user", "admin"]}}
         entitlements = get_entitlements(user_infos)  
-        # Returns: {"user", "admin"}
+        # Returns: frozenset({"user", "admin"})
     """
-    entitlements_path = current_app.config["ENTITLEMENTS_PATH"]
-    # split entitlements key by '/' if it is a path
-    entitlements_path = entitlements_path.split("/")
-    # reduce the path to get the entitlements
-    entitlements = reduce(lambda d, k: d.get(k, []), entitlements_path, user_infos)
-    return set(entitlements)
+    return get_context(user_infos).entitlements
 
 
 def is_user(user_infos):
@@ -117,9 +129,7 @@ def is_user(user_infos):
     Access Control:
         Users must have at least one matching entitlement to access user-level endpoints.
     """
-    entitlements = get_entitlements(user_infos)
-    user_entitlements = set(current_app.config["USERS_ENTITLEMENTS"])
-    return bool(entitlements & user_entitlements)
+    return get_context(user_infos).is_user
 
 
 def is_admin(user_infos):
@@ -143,9 +153,211 @@ def is_admin(user_infos):
     Access Control:
         Admin users bypass normal permission checks and have full system access.
     """
-    entitlements = get_entitlements(user_infos)
-    admin_entitlements = set(current_app.config["ADMIN_ENTITLEMENTS"])
-    return bool(entitlements & admin_entitlements)
+    return get_context(user_infos).is_admin
+
+
+class AuthContext:
+    """
+    Authorization data of the current request, computed once per request.
+
+    Resolving the entitlements of a token requires walking the configured
+    ENTITLEMENTS_PATH and intersecting the result with the configured user and
+    admin entitlements. The context does it once when created and keeps the
+    results, together with the registered user record once it is loaded.
+
+    Attributes:
+        user_infos (UserInfos): User information from the access token.
+        entitlements (frozenset): Entitlements (roles/groups) of the user.
+        is_user (bool): True if the user has user-level entitlements.
+        is_admin (bool): True if the user has admin-level entitlements.
+        api_key (dict): API key record if the request is authenticated
+            with an API key, otherwise None.
+        user (dict): Registered user record, None until loaded and empty
+            if the user is not registered.
+    """
+
+    def __init__(self, user_infos):
+        """
+        Compute the authorization data from the token user information.
+
+        Args:
+            user_infos (UserInfos): User information from the access token.
+        """
+        config = current_app.config
+        if user_infos.get("iss") == apikeys.API_KEY_ISSUER:
+            self.api_key, entitlements = user_infos["api_key"], []  # No entitlements
+        else:
+            path_keys = config["ENTITLEMENTS_KEYS"]
+            entitlements = reduce(lambda d, k: d.get(k, []), path_keys, user_infos)
+            self.api_key = None
+        self.user_infos = user_infos
+        self.entitlements = frozenset(entitlements)
+        self.is_user = not self.entitlements.isdisjoint(config["USERS_ENTITLEMENTS_SET"])
+        self.is_admin = not self.entitlements.isdisjoint(config["ADMIN_ENTITLEMENTS_SET"])
+        self.user = None
+
+    @property
+    def titles(self):
+        """Entities that can hold permissions: entitlements and user id."""
+        if not self.user:
+            return self.entitlements
+        return self.entitlements | {self.user["_id"]}
+
+
+def get_context(user_infos):
+    """
+    Return the authorization context of the current request.
+
+    The context is stored on `flask.g` and reused by every later call in the
+    same request with the same user information.
+
+    Args:
+        user_infos (UserInfos): User information from the access token.
+
+    Returns:
+        AuthContext: Authorization context for the user information.
+    """
+    context = g.get("auth_context")
+    if context is None or context.user_infos is not user_infos:
+        context = g.auth_context = AuthContext(user_infos)
+    return context
+
+
+def _reset_context():
+    g.pop("auth_context", None)
+
+
+class CachedFlaat(Flaat):
+    """
+    FLAAT extension that caches user information per access token.
+
+    The OIDC provider is contacted only the first time a token is seen. The
+    resulting user information is stored in the application token cache under
+    the SHA-256 hash of the token, so raw tokens are never kept in the cache.
+    Entries live at most AUTH_CACHE_TTL seconds and never beyond the token
+    expiration when it is known. Failed authentications are not cached.
+
+    When AUTH_LOCAL_JWT is enabled, JWT access tokens from trusted issuers
+    are verified locally against the issuer JWKS and the user information
+    is built from the token claims, without calling the userinfo endpoint.
+    API keys are recognized by their prefix and resolved with the API keys
+    cache and database instead, never contacting the OP. Session tokens are
+    also recognized by their prefix and verified locally with SESSION_SECRET.
+    """
+
+    def get_user_infos_from_request(self, request_object):
+        """
+        Return the user information for the bearer token of a request.
+
+        Args:
+            request_object: Flask request containing the Authorization header.
+
+        Returns:
+            UserInfos: User information from the cache or the OP, or None
+            if the identity could not be determined.
+
+        Raises:
+            FlaatUnauthenticated: If the API key in the request is unknown or
+                the session token is not valid.
+        """
+        access_token = self._get_access_token_from_request(request_object)
+        if apikeys.is_api_key(access_token):
+            user_infos = apikeys.get_user_infos(access_token)
+            if user_infos is None:
+                raise FlaatUnauthenticated("Invalid API key.")
+            return user_infos
+        if sessions.is_session_token(access_token):
+            user_infos = sessions.get_user_infos(access_token)
+            if user_infos is None:
+                raise FlaatUnauthenticated("Invalid or expired session token.")
+            return user_infos
+        cache = current_app.config["auth_cache"]
+        key = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        cached = cache.get(key)
+        if cached is not None:
+            return _load_user_infos(cached)
+        user_infos = self.get_local_user_infos(access_token)
+        if user_infos is None:
+            user_infos = self.get_user_infos_from_access_token(access_token)
+        if user_infos is not None:
+            cache.set(key, _dump_user_infos(user_infos), ttl=user_infos.valid_for_secs)
+        return user_infos
+
+    def get_local_user_infos(self, access_token):
+        """
+        Verify a JWT access token locally and return its claims as user infos.
+
+        Args:
+            access_token (str): Encoded access token from the request.
+
+        Returns:
+            UserInfos: User information built from the verified claims, or
+            None if local verification is disabled, the token is not a JWT
+            or its issuer is not trusted.
+
+        Raises:
+            FlaatUnauthenticated: If the token signature, expiration, issuer
+                or audience is not valid.
+        """
+        if not current_app.config["AUTH_LOCAL_JWT"]:
+            return None
+        access_token_info = get_access_token_info(access_token, verify=False)
+        if access_token_info is None or not access_token_info.issuer:
+            return None  # Opaque tokens are validated by the OP
+        issuer = access_token_info.issuer
+        if not self._issuer_is_trusted(issuer):
+            return None  # Untrusted issuers are rejected by FLAAT
+        try:
+            decoded = current_app.config["jwks_verifier"].decode(
+                access_token,
+                issuer=issuer,
+                jwks_uri=self._get_jwks_uri(issuer),
+                audience=current_app.config["AUTH_JWT_AUDIENCE"],
+            )
+        except jwt.exceptions.PyJWTError as err:
+            raise FlaatUnauthenticated(f"Could not verify JWT: {err}") from err
+        verification = {"algorithm": decoded["header"].get("alg", "")}
+        return UserInfos(
+            access_token_info=AccessTokenInfo(decoded, verification=verification),
+            user_info=dict(decoded["payload"]),
+            introspection_info=None,
+        )
+
+    def _get_jwks_uri(self, issuer):
+        jwks_uri = current_app.config["AUTH_JWKS_URIS"].get(issuer)
+        if jwks_uri:
+            return jwks_uri
+        issuer_config = self._get_issuer_config(issuer)
+        if issuer_config is None or not issuer_config.issuer_config.get("jwks_uri"):
+            raise FlaatUnauthenticated("Could not verify JWT: Issuer config has no jwks_uri")
+        return issuer_config.issuer_config["jwks_uri"]
+
+
+def _dump_user_infos(user_infos):
+    access_token_info = user_infos.access_token_info
+    if access_token_info is not None:
+        access_token_info = {
+            "header": access_token_info.header,
+            "payload": access_token_info.body,
+            "verification": access_token_info.verification,
+        }
+    return {
+        "user_info": user_infos.user_info,
+        "access_token_info": access_token_info,
+        "introspection_info": user_infos.introspection_info,
+    }
+
+
+def _load_user_infos(data):
+    access_token_info = data["access_token_info"]
+    if access_token_info is not None:
+        verification = access_token_info["verification"]
+        access_token_info = AccessTokenInfo(access_token_info, verification)
+    return UserInfos(
+        access_token_info=access_token_info,
+        user_info=data["user_info"],
+        introspection_info=data["introspection_info"],
+    )
 
 
 # Define access levels for the application
@@ -155,7 +367,7 @@ access_levels = [
 ]
 
 # Initialize the Flaat module
-flaat = Flaat(access_levels)
+flaat = CachedFlaat(access_levels)
 
 
 def init_app(app):
@@ -171,11 +383,41 @@ def init_app(app):
         
     Side Effects:
         - Sets app.config['flaat'] to the FLAAT instance
+        - Sets app.config['auth_cache'] to the validated tokens cache
+        - Sets app.config['api_keys_cache'] to the API keys cache
+        - Sets app.config['jwks_verifier'] to the local JWT verifier
+        - Precomputes the entitlements path keys and entitlement sets
+        - Resets the authorization context at the start of each request
         - Initializes FLAAT with the app for request processing
         - Enables authentication decorators and token validation
+
+    Raises:
+        ValueError: If AUTH_LOCAL_JWT is enabled without AUTH_JWT_AUDIENCE.
     """
+    if app.config["AUTH_LOCAL_JWT"] and not app.config["AUTH_JWT_AUDIENCE"]:
+        raise ValueError("AUTH_JWT_AUDIENCE is required when AUTH_LOCAL_JWT is enabled.")
+    app.config["ENTITLEMENTS_KEYS"] = tuple(app.config["ENTITLEMENTS_PATH"].split("/"))
+    app.config["USERS_ENTITLEMENTS_SET"] = frozenset(app.config["USERS_ENTITLEMENTS"])
+    app.config["ADMIN_ENTITLEMENTS_SET"] = frozenset(app.config["ADMIN_ENTITLEMENTS"])
+    app.before_request(_reset_context)
+    app.config["auth_cache"] = create_cache(
+        app.config,
+        name="tokens",
+        maxsize=app.config["AUTH_CACHE_MAXSIZE"],
+        ttl=app.config["AUTH_CACHE_TTL"],
+    )
+    app.config["api_keys_cache"] = create_cache(
+        app.config,
+        name="api_keys",
+        maxsize=app.config["API_KEYS_CACHE_MAXSIZE"],
+        ttl=app.config["API_KEYS_CACHE_TTL"],
+    )
     app.config["flaat"] = flaat
     app.config["flaat"].init_app(app)
+    app.config["jwks_verifier"] = JWKSVerifier(
+        lifespan=app.config["AUTH_JWKS_LIFESPAN"],
+        timeout=app.config["FLAAT_REQUEST_TIMEOUT"],
+    )
 
 
 UNAUTHORIZED = {
@@ -0,0 +1,295 @@
+"""
+Caching module for the Drift Watch Backend.
+
+This module provides small caches with per-entry expiration used to keep hot,
+read-mostly identity data (such as validated access tokens and registered
+users) close to the request handlers and avoid repeated round trips to
+external services and the database.
+
+Two backends implement the same `Cache` interface:
+- memory: Thread-safe in-process LRU cache, private to each worker
+- sqlite: SQLite database in WAL mode shared by every worker on a node
+
+The backend is selected with the CACHE_BACKEND setting. Values stored in a
+cache must be documents that can be encoded as MongoDB Extended JSON, so they
+can be shared between processes.
+
+The caches support:
+- Bounded size with eviction of the oldest entries
+- Default and per-entry time-to-live (TTL) in seconds
+- Hit and miss counters for monitoring cache efficiency
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from bson import json_util
+from bson.binary import UuidRepresentation
+
+# Extended JSON options to keep dates and UUIDs when sharing values
+JSON_OPTIONS = json_util.JSONOptions(
+    json_mode=json_util.JSONMode.RELAXED,
+    uuid_representation=UuidRepresentation.STANDARD,
+)
+
+
+def create_cache(config, name, maxsize, ttl):
+    """
+    Create a cache using the backend selected in the application settings.
+
+    Args:
+        config (dict): Application configuration with CACHE_BACKEND and
+            CACHE_SQLITE_PATH settings.
+        name (str): Name of the cache, used as namespace in shared backends.
+        maxsize (int): Maximum number of entries, 0 disables the cache.
+        ttl (float): Default time-to-live of entries in seconds.
+
+    Returns:
+        Cache: Cache instance for the configured backend.
+    """
+    match config["CACHE_BACKEND"]:
+        case "memory":
+            return MemoryCache(maxsize=maxsize, ttl=ttl)
+        case "sqlite":
+            return SQLiteCache(config["CACHE_SQLITE_PATH"], name, maxsize=maxsize, ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {config['CACHE_BACKEND']}")
+
+
+class Cache:
+    """
+    Interface of the cache backends.
+
+    Attributes:
+        maxsize (int): Maximum number of entries, 0 disables the cache.
+        ttl (float): Default time-to-live of entries in seconds.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found or expired.
+    """
+
+    def __init__(self, maxsize, ttl):
+        """
+        Initialize the cache settings and counters.
+
+        Args:
+            maxsize (int): Maximum number of entries to keep.
+            ttl (float): Default time-to-live of entries in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_ttl(self, ttl):
+        """Return the TTL of a new entry, never above the cache TTL."""
+        return self.ttl if ttl is None else min(ttl, self.ttl)
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for a key if present and not expired.
+
+        Args:
+            key: Key of the entry to retrieve, a string or tuple of strings.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value or the provided default.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value in the cache, evicting old entries if required.
+
+        Args:
+            key: Key of the entry to store, a string or tuple of strings.
+            value: Value to store under the key.
+            ttl (float, optional): Entry time-to-live in seconds, defaults to
+                the cache TTL. Entries with a non positive TTL are not stored.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Remove an entry from the cache if present.
+
+        Args:
+            key: Key of the entry to remove.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """
+    Thread-safe LRU cache where every entry expires after a TTL.
+
+    Entries are stored together with their expiration time. Expired entries
+    are dropped lazily when accessed, and the least recently used entry is
+    evicted when the cache grows over its maximum size. Values are stored by
+    reference, callers must not modify the returned values.
+    """
+
+    def __init__(self, maxsize, ttl):
+        super().__init__(maxsize, ttl)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= time.monotonic():
+                self._data.pop(key, None)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value, ttl=None):
+        ttl = self._entry_ttl(ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SQLiteCache(Cache):
+    """
+    Cache stored in a SQLite database shared by the workers of a node.
+
+    Every cache is a table in the database file, and the database runs in
+    write-ahead logging (WAL) mode so readers in different processes do not
+    block each other. Values are encoded as MongoDB Extended JSON. Expired
+    entries are dropped lazily when accessed and, together with the oldest
+    written entries above `maxsize`, removed periodically on writes.
+
+    Every process opens a single connection lazily, shared by its threads
+    and greenlets under a lock, so the cache is safe to create before the
+    server forks its workers.
+
+    Cached tokens and users must not be readable or writable by other local
+    users, so the database file is created with mode 0600 in a directory
+    with mode 0700, and a file owned by another user, or a symbolic link, is
+    refused when the cache is created.
+    """
+
+    # Number of writes between two eviction passes
+    EVICTION_INTERVAL = 64
+
+    def __init__(self, path, name, maxsize, ttl):
+        """
+        Initialize the cache on a table of a SQLite database.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            name (str): Name of the cache table.
+            maxsize (int): Approximate maximum number of entries to keep.
+            ttl (float): Default time-to-live of entries in seconds.
+
+        Raises:
+            PermissionError: If the database file is owned by another user.
+            OSError: If the database file is a symbolic link or cannot be
+                created.
+        """
+        super().__init__(maxsize, ttl)
+        self.path = path
+        _private_file(path)
+        self.table = f"cache_{name}"
+        self._lock = threading.Lock()
+        self._pid = None
+        self._db = None
+        self._writes = 0
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires REAL NOT NULL, written REAL NOT NULL)"
+        )
+        return connection
+
+    def _execute(self, query, parameters=()):
+        with self._lock:
+            if self._pid != os.getpid():  # Never use the connection of the parent process
+                self._db = self._connect()
+                self._pid = os.getpid()
+            return self._db.execute(query, parameters).fetchall()
+
+    def get(self, key, default=None):
+        query = f"SELECT value, expires FROM {self.table} WHERE key = ?"
+        rows = self._execute(query, (json.dumps(key),))
+        if not rows or rows[0][1] <= time.time():
+            self.misses += 1
+            return default
+        self.hits += 1
+        return json_util.loads(rows[0][0], json_options=JSON_OPTIONS)
+
+    def set(self, key, value, ttl=None):
+        ttl = self._entry_ttl(ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        now = time.time()
+        self._execute(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+            (json.dumps(key), json_util.dumps(value, json_options=JSON_OPTIONS), now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % self.EVICTION_INTERVAL == 0:
+            self.evict()
+
+    def evict(self):
+        """Remove expired entries and the oldest entries above `maxsize`."""
+        self._execute(f"DELETE FROM {self.table} WHERE expires <= ?", (time.time(),))
+        self._execute(
+            f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} "
+            "ORDER BY written DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+    def delete(self, key):
+        query = f"DELETE FROM {self.table} WHERE key = ?"
+        self._execute(query, (json.dumps(key),))
+
+    def clear(self):
+        self._execute(f"DELETE FROM {self.table}")
+        self.hits = 0
+        self.misses = 0
+
+
+def _private_file(path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        status = os.fstat(descriptor)
+        if status.st_uid != os.getuid():
+            raise PermissionError(f"Cache database {path} is owned by another user.")
+        if status.st_mode & 0o077:  # Created by a previous version
+            os.fchmod(descriptor, 0o600)
+    finally:
+        os.close(descriptor)
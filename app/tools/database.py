@@ -9,7 +9,13 @@ The module supports:
 - MongoDB client initialization with authentication
 - Connection validation with timeout protection
 - Test environment database mocking support
-- Standardized OpenAPI error response schemas
+- Standardized OpenAPI error response schemas (404, 409, 412, 413, 415)
+- Cache of registered users
+- Cache of experiments
+- Dates stored as BSON dates in UTC, with millisecond precision
+- Drift collections stored as standard or time-series collections
+- Drifts of many experiments stored in a single shared collection
+- Declared indexes of the application collections, created on startup
 
 Environment Variables Required:
 - DATABASE_USERNAME: MongoDB authentication username
@@ -21,10 +27,93 @@ Environment Variables Required:
 Collections Used:
 - app.users: User account information
 - app.experiments: Experiment metadata and permissions
+- app.api_keys: API keys hashes and metadata
+- app.acl: Materialized experiments permissions
+- app.jobs: Background jobs and their status
 - app.{experiment_id}: Individual drift detection runs per experiment
+- app.drifts: Drift detection runs of experiments with shared storage
+
+Commands:
+- flask indexes reconcile: Create the missing indexes, report differences
 """
 
-from pymongo import MongoClient, timeout
+from datetime import datetime as dt
+from datetime import timezone
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from pymongo import IndexModel, MongoClient, timeout
+from pymongo.errors import OperationFailure
+
+from app.tools.cache import create_cache
+
+# Collection of the drifts of every experiment with shared storage
+SHARED_DRIFTS = "app.drifts"
+
+# Filter of the experiments not being deleted, see `jobs.delete_experiment`
+ACTIVE_EXPERIMENTS = {"deleting": {"$exists": False}}
+
+# Options of the drift collections of experiments with time-series storage
+TIMESERIES = {"timeField": "created_at", "metaField": "meta", "granularity": "seconds"}
+
+# Indexes of the application collections, see docs/database-schema.md
+INDEXES = {
+    "app.users": [
+        IndexModel([("subject", 1), ("issuer", 1)], unique=True),
+        IndexModel("email"),
+        IndexModel([("created_at", -1), ("_id", -1)]),
+    ],
+    "app.experiments": [
+        IndexModel("name", unique=True),
+        IndexModel([("created_at", -1), ("_id", -1)]),
+        IndexModel([("public", 1), ("created_at", -1), ("_id", -1)]),
+    ],
+    "app.api_keys": [
+        IndexModel("hash", unique=True),
+        IndexModel("experiment_id"),
+    ],
+    "app.acl": [
+        IndexModel([("entity", 1), ("experiment_id", 1)]),
+        IndexModel("experiment_id"),
+    ],
+    "app.jobs": [
+        IndexModel("status"),
+    ],
+    "app.parameters": [
+        IndexModel("experiment_id"),
+    ],
+}
+
+# Indexes of the drift collection of each experiment, indexes on the leading
+# fields of a compound index, such as `job_status`, are covered by it. Sort
+# indexes end with `_id`, the tie-breaker of the search sorts, so the pages
+# after a cursor are read as index ranges, see `pagination.keyset_filter`
+DRIFT_INDEXES = [
+    IndexModel("idempotency_key", unique=True, sparse=True),
+    IndexModel([("drift_detected", 1), ("_id", 1)]),
+    IndexModel("tags"),
+    IndexModel([("created_at", -1), ("_id", -1)]),
+    IndexModel([("job_status", 1), ("drift_detected", 1), ("created_at", -1), ("_id", -1)]),
+    IndexModel([("model", 1), ("job_status", 1), ("created_at", -1), ("_id", -1)]),
+]
+
+# Index of the drift ids in time-series collections, created by MongoDB in others
+TIMESERIES_ID_INDEX = IndexModel("_id")
+
+# Indexes of the shared drift collection, led by the experiment of the drifts
+SHARED_DRIFT_INDEXES = [
+    IndexModel(
+        [("experiment_id", 1), ("idempotency_key", 1)],
+        unique=True,
+        partialFilterExpression={"idempotency_key": {"$exists": True}},
+    ),
+    IndexModel([("experiment_id", 1), ("drift_detected", 1), ("_id", 1)]),
+    IndexModel([("experiment_id", 1), ("tags", 1)]),
+    IndexModel([("experiment_id", 1), ("created_at", -1), ("_id", -1)]),
+    IndexModel([("experiment_id", 1), ("job_status", 1), ("created_at", -1), ("_id", -1)]),
+    IndexModel([("experiment_id", 1), ("model", 1), ("created_at", -1), ("_id", -1)]),
+]
 
 
 def init_app(app):
@@ -43,10 +132,27 @@ def init_app(app):
         TimeoutError: If connection validation exceeds timeout.
 
     Side Effects:
+        - Sets app.config['users_cache'] to the registered users cache
+        - Sets app.config['experiments_cache'] to the experiments cache
         - Sets app.config['db_client'] to MongoDB client instance
         - Sets app.config['db_info'] to server information
         - Sets app.config['db'] to the target database instance
+        - Creates the application indexes, see `create_indexes`
+        - Registers the `flask indexes` commands
     """
+    app.cli.add_command(indexes_cli)
+    app.config["users_cache"] = create_cache(
+        app.config,
+        name="users",
+        maxsize=app.config["USERS_CACHE_MAXSIZE"],
+        ttl=app.config["USERS_CACHE_TTL"],
+    )
+    app.config["experiments_cache"] = create_cache(
+        app.config,
+        name="experiments",
+        maxsize=app.config["EXPERIMENTS_CACHE_MAXSIZE"],
+        ttl=app.config["EXPERIMENTS_CACHE_TTL"],
+    )
     if app.config["TESTING"]:
         return  # Testing fixtures will set up the database
     client = app.config["db_client"] = MongoClient(
@@ -59,6 +165,243 @@ def init_app(app):
     with timeout(seconds=3):  # Check the connection
         app.config["db_info"] = client.server_info()
     app.config["db"] = client[app.config["DATABASE_NAME"]]
+    for name, error in create_indexes(app.config["db"]).items():
+        app.logger.warning("Indexes of %s not created: %s", name, error)
+
+
+def create_indexes(database, experiments=False):
+    """
+    Create the indexes the application relies on, if they do not exist.
+
+    Some indexes are required for correctness, such as the unique experiment
+    names that turn concurrent creations with the same name into conflicts,
+    the others keep the searches and their default sort off collection
+    scans. Existing indexes are left as they are, and a collection whose
+    indexes cannot be built, for example because its records break a unique
+    index, does not stop the others.
+
+    Every worker calls it on startup, so by default only the application
+    collections and the shared drift collection are indexed, a fixed number
+    of collections. The drift collection of an experiment is indexed when the
+    experiment is created, and existing ones by `flask indexes reconcile`.
+
+    Args:
+        database (Database): The application database.
+        experiments (bool, optional): If the drift collections of the
+            experiments are also indexed. Defaults to False.
+
+    Returns:
+        dict: Map of collection name to the error building its indexes.
+    """
+    errors = {}
+    for name, indexes in declared_indexes(database) if experiments else app_indexes():
+        try:
+            build_indexes(database[name], indexes)
+        except OperationFailure as err:
+            errors[name] = str(err)
+    return errors
+
+
+def build_indexes(collection, indexes):
+    """
+    Create a list of indexes in a collection, if they do not exist.
+
+    Args:
+        collection (Collection): Collection to index.
+        indexes (list): The IndexModel to create.
+
+    Raises:
+        OperationFailure: If an index cannot be built, or exists with the
+            same name and other options.
+    """
+    for index in indexes:
+        options = dict(index.document)
+        collection.create_index(list(options.pop("key").items()), **options)
+
+
+def app_indexes():
+    """
+    Iterate the indexes declared for the collections shared by experiments.
+
+    Yields:
+        tuple: The collection name and its list of IndexModel.
+    """
+    yield from INDEXES.items()
+    yield SHARED_DRIFTS, SHARED_DRIFT_INDEXES
+
+
+def declared_indexes(database):
+    """
+    Iterate the indexes declared for every collection of the database.
+
+    Experiments with their drifts in the shared collection have no drift
+    collection of their own, and the collection of an experiment being
+    deleted is dropped, so no indexes are declared for them.
+
+    Args:
+        database (Database): The application database.
+
+    Yields:
+        tuple: The collection name and its list of IndexModel.
+    """
+    yield from app_indexes()
+    query = {"drifts_collection": {"$exists": False}, **ACTIVE_EXPERIMENTS}  # Own drift collections
+    for experiment in database["app.experiments"].find(query, {"storage": 1}):
+        yield f"app.{experiment['_id']}", drift_indexes(is_timeseries(experiment))
+
+
+def drift_indexes(timeseries=False):
+    """
+    Return the indexes declared for the drift collection of an experiment.
+
+    Time-series collections do not support unique indexes, so the index of
+    the idempotency keys is only declared for standard collections. They
+    have no `_id` index either, so one is declared for the drifts read,
+    updated and deleted by id.
+
+    Args:
+        timeseries (bool, optional): If the collection is a time-series
+            collection. Defaults to False.
+
+    Returns:
+        list: The IndexModel of the drift collection.
+    """
+    if timeseries:
+        return [TIMESERIES_ID_INDEX] + [x for x in DRIFT_INDEXES if not x.document.get("unique")]
+    return DRIFT_INDEXES
+
+
+def create_drift_indexes(collection, timeseries=False):
+    """
+    Create the indexes of the drift collection of an experiment.
+
+    The idempotency keys are unique, so retried creations with the same
+    key return the original drift. Drifts without key are not indexed.
+
+    Args:
+        collection (Collection): Drift collection of the experiment.
+        timeseries (bool, optional): If the collection is a time-series
+            collection. Defaults to False.
+    """
+    build_indexes(collection, drift_indexes(timeseries))
+
+
+def compare_indexes(collection, indexes):
+    """
+    Compare the indexes of a collection with the declared ones.
+
+    Indexes are matched by name, and an index with the same name but other
+    keys or `unique` and `sparse` options is reported as different. The
+    `_id` index, created by MongoDB, is ignored.
+
+    Args:
+        collection (Collection): Collection to check.
+        indexes (list): The IndexModel declared for the collection.
+
+    Returns:
+        dict: Names of the `missing`, `different` and `unexpected` indexes.
+    """
+    existing = collection.index_information()
+    existing.pop("_id_", None)
+    report = {"missing": [], "different": [], "unexpected": []}
+    for index in (x.document for x in indexes):
+        found = existing.pop(index["name"], None)
+        if found is None:
+            report["missing"].append(index["name"])
+        elif _index_options(found) != _index_options(index):
+            report["different"].append(index["name"])
+    report["unexpected"] = sorted(existing)
+    return report
+
+
+def _index_options(index):
+    keys = [(field, int(order)) for field, order in dict(index["key"]).items()]
+    return keys, bool(index.get("unique")), bool(index.get("sparse"))
+
+
+def create_drift_collection(database, experiment):
+    """
+    Create the drift collection of a new experiment with its indexes.
+
+    Standard collections are created by MongoDB on the first insert, so
+    only time-series collections are created explicitly, see TIMESERIES.
+    Experiments with shared storage have no collection of their own.
+
+    Args:
+        database (Database): The application database.
+        experiment (dict): Experiment record with `_id` and `storage`.
+    """
+    if "drifts_collection" in experiment:
+        return
+    name, timeseries = f"app.{experiment['_id']}", is_timeseries(experiment)
+    if timeseries:
+        database.create_collection(name, timeseries=TIMESERIES)
+    create_drift_indexes(database[name], timeseries=timeseries)
+
+
+def is_timeseries(experiment):
+    """
+    Return if the drifts of an experiment are stored in a time-series.
+
+    Args:
+        experiment (dict): Experiment record, with its `storage` option.
+
+    Returns:
+        bool: True if the drift collection is a time-series collection.
+    """
+    return experiment.get("storage") == "timeseries"
+
+
+def timeseries_meta(drift):
+    """
+    Return the time-series meta field of a drift.
+
+    MongoDB groups the drifts with the same meta field in buckets, so it
+    holds the fields shared by runs of the same job: model and tags. The
+    fields are kept at the top level of the drift too, so queries and
+    responses are the same for both storages.
+
+    Args:
+        drift (dict): Drift record with `model` and `tags`.
+
+    Returns:
+        dict: The meta field of the drift.
+    """
+    return {"model": drift.get("model"), "tags": drift.get("tags", [])}
+
+
+def utcnow():
+    """
+    Return the current UTC time with the precision of BSON dates.
+
+    BSON dates store milliseconds, so the value returned when a record is
+    created is the same returned when it is read back from the database.
+
+    Returns:
+        datetime: The current time, timezone aware in UTC.
+    """
+    now = dt.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def parse_date(value):
+    """
+    Parse an ISO 8601 string into a datetime to store as BSON date.
+
+    Dates without timezone, as written by previous versions, are taken
+    as UTC.
+
+    Args:
+        value (str): Date in ISO 8601 format.
+
+    Returns:
+        datetime: The parsed date, timezone aware.
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 date.
+    """
+    date = dt.fromisoformat(value)
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
 
 
 NOT_FOUND = {
@@ -111,3 +454,105 @@ CONFLICT = {
         }
     },
 }
+
+
+PRECONDITION_FAILED = {
+    "description": "Precondition Failed",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "code": {
+                        "type": "integer",
+                        "description": "Error code",
+                    },
+                    "status": {
+                        "type": "string",
+                        "description": "Error name",
+                    },
+                    "message": {
+                        "type": "string",
+                        "description": "Error message",
+                    },
+                },
+            }
+        }
+    },
+}
+
+
+PAYLOAD_TOO_LARGE = {
+    "description": "Payload Too Large",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "code": {
+                        "type": "integer",
+                        "description": "Error code",
+                    },
+                    "status": {
+                        "type": "string",
+                        "description": "Error name",
+                    },
+                    "message": {
+                        "type": "string",
+                        "description": "Error message",
+                    },
+                },
+            }
+        }
+    },
+}
+
+
+UNSUPPORTED_MEDIA_TYPE = {
+    "description": "Unsupported Media Type",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "code": {
+                        "type": "integer",
+                        "description": "Error code",
+                    },
+                    "status": {
+                        "type": "string",
+                        "description": "Error name",
+                    },
+                    "message": {
+                        "type": "string",
+                        "description": "Error message",
+                    },
+                },
+            }
+        }
+    },
+}
+
+
+indexes_cli = AppGroup("indexes", help="Manage the database indexes.")
+
+
+@indexes_cli.command("reconcile")
+@click.option("--dry-run", is_flag=True, help="Report the differences only.")
+def reconcile_command(dry_run):
+    """Create the missing indexes and report the other differences."""
+    database, missing = current_app.config["db"], 0
+    for name, indexes in declared_indexes(database):
+        report = compare_indexes(database[name], indexes)
+        for status, names in report.items():
+            for index in names:
+                click.echo(f"{name}: {status} index {index}.")
+        missing += len(report["missing"])
+        if report["missing"] and not dry_run:
+            names = set(report["missing"])
+            try:
+                build_indexes(database[name], [x for x in indexes if x.document["name"] in names])
+            except OperationFailure as err:
+                click.echo(f"{name}: indexes not created, {err}.")
+                missing -= len(names)
+    click.echo(f"Found {missing} missing indexes." if dry_run else f"Created {missing} indexes.")
@@ -15,6 +15,9 @@ Supported HTTP exceptions:
 - 403 Forbidden: Insufficient permissions
 - 404 Not Found: Resource not found
 - 409 Conflict: Resource conflict (e.g., duplicate names)
+- 412 Precondition Failed: Resource modified since the given revision
+- 413 Payload Too Large: Too many items in a batch request
+- 415 Unsupported Media Type: Request body in an unexpected format
 """
 
 import json
@@ -36,6 +39,9 @@ def init_app(app):
     app.errorhandler(exceptions.Forbidden)(error_handler)
     app.errorhandler(exceptions.NotFound)(error_handler)
     app.errorhandler(exceptions.Conflict)(error_handler)
+    app.errorhandler(exceptions.PreconditionFailed)(error_handler)
+    app.errorhandler(exceptions.RequestEntityTooLarge)(error_handler)
+    app.errorhandler(exceptions.UnsupportedMediaType)(error_handler)
 
 
 def error_handler(error):
@@ -0,0 +1,174 @@
+"""
+Background jobs module for the Drift Watch Backend.
+
+This module runs slow maintenance tasks outside the request, so endpoints
+such as the experiment deletion answer 202 Accepted straight away. Jobs are
+executed by a thread pool of JOBS_MAX_WORKERS threads in each worker process.
+
+Every job is recorded in the app.jobs collection with its task, arguments
+and status (Pending, Running, Completed or Failed), so its progress can be
+followed from any worker through the job-status endpoint. Tasks are
+idempotent, so jobs interrupted by a restart can be executed again with
+`flask jobs resume`.
+
+Collections Used:
+- app.jobs: Background jobs and their status
+
+Commands:
+- flask jobs resume: Execute the jobs left Pending or Running
+"""
+
+import time
+import uuid
+from concurrent import futures
+from datetime import timezone
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.tools import acl
+from app.tools.database import SHARED_DRIFTS, utcnow
+from app.tools.parameters import PARAMETERS
+
+# Statuses of jobs not finished yet
+UNFINISHED = ["Pending", "Running"]
+
+
+def init_app(app):
+    """
+    Initialize the jobs executor and commands for the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to configure.
+
+    Side Effects:
+        - Sets app.config['jobs_executor'] to the jobs thread pool
+        - Sets app.config['jobs_futures'] to the set of running jobs
+        - Registers the `flask jobs resume` command
+    """
+    app.config["jobs_executor"] = futures.ThreadPoolExecutor(
+        max_workers=app.config["JOBS_MAX_WORKERS"],
+        thread_name_prefix="jobs",
+    )
+    app.config["jobs_futures"] = set()
+    app.cli.add_command(jobs_cli)
+
+
+def delete_experiment(experiment_id):
+    """
+    Drop the drift records of a deleted experiment, then its record.
+
+    The experiment is marked `deleting` by the endpoint before the job runs.
+    Other workers may still serve the experiment from their cache, see
+    `utils.get_experiment`, so the job waits until EXPERIMENTS_CACHE_TTL
+    seconds have passed since `deleted_at`. From then on every worker
+    rejects it, and no drift written by another worker recreates the
+    dropped collection. The record is only deleted at the end, so an
+    interrupted job is resumed with the experiment still rejected.
+
+    The drift collection is dropped as a whole, which releases its data and
+    indexes at once regardless of the number of drifts, together with the
+    leftovers of an interrupted time-series migration. Drifts in the shared
+    collection and offloaded parameters are deleted through their experiment
+    index. The ACL rows and cache entries are purged again, in case a request
+    recreated them while the experiment was being deleted.
+
+    Args:
+        experiment_id (str): The unique UUID identifier of the experiment.
+    """
+    experiment = current_app.config["db"]["app.experiments"].find_one({"_id": experiment_id})
+    if experiment and "deleted_at" in experiment:  # Cached copies of other workers
+        elapsed = utcnow() - experiment["deleted_at"].replace(tzinfo=timezone.utc)
+        time.sleep(max(current_app.config["EXPERIMENTS_CACHE_TTL"] - elapsed.total_seconds(), 0))
+    current_app.config["db"].drop_collection(f"app.{experiment_id}")
+    current_app.config["db"].drop_collection(f"app.{experiment_id}.standard")
+    current_app.config["db"][SHARED_DRIFTS].delete_many({"experiment_id": experiment_id})
+    current_app.config["db"][PARAMETERS].delete_many({"experiment_id": experiment_id})
+    acl.remove(experiment_id)
+    current_app.config["experiments_cache"].delete(experiment_id)
+    current_app.config["db"]["app.experiments"].delete_one({"_id": experiment_id, "deleting": True})
+
+
+# Functions executed by each job task
+TASKS = {"delete_experiment": delete_experiment}
+
+
+def submit(task, user_id, **kwds):
+    """
+    Record a job and schedule it in the jobs executor.
+
+    Args:
+        task (str): Name of the task in TASKS to execute.
+        user_id (str): Id of the user requesting the job.
+        **kwds: Arguments of the task, stored in the job record.
+
+    Returns:
+        dict: The job record, with status Pending.
+    """
+    job = {
+        "_id": str(uuid.uuid4()),
+        "task": task,
+        "arguments": kwds,
+        "user_id": user_id,
+        "status": "Pending",
+        "created_at": utcnow(),
+    }
+    current_app.config["db"]["app.jobs"].insert_one(job)
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    future = app.config["jobs_executor"].submit(_run, app, job["_id"])
+    app.config["jobs_futures"].add(future)
+    future.add_done_callback(app.config["jobs_futures"].discard)
+    return job
+
+
+def _run(app, job_id):
+    with app.app_context():
+        execute(job_id)
+
+
+def execute(job_id):
+    """
+    Execute a job and record its result.
+
+    Args:
+        job_id (str): The unique UUID identifier of the job.
+
+    Returns:
+        str: The final status of the job, Completed or Failed.
+    """
+    jobs = current_app.config["db"]["app.jobs"]
+    job = jobs.find_one_and_update({"_id": job_id}, {"$set": {"status": "Running"}})
+    update = {"status": "Completed"}
+    try:
+        TASKS[job["task"]](**job["arguments"])
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        current_app.logger.exception("Job %s failed.", job_id)
+        update = {"status": "Failed", "error": str(err)}
+    update["finished_at"] = utcnow()
+    jobs.update_one({"_id": job_id}, {"$set": update})
+    return update["status"]
+
+
+def join(timeout=None):
+    """
+    Wait until the jobs submitted by this process are finished.
+
+    Args:
+        timeout (float, optional): Maximum number of seconds to wait.
+            Defaults to None to wait without limit.
+    """
+    futures.wait(list(current_app.config["jobs_futures"]), timeout=timeout)
+
+
+jobs_cli = AppGroup("jobs", help="Manage the background jobs.")
+
+
+@jobs_cli.command("resume")
+def resume_command():
+    """Execute the jobs left Pending or Running."""
+    jobs = current_app.config["db"]["app.jobs"]
+    job_ids = jobs.distinct("_id", {"status": {"$in": UNFINISHED}})
+    for job_id in job_ids:
+        click.echo(f"Job {job_id}: {execute(job_id)}.")
+    click.echo(f"Executed {len(job_ids)} jobs.")
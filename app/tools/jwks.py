@@ -0,0 +1,131 @@
+"""
+Local JWT verification module for the Drift Watch Backend.
+
+This module verifies JWT access tokens without contacting the OpenID Connect
+provider on every request. The signature is checked against the provider
+JSON Web Key Set (JWKS), which is downloaded once and kept in memory until it
+expires or a token signed with an unknown key id is received (key rotation).
+
+The verification checks:
+- Token signature against the cached JWKS of the issuer
+- Expiration time (exp) and presence of the subject (sub)
+- Issuer (iss) matching the issuer of the signing key set
+- Audience (aud) matching one of AUTH_JWT_AUDIENCE, which is required:
+  access tokens for other clients of a trusted issuer are rejected
+
+The JWKS location is discovered from the issuer OpenID configuration or can
+be set explicitly per issuer with AUTH_JWKS_URIS, including file:// URLs.
+"""
+
+import threading
+import time
+
+import jwt
+
+# Only asymmetric algorithms are accepted for keys published by an OP
+SIGNATURE_ALGORITHMS = [
+    "RS256",
+    "RS384",
+    "RS512",
+    "PS256",
+    "PS384",
+    "PS512",
+    "ES256",
+    "ES384",
+    "ES512",
+    "EdDSA",
+]
+
+
+class JWKClient(jwt.PyJWKClient):
+    """
+    PyJWT JWKS client with a minimum interval between forced refreshes.
+
+    The base client downloads the key set again whenever a token refers to
+    an unknown key id. This client ignores such refresh requests when the key
+    set was fetched less than `refresh_interval` seconds ago, so tokens with
+    random key ids cannot force a request to the OP on every call.
+    """
+
+    def __init__(self, uri, lifespan, refresh_interval=60, **kwds):
+        super().__init__(uri, cache_jwk_set=True, lifespan=lifespan, **kwds)
+        self.refresh_interval = refresh_interval
+        self.fetched_at = 0.0
+
+    def fetch_data(self):
+        self.fetched_at = time.monotonic()
+        return super().fetch_data()
+
+    def get_jwk_set(self, refresh=False):
+        if refresh and time.monotonic() - self.fetched_at < self.refresh_interval:
+            refresh = False
+        return super().get_jwk_set(refresh)
+
+
+class JWKSVerifier:
+    """
+    Verifies JWT access tokens with a cached JWKS client per key set URI.
+
+    Attributes:
+        lifespan (int): Seconds a downloaded key set is kept before refresh.
+        timeout (float): Timeout in seconds for key set downloads.
+    """
+
+    def __init__(self, lifespan, timeout):
+        """
+        Initialize the verifier without any key set loaded.
+
+        Args:
+            lifespan (int): Seconds a downloaded key set is kept.
+            timeout (float): Timeout in seconds for key set downloads.
+        """
+        self.lifespan = lifespan
+        self.timeout = timeout
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def client(self, jwks_uri):
+        """
+        Return the JWKS client for a key set URI, creating it if required.
+
+        Args:
+            jwks_uri (str): URL of the JSON Web Key Set.
+
+        Returns:
+            JWKClient: Client caching the key set of the URI.
+        """
+        with self._lock:
+            if jwks_uri not in self._clients:
+                self._clients[jwks_uri] = JWKClient(
+                    jwks_uri,
+                    lifespan=self.lifespan,
+                    timeout=self.timeout,
+                )
+            return self._clients[jwks_uri]
+
+    def decode(self, access_token, issuer, jwks_uri, audience):
+        """
+        Verify a JWT access token and return the decoded token.
+
+        Args:
+            access_token (str): Encoded JWT access token.
+            issuer (str): Expected issuer of the token.
+            jwks_uri (str): URL of the issuer JSON Web Key Set.
+            audience (list): Accepted audiences, tokens without `aud`
+                claim or with another audience are rejected.
+
+        Returns:
+            dict: Complete decoded token with header, payload and signature.
+
+        Raises:
+            jwt.exceptions.PyJWTError: If the token cannot be verified.
+        """
+        signing_key = self.client(jwks_uri).get_signing_key_from_jwt(access_token)
+        return jwt.api_jwt.decode_complete(
+            access_token,
+            signing_key.key,
+            algorithms=SIGNATURE_ALGORITHMS,
+            issuer=issuer,
+            audience=audience or None,
+            options={"require": ["exp", "iss", "sub", "aud"], "verify_aud": True},
+        )
@@ -0,0 +1,478 @@
+"""
+Data migrations module for the Drift Watch Backend.
+
+This module converts the records written by previous versions to the
+current storage format. Migrations run online, in small batches, while the
+application keeps serving requests. They only select the records still in
+the previous format and update each one only if it was not modified in the
+meantime, so an interrupted migration is resumed by running it again.
+
+Migrations:
+- dates: Store the ISO 8601 string dates as BSON dates in UTC
+- drift-ids: Store the drift ids as BSON UUIDs, see DATABASE_BINARY_UUIDS
+- timeseries: Move the drifts of an experiment to a time-series collection
+- shared-drifts: Move the drifts of an experiment to the shared collection
+
+Commands:
+- flask migrate dates: Convert the string dates of all collections
+- flask migrate drift-ids: Convert the string ids of all drift collections
+- flask migrate timeseries: Move the drifts of experiments to time-series
+- flask migrate shared-drifts: Move the drifts of experiments to app.drifts
+"""
+
+import time
+import uuid
+
+import click
+from bson.binary import Binary
+from flask import current_app
+from flask.cli import AppGroup
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.tools.database import (
+    ACTIVE_EXPERIMENTS,
+    SHARED_DRIFTS,
+    TIMESERIES,
+    create_drift_indexes,
+    is_timeseries,
+    parse_date,
+    timeseries_meta,
+)
+
+# Date fields of the collections, drift collections are added per experiment
+DATE_FIELDS = {
+    "app.users": ["created_at"],
+    "app.experiments": ["created_at"],
+    "app.api_keys": ["created_at"],
+    "app.jobs": ["created_at", "finished_at"],
+    SHARED_DRIFTS: ["created_at"],
+}
+
+# Field holding the idempotency key of a drift while its id is migrated
+MOVING_KEY = "migrating_idempotency_key"
+
+# Field marking the drifts of an experiment already in the shared collection
+COPIED_KEY = "copied_to_shared"
+
+# Copies of the drifts of an experiment to catch up with its writes
+COPY_PASSES = 5
+
+
+def init_app(app):
+    """
+    Register the migration commands for the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to configure.
+
+    Side Effects:
+        - Registers the `flask migrate` commands
+    """
+    app.cli.add_command(migrate_cli)
+
+
+def date_fields(database):
+    """
+    Return the date fields of every collection in a database.
+
+    Args:
+        database (Database): Database with the collections to migrate.
+
+    Returns:
+        dict: Map of collection name to its date fields.
+    """
+    fields = dict(DATE_FIELDS)
+    for experiment_id in database["app.experiments"].distinct("_id"):
+        fields[f"app.{experiment_id}"] = ["created_at"]
+    return fields
+
+
+def migrate_dates(collection, field, batch_size=1000):
+    """
+    Convert the ISO 8601 strings of a field into BSON dates.
+
+    Records are read in batches ordered by id, and each record is updated
+    only if its value is still the string read. Values that are not valid
+    dates are left untouched and reported as skipped.
+
+    Args:
+        collection (Collection): Collection to migrate.
+        field (str): Name of the date field.
+        batch_size (int, optional): Records converted per round trip.
+            Defaults to 1000.
+
+    Returns:
+        tuple: Number of migrated and skipped records.
+    """
+    query, migrated, skipped = {field: {"$type": "string"}}, 0, 0
+    while batch := list(collection.find(query, {field: 1}).sort("_id", 1).limit(batch_size)):
+        requests = []
+        for record in batch:
+            try:
+                date = parse_date(record[field])
+            except ValueError:
+                skipped += 1
+                continue
+            selector = {"_id": record["_id"], field: record[field]}
+            requests.append(UpdateOne(selector, {"$set": {field: date}}))
+        if requests:
+            migrated += collection.bulk_write(requests, ordered=False).modified_count
+        query["_id"] = {"$gt": batch[-1]["_id"]}
+    return migrated, skipped
+
+
+def migrate_database(database, batch_size=1000):
+    """
+    Convert the string dates of every collection in a database.
+
+    Args:
+        database (Database): Database with the collections to migrate.
+        batch_size (int, optional): Records converted per round trip.
+            Defaults to 1000.
+
+    Returns:
+        dict: Map of "collection.field" to migrated and skipped records.
+    """
+    return {
+        f"{name}.{field}": migrate_dates(database[name], field, batch_size)
+        for name, fields in date_fields(database).items()
+        for field in fields
+    }
+
+
+def migrate_drift_ids(collection, batch_size=1000):
+    """
+    Convert the string ids of a drift collection into BSON UUIDs.
+
+    The `_id` of a record cannot be updated, so each batch is copied with
+    binary ids before deleting the originals. The idempotency key of an
+    original is first renamed to MOVING_KEY, so its copy does not collide
+    with it on the unique index, and the copy takes the key back. Keys left
+    in MOVING_KEY by an interrupted migration are recovered when it runs
+    again.
+
+    An original is only deleted if its revision did not change since it was
+    copied; otherwise its copy is deleted, its key restored, and it is left
+    for the next time the migration runs. Ids that are not valid UUIDs, or
+    whose copy cannot be written, are left untouched and reported as skipped.
+
+    Args:
+        collection (Collection): Drift collection of an experiment.
+        batch_size (int, optional): Records converted per round trip.
+            Defaults to 1000.
+
+    Returns:
+        tuple: Number of migrated records and list of skipped ids.
+    """
+    query, migrated, skipped = {"_id": {"$type": "string"}}, 0, []
+    while batch := list(collection.find(query).sort("_id", 1).limit(batch_size)):
+        query["_id"] = {"$type": "string", "$gt": batch[-1]["_id"]}
+        copies = {}  # Binary copy of each original id
+        for record in batch:
+            try:
+                copy = {**record, "_id": Binary.from_uuid(uuid.UUID(record["_id"]))}
+            except ValueError:
+                skipped.append(record["_id"])
+                continue
+            if "idempotency_key" in record:
+                selector = {"_id": record["_id"], "revision": record.get("revision")}
+                rename = {"$rename": {"idempotency_key": MOVING_KEY}}
+                if not collection.update_one(selector, rename).matched_count:
+                    skipped.append(record["_id"])  # Modified since read
+                    continue
+            if MOVING_KEY in copy:
+                copy["idempotency_key"] = copy.pop(MOVING_KEY)
+            copies[record["_id"]] = copy
+        if not copies:
+            continue
+        requests = [ReplaceOne({"_id": x["_id"]}, x, upsert=True) for x in copies.values()]
+        try:
+            collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as err:  # Key taken by a drift created meanwhile
+            for record_id in [list(copies)[x["index"]] for x in err.details["writeErrors"]]:
+                _restore_key(collection, record_id)
+                skipped.append(record_id)
+                del copies[record_id]
+        originals = [DeleteOne({"_id": x["_id"], "revision": x.get("revision")}) for x in batch if x["_id"] in copies]
+        if originals:
+            migrated += collection.bulk_write(originals, ordered=False).deleted_count
+        for record in collection.find({"_id": {"$in": list(copies)}}, {"_id": 1}):
+            collection.delete_one({"_id": copies[record["_id"]]["_id"]})  # Stale copy
+            _restore_key(collection, record["_id"])
+            skipped.append(record["_id"])
+    return migrated, skipped
+
+
+def _restore_key(collection, record_id):
+    selector = {"_id": record_id, MOVING_KEY: {"$exists": True}}
+    try:
+        collection.update_one(selector, {"$rename": {MOVING_KEY: "idempotency_key"}})
+    except DuplicateKeyError:  # Used by a retry after it was renamed
+        current_app.logger.warning("Idempotency key of drift %s dropped.", record_id)
+
+
+def migrate_timeseries(database, experiment_id, batch_size=1000):
+    """
+    Move the drifts of an experiment to a time-series collection.
+
+    Time-series collections cannot be renamed, so the drift collection is
+    renamed to `app.{experiment_id}.standard`, a time-series collection is
+    created in its place, and the drifts are moved in batches. Each batch
+    is removed from the target before inserting it, so a batch interrupted
+    halfway is moved again without duplicates. The standard collection is
+    dropped once empty. Drifts with string dates are skipped and kept in
+    the standard collection, migrate their dates first.
+
+    The experiment storage is switched, with a new revision, before moving
+    the drifts, so new drifts are written with their meta field and updates
+    based on a cached copy of the experiment cannot switch it back to the
+    standard storage. Drifts not moved yet are not returned by the API,
+    run the migration while the experiment is idle.
+
+    Args:
+        database (Database): The application database.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        batch_size (int, optional): Drifts moved per round trip.
+            Defaults to 1000.
+
+    Returns:
+        tuple: Number of moved and skipped drifts.
+
+    Raises:
+        LookupError: If the experiment does not exist.
+        ValueError: If the experiment drifts are in the shared collection.
+    """
+    experiments = database["app.experiments"]
+    query = {"_id": experiment_id, **ACTIVE_EXPERIMENTS}
+    experiment = experiments.find_one(query, {"storage": 1, "drifts_collection": 1})
+    if experiment is None:
+        raise LookupError(f"Experiment {experiment_id} not found.")
+    if "drifts_collection" in experiment:
+        raise ValueError(f"Experiment {experiment_id} uses the shared drifts collection.")
+    name = f"app.{experiment_id}"
+    source, target = database[f"{name}.standard"], database[name]
+    if not is_timeseries(experiment):
+        if name in database.list_collection_names():
+            target.rename(source.name)
+        database.create_collection(name, timeseries=TIMESERIES)
+        create_drift_indexes(target, timeseries=True)
+        update = {"$set": {"storage": "timeseries"}, "$inc": {"revision": 1}}
+        experiments.update_one({"_id": experiment_id}, update)
+
+    query, migrated = {"created_at": {"$type": "date"}}, 0
+    while batch := list(source.find(query).sort("_id", 1).limit(batch_size)):
+        ids = [drift["_id"] for drift in batch]
+        target.delete_many({"_id": {"$in": ids}})
+        target.insert_many([{**drift, "meta": timeseries_meta(drift)} for drift in batch])
+        migrated += source.delete_many({"_id": {"$in": ids}}).deleted_count
+    skipped = source.count_documents({})
+    if skipped == 0:
+        source.drop()
+    return migrated, skipped
+
+
+def copy_drifts(source, target, experiment_id, batch_size=1000):
+    """
+    Copy the drifts of an experiment to the shared drift collection.
+
+    Each drift is copied with its `experiment_id`, unless the shared
+    collection holds the same or a newer revision of it, so the drifts
+    modified there since a previous copy are not overwritten. Drifts marked
+    with COPIED_KEY, see `prune_drifts`, are only updated, so the drifts
+    deleted from the shared collection are not restored. Drifts whose id is
+    used by another experiment in the shared collection are not copied and
+    reported as missing.
+
+    Args:
+        source (Collection): Drift collection of the experiment.
+        target (Collection): The shared drift collection, SHARED_DRIFTS.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        batch_size (int, optional): Drifts copied per round trip.
+            Defaults to 1000.
+
+    Returns:
+        tuple: Number of copied drifts and of drifts missing in the target.
+    """
+    copied, missing, cursor = 0, 0, source.find({}).batch_size(batch_size)
+    while batch := [drift for _, drift in zip(range(batch_size), cursor)]:
+        requests = []
+        for drift in batch:
+            newer = {"$not": {"$gte": drift.get("revision", 0)}}
+            selector = {"_id": drift["_id"], "experiment_id": experiment_id, "revision": newer}
+            copy = {**drift, "experiment_id": experiment_id}
+            upsert = copy.pop(COPIED_KEY, None) is None
+            requests.append(ReplaceOne(selector, copy, upsert=upsert))
+        try:
+            result = target.bulk_write(requests, ordered=False).bulk_api_result
+        except BulkWriteError as err:  # Newer copies or ids of other experiments
+            result = err.details
+        copied += result["nModified"] + result["nUpserted"]
+        ids = [drift["_id"] for drift in batch if COPIED_KEY not in drift]
+        found = target.count_documents({"_id": {"$in": ids}, "experiment_id": experiment_id})
+        missing += len(ids) - found
+    return copied, missing
+
+
+def prune_drifts(source, target, experiment_id, batch_size=1000):
+    """
+    Remove the copies of the drifts deleted from the collection of an experiment.
+
+    The copies whose drift is no longer in the collection of the experiment
+    are removed from the shared collection, and the drifts still there are
+    marked with COPIED_KEY. Run it only before switching the experiment,
+    afterwards the API writes and deletes the drifts of the shared one.
+
+    Args:
+        source (Collection): Drift collection of the experiment.
+        target (Collection): The shared drift collection, SHARED_DRIFTS.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        batch_size (int, optional): Drifts checked per round trip.
+            Defaults to 1000.
+
+    Returns:
+        int: Number of removed copies.
+    """
+    removed, cursor = 0, target.find({"experiment_id": experiment_id}, {"_id": 1}).batch_size(batch_size)
+    while batch := [drift["_id"] for _, drift in zip(range(batch_size), cursor)]:
+        kept = [drift["_id"] for drift in source.find({"_id": {"$in": batch}}, {"_id": 1})]
+        source.update_many({"_id": {"$in": kept}, COPIED_KEY: {"$exists": False}}, {"$set": {COPIED_KEY: True}})
+        if deleted := [x for x in batch if x not in kept]:
+            removed += target.delete_many({"_id": {"$in": deleted}, "experiment_id": experiment_id}).deleted_count
+    return removed
+
+
+def migrate_shared_drifts(database, experiment_id, batch_size=1000, wait=0):
+    """
+    Move the drifts of an experiment to the shared drift collection.
+
+    The drifts are copied while the API keeps using the collection of the
+    experiment. A pass does not see the drifts written after it started, so
+    the copy is repeated, up to COPY_PASSES times, until a pass finds every
+    drift already in the shared collection with the same revision and no
+    copy of a deleted drift to remove, see `prune_drifts`. Only then the
+    experiment is switched to it, with a new revision. Workers keep their
+    cached copy of the experiment until it expires or is invalidated, see
+    `utils.get_experiment`, so after `wait` seconds, the experiments cache
+    TTL by default, the drifts they wrote meanwhile are copied again and
+    the collection of the experiment is dropped. The drifts copied before
+    the switch are only updated, so those deleted through the API since
+    are not restored.
+
+    Experiments with drifts whose id is used by another experiment, or
+    written faster than they are copied, are not switched, so the migration
+    can run again after solving the conflicts or when the experiment is
+    less busy.
+
+    Args:
+        database (Database): The application database.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        batch_size (int, optional): Drifts copied per round trip.
+            Defaults to 1000.
+        wait (float, optional): Seconds to wait after switching the
+            experiment, for the workers with a cached copy. Defaults to 0.
+
+    Returns:
+        tuple: Number of copied drifts and of drifts left behind, those in
+        conflict or changed by the last pass when the copies did not catch
+        up with the writes.
+
+    Raises:
+        LookupError: If the experiment does not exist.
+        ValueError: If the experiment uses time-series storage.
+    """
+    experiments = database["app.experiments"]
+    query = {"_id": experiment_id, **ACTIVE_EXPERIMENTS}
+    experiment = experiments.find_one(query, {"storage": 1, "drifts_collection": 1})
+    if experiment is None:
+        raise LookupError(f"Experiment {experiment_id} not found.")
+    if is_timeseries(experiment):
+        raise ValueError(f"Experiment {experiment_id} uses time-series storage.")
+    source, target = database[f"app.{experiment_id}"], database[SHARED_DRIFTS]
+    copied, switched = 0, "drifts_collection" in experiment
+    for _ in range(1 if switched else COPY_PASSES):
+        more, missing = copy_drifts(source, target, experiment_id, batch_size)
+        copied += more
+        if not switched:  # Deleted since the previous pass
+            more += prune_drifts(source, target, experiment_id, batch_size)
+        if missing or not more:  # Conflicts, or nothing changed since the last pass
+            break
+    if not switched:
+        if missing or more:  # Conflicts, or still written faster than copied
+            return copied, missing or more
+        update = {"$set": {"drifts_collection": SHARED_DRIFTS}, "$inc": {"revision": 1}}
+        experiments.update_one({"_id": experiment_id}, update)
+        time.sleep(wait)  # Workers with a cached copy of the previous revision
+        more, missing = copy_drifts(source, target, experiment_id, batch_size)
+        copied += more
+    if missing == 0:
+        source.drop()
+    return copied, missing
+
+
+migrate_cli = AppGroup("migrate", help="Migrate the records of previous versions.")
+
+
+@migrate_cli.command("dates")
+@click.option("--batch-size", default=1000, show_default=True, help="Records per round trip.")
+def dates_command(batch_size):
+    """Convert the string dates of all collections to BSON dates."""
+    results = migrate_database(current_app.config["db"], batch_size)
+    for name, (migrated, skipped) in results.items():
+        if migrated or skipped:
+            click.echo(f"{name}: {migrated} migrated, {skipped} skipped.")
+    click.echo(f"Migrated {sum(x for x, _ in results.values())} dates.")
+
+
+@migrate_cli.command("drift-ids")
+@click.option("--batch-size", default=1000, show_default=True, help="Records per round trip.")
+def drift_ids_command(batch_size):
+    """Convert the string ids of all drift collections to BSON UUIDs."""
+    if not current_app.config["DATABASE_BINARY_UUIDS"]:
+        raise click.UsageError("Enable DATABASE_BINARY_UUIDS before migrating the drift ids.")
+    database, total = current_app.config["db"], 0
+    names = [f"app.{x}" for x in database["app.experiments"].distinct("_id")]
+    for name in [*names, SHARED_DRIFTS]:
+        migrated, skipped = migrate_drift_ids(database[name], batch_size)
+        if migrated or skipped:
+            click.echo(f"{name}: {migrated} migrated, {len(skipped)} skipped.")
+        for drift_id in skipped:
+            click.echo(f"{name}: skipped {drift_id}.")
+        total += migrated
+    click.echo(f"Migrated {total} drift ids.")
+
+
+@migrate_cli.command("timeseries")
+@click.argument("experiment_ids", nargs=-1, required=True)
+@click.option("--batch-size", default=1000, show_default=True, help="Drifts per round trip.")
+def timeseries_command(experiment_ids, batch_size):
+    """Move the drifts of experiments to time-series collections."""
+    database = current_app.config["db"]
+    for experiment_id in experiment_ids:
+        try:
+            migrated, skipped = migrate_timeseries(database, experiment_id, batch_size)
+        except (LookupError, ValueError) as err:
+            raise click.BadParameter(str(err), param_hint="EXPERIMENT_IDS") from err
+        current_app.config["experiments_cache"].delete(experiment_id)
+        click.echo(f"app.{experiment_id}: {migrated} moved, {skipped} skipped.")
+
+
+@migrate_cli.command("shared-drifts")
+@click.argument("experiment_ids", nargs=-1)
+@click.option("--batch-size", default=1000, show_default=True, help="Drifts per round trip.")
+@click.option("--wait", type=float, help="Seconds to wait after switching each experiment.")
+def shared_drifts_command(experiment_ids, batch_size, wait):
+    """Move the drifts of experiments, all by default, to app.drifts."""
+    database = current_app.config["db"]
+    if wait is None:
+        wait = current_app.config["EXPERIMENTS_CACHE_TTL"]
+    if not experiment_ids:
+        query = {"drifts_collection": {"$exists": False}, "storage": {"$ne": "timeseries"}, **ACTIVE_EXPERIMENTS}
+        experiment_ids = database["app.experiments"].distinct("_id", query)
+    for experiment_id in experiment_ids:
+        try:
+            copied, missing = migrate_shared_drifts(database, experiment_id, batch_size, wait)
+        except (LookupError, ValueError) as err:
+            raise click.BadParameter(str(err), param_hint="EXPERIMENT_IDS") from err
+        current_app.config["experiments_cache"].delete(experiment_id)
+        click.echo(f"app.{experiment_id}: {copied} copied, {missing} left behind.")
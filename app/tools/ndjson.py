@@ -0,0 +1,53 @@
+"""
+Newline delimited JSON (NDJSON) module for the Drift Watch Backend.
+
+This module reads and writes NDJSON streams, one JSON document per line, so
+large uploads can be processed line by line with constant memory. Lines are
+read from the request stream with a maximum length, so a single oversized
+line cannot exhaust the memory of the worker.
+"""
+
+import json
+
+# Media type of NDJSON requests and responses
+MIMETYPE = "application/x-ndjson"
+
+
+def read_lines(stream, max_length):
+    """
+    Iterate the lines of a binary stream without loading it in memory.
+
+    Lines longer than `max_length` bytes are discarded up to the next line
+    break and reported as None, so they can be rejected by the caller.
+    Blank lines are skipped.
+
+    Args:
+        stream (IO[bytes]): Stream to read, such as `request.stream`.
+        max_length (int): Maximum length of a line in bytes.
+
+    Yields:
+        tuple: The line number, starting at 1, and the line content or None
+        if the line is too long.
+    """
+    number = 0
+    while line := stream.readline(max_length + 1):
+        number += 1
+        if len(line) > max_length and not line.endswith(b"\n"):
+            while (rest := stream.readline(max_length + 1)) and not rest.endswith(b"\n"):
+                pass
+            yield number, None
+        elif line.strip():
+            yield number, line
+
+
+def dumps(record):
+    """
+    Serialize a record as one NDJSON line.
+
+    Args:
+        record (dict): JSON serializable record.
+
+    Returns:
+        str: The JSON document followed by a line break.
+    """
+    return json.dumps(record) + "\n"
@@ -22,6 +22,7 @@ API Structure:
 - /user: User management and authentication endpoints
 - /experiment: Experiment management and metadata
 - /experiment/{id}/drift: Drift detection run management
+- /job: Status of background jobs
 """
 
 from flask_smorest import Api  # type: ignore
@@ -56,6 +57,7 @@ def init_app(app):
     # Register Blueprints
     api.register_blueprint(blp.entitlement, url_prefix="/entitlement")
     api.register_blueprint(blp.experiment, url_prefix="/experiment")
+    api.register_blueprint(blp.job, url_prefix="/job")
     api.register_blueprint(blp.user, url_prefix="/user")
 
 
@@ -0,0 +1,147 @@
+"""
+Keyset pagination module for the Drift Watch Backend.
+
+Search endpoints page with page numbers, which skip the documents of the
+previous pages, so deep pages cost time proportional to their offset. They
+also accept an opaque `cursor`, which encodes the sort key and `_id` of the
+last document returned. The next page is then read as an index range after
+that document, at the same cost for any depth.
+
+Results are sorted by the requested field and then by `_id`, so documents
+with equal sort keys keep a stable order. The `next_cursor` of each page is
+returned in the X-Pagination header, also in page-number mode, so clients
+can switch to cursors after the first page.
+
+MongoDB compares values of different BSON types by a fixed type order,
+while range operators only match values of the same type. The range after a
+cursor includes the other types explicitly, so drift ids stored both as
+strings and binary UUIDs, or dates not migrated yet, are not skipped.
+"""
+
+import base64
+import binascii
+import datetime
+
+import bson
+from bson.binary import Binary
+from bson.errors import BSONError
+from bson.objectid import ObjectId
+
+# BSON types in their comparison order, the order used by sorts
+TYPE_ORDER = ["null", "number", "string", "object", "array", "binData", "objectId", "bool", "date"]
+
+
+def paginate(collection, query, query_args, pagination_parameters, projection=None):
+    """
+    Return a page of the documents matching a search query.
+
+    Args:
+        collection (Collection): Collection to search.
+        query (dict): MongoDB query of the search.
+        query_args (dict): Search arguments with `sort_by`, `order_by` and
+            optionally the `cursor` of the page to return.
+        pagination_parameters (PaginationParameters): Page and page size,
+            completed with the item count and next cursor of the page.
+        projection (dict, optional): Fields to include or exclude.
+
+    Returns:
+        list: The documents of the page.
+    """
+    sort_by, order_by = query_args["sort_by"], query_args["order_by"]
+    direction = 1 if order_by == "asc" else -1
+    sort = [(sort_by, direction), ("_id", direction)]
+    page_size = pagination_parameters.page_size
+    pagination_parameters.cursor = cursor = query_args.get("cursor")
+    if cursor is None:  # Page number, skipping the previous pages
+        skip = (pagination_parameters.page - 1) * page_size
+        total = pagination_parameters.item_count = collection.count_documents(query)
+        items = list(collection.find(query, projection).sort(sort).skip(skip).limit(page_size))
+        more = skip + len(items) < total
+    else:  # Index range after the last document of the previous page
+        query = {"$and": [query, keyset_filter(cursor)]}
+        items = list(collection.find(query, projection).sort(sort).limit(page_size + 1))
+        more, items = len(items) > page_size, items[:page_size]
+        pagination_parameters.item_count = len(items)  # Pages are not counted
+    last = items[-1] if more and items else None
+    pagination_parameters.next_cursor = last and encode_cursor(sort_by, order_by, last)
+    return items
+
+
+def encode_cursor(sort_by, order_by, document):
+    """
+    Return the cursor of the page following a document.
+
+    Args:
+        sort_by (str): Field used to sort the results.
+        order_by (str): Sort order, "asc" or "desc".
+        document (dict): Last document of the page.
+
+    Returns:
+        str: Opaque URL-safe cursor.
+    """
+    values = {"sort_by": sort_by, "order_by": order_by, "key": document.get(sort_by), "id": document["_id"]}
+    return base64.urlsafe_b64encode(bson.encode(values)).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value):
+    """
+    Return the values encoded in a cursor.
+
+    Args:
+        value (str): Cursor returned by `encode_cursor`.
+
+    Returns:
+        dict: The `sort_by`, `order_by`, sort `key` and `id` of the cursor.
+
+    Raises:
+        ValueError: If the value is not a valid cursor.
+    """
+    try:
+        values = bson.decode(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+    except (BSONError, binascii.Error, ValueError) as err:
+        raise ValueError("Invalid cursor.") from err
+    if set(values) != {"sort_by", "order_by", "key", "id"}:
+        raise ValueError("Invalid cursor.")
+    return values
+
+
+def keyset_filter(cursor):
+    """
+    Return the query matching the documents sorted after a cursor.
+
+    Args:
+        cursor (dict): Cursor values returned by `decode_cursor`.
+
+    Returns:
+        dict: MongoDB query of the documents after the cursor.
+    """
+    direction = 1 if cursor["order_by"] == "asc" else -1
+    field, key = cursor["sort_by"], cursor["key"]
+    ties = {"$and": [{field: key}, {"$or": _after("_id", cursor["id"], direction)}]}
+    return {"$or": _after(field, key, direction) + [ties]}
+
+
+def _after(field, value, direction):
+    rank = TYPE_ORDER.index(_bson_type(value))
+    types = TYPE_ORDER[rank + 1 :] if direction == 1 else TYPE_ORDER[:rank]
+    conditions = [] if value is None else [{field: {"$gt" if direction == 1 else "$lt": value}}]
+    conditions += [{field: {"$type": x}} for x in types if x != "null"]
+    return conditions + ([{field: None}] if "null" in types else [])
+
+
+def _bson_type(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (Binary, bytes)):
+        return "binData"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    if isinstance(value, datetime.datetime):
+        return "date"
+    return "array" if isinstance(value, list) else "object"
@@ -0,0 +1,141 @@
+"""
+Drift parameters module for the Drift Watch Backend.
+
+Some detectors report large `parameters`, such as bin edges, histograms or
+per-feature statistics. Those arrays would bloat every drift document read
+by searches, so parameters larger than DRIFTS_PARAMETERS_MAXSIZE bytes, BSON
+encoded, are stored in a side collection, one record per drift, and the
+drift keeps only a `parameters_id` reference.
+
+The API returns offloaded parameters as if they were inline: they are loaded
+with one query per response. Listings can leave them out, and clients can
+fetch them lazily from the drift parameters endpoint.
+
+Side records are written after their drift, so a conditional update that
+fails never changes the parameters of the drift. Their ids derive from the
+experiment and drift ids, so retries and updates replace them in place.
+
+Collections Used:
+- app.parameters: Offloaded parameters of drifts
+"""
+
+import uuid
+
+import bson
+from bson.binary import Binary
+from flask import current_app
+from pymongo import ReplaceOne
+
+# Collection storing the offloaded drift parameters
+PARAMETERS = "app.parameters"
+
+
+def parameters_id(experiment_id, drift_id):
+    """
+    Return the id of the side record storing the parameters of a drift.
+
+    Args:
+        experiment_id (str): The unique UUID identifier of the experiment.
+        drift_id (str | UUID | Binary): The drift id in any representation.
+
+    Returns:
+        str: The id in the format "experiment_id/drift_id".
+    """
+    if isinstance(drift_id, Binary):
+        drift_id = drift_id.as_uuid()
+    return f"{experiment_id}/{uuid.UUID(str(drift_id))}"
+
+
+def split(drift, experiment_id, drift_id=None):
+    """
+    Separate the parameters of a drift record when they are too large.
+
+    Args:
+        drift (dict): Drift record, or `$set` fields, with its parameters.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        drift_id (str, optional): The drift id. Defaults to the `_id` of
+            the drift record.
+
+    Returns:
+        tuple: The record to store, without the parameters and with their
+        `parameters_id` when offloaded, and the side record to save after
+        it, or None when the parameters are stored inline.
+    """
+    parameters = drift.get("parameters") or {}
+    size = len(bson.encode({"parameters": parameters}))
+    if size <= current_app.config["DRIFTS_PARAMETERS_MAXSIZE"]:
+        return {k: v for k, v in drift.items() if k != "parameters_id"}, None
+    record = {
+        "_id": parameters_id(experiment_id, drift_id or drift["_id"]),
+        "experiment_id": experiment_id,
+        "parameters": parameters,
+        "size": size,
+    }
+    stored = {k: v for k, v in drift.items() if k != "parameters"}
+    stored["parameters_id"] = record["_id"]
+    return stored, record
+
+
+def split_update(update, experiment_id, drift_id):
+    """
+    Separate the parameters set by an update when they are too large.
+
+    Args:
+        update (dict): MongoDB update document of a drift.
+        experiment_id (str): The unique UUID identifier of the experiment.
+        drift_id (str): The unique UUID identifier of the drift.
+
+    Returns:
+        tuple: The update to apply and the side record to save after it,
+        or None when the parameters are set inline.
+    """
+    if "parameters" not in update.get("$set", {}):
+        return update, None
+    fields, record = split(update["$set"], experiment_id, drift_id)
+    unset = "parameters_id" if record is None else "parameters"
+    return {**update, "$set": fields, "$unset": {unset: ""}}, record
+
+
+def save(*records):
+    """
+    Write the side records of offloaded parameters.
+
+    Args:
+        *records (dict): Side records returned by `split`, None values
+            are skipped.
+    """
+    requests = [ReplaceOne({"_id": r["_id"]}, r, upsert=True) for r in records if r]
+    if requests:
+        current_app.config["db"][PARAMETERS].bulk_write(requests, ordered=False)
+
+
+def discard(experiment_id, drift_id):
+    """
+    Delete the side record of a drift, if its parameters were offloaded.
+
+    Args:
+        experiment_id (str): The unique UUID identifier of the experiment.
+        drift_id (str | UUID | Binary): The drift id in any representation.
+    """
+    record_id = parameters_id(experiment_id, drift_id)
+    current_app.config["db"][PARAMETERS].delete_one({"_id": record_id})
+
+
+def load(drifts):
+    """
+    Restore the offloaded parameters of drift records, in a single query.
+
+    Args:
+        drifts (list): Drift records read from the database.
+
+    Returns:
+        list: The same drift records, with their parameters inline.
+    """
+    offloaded = [d for d in drifts if d and "parameters_id" in d]
+    if offloaded:
+        query = {"_id": {"$in": [drift["parameters_id"] for drift in offloaded]}}
+        records = current_app.config["db"][PARAMETERS].find(query)
+        parameters = {record["_id"]: record["parameters"] for record in records}
+        for drift in offloaded:
+            drift["parameters"] = parameters.get(drift["parameters_id"], {})
+    return drifts
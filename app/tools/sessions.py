@@ -0,0 +1,108 @@
+"""
+Session tokens module for the Drift Watch Backend.
+
+This module implements short-lived session tokens for browser dashboards that
+send many parallel requests. A client exchanges a valid OIDC access token once
+and receives a session token signed by the backend, which is then verified
+locally on every request without contacting the OP.
+
+Session tokens are JWTs signed with HMAC-SHA256 (HS256) using SESSION_SECRET,
+with a recognizable prefix so they are never sent to the OP. They carry the
+token subject, issuer and email, the registered user id and the entitlements
+the user had when the token was exchanged. Tokens expire after SESSION_TTL
+seconds or at the expiration of the exchanged access token, whichever comes
+first, and cannot be exchanged again.
+"""
+
+import time
+from functools import reduce
+
+import jwt
+from flaat.user_infos import UserInfos  # type: ignore
+from flask import current_app
+
+# Prefix used to recognize session tokens in the Authorization header
+SESSION_TOKEN_PREFIX = "dws_"
+
+# Algorithm used to sign the session tokens
+SESSION_ALGORITHM = "HS256"
+
+
+def is_session_token(access_token):
+    """
+    Return True if a bearer token has the session token format.
+
+    Args:
+        access_token (str): Bearer token from the Authorization header.
+
+    Returns:
+        bool: True if the token starts with the session token prefix.
+    """
+    return access_token.startswith(SESSION_TOKEN_PREFIX)
+
+
+def issue_token(user_infos, user, entitlements):
+    """
+    Create a session token for a registered user.
+
+    Args:
+        user_infos (UserInfos): User information from the exchanged token.
+        user (dict): Registered user record.
+        entitlements (Iterable[str]): Entitlements of the user.
+
+    Returns:
+        tuple: The session token and its expiration as UNIX timestamp.
+    """
+    config = current_app.config
+    lifetime = config["SESSION_TTL"]
+    if user_infos.valid_for_secs is not None:
+        lifetime = min(lifetime, int(user_infos.valid_for_secs))
+    expires_at = int(time.time()) + lifetime
+    claims = {
+        "sub": user_infos["sub"],
+        "iss": user_infos["iss"],
+        "email": user_infos["email"],
+        "uid": user["_id"],
+        "ent": sorted(entitlements),
+        "exp": expires_at,
+    }
+    token = jwt.encode(claims, config["SESSION_SECRET"], algorithm=SESSION_ALGORITHM)
+    return SESSION_TOKEN_PREFIX + token, expires_at
+
+
+def get_user_infos(session_token):
+    """
+    Verify a session token and return the user infos it represents.
+
+    The entitlements are placed under ENTITLEMENTS_PATH, so the session user
+    infos are handled like the ones from the OP.
+
+    Args:
+        session_token (str): Session token in the Authorization header.
+
+    Returns:
+        UserInfos: User information with the session claims under the
+        `session` claim, or None if the token is not valid or expired.
+    """
+    config = current_app.config
+    if not config["SESSION_SECRET"]:
+        return None
+    try:
+        claims = jwt.decode(
+            session_token.removeprefix(SESSION_TOKEN_PREFIX),
+            config["SESSION_SECRET"],
+            algorithms=[SESSION_ALGORITHM],
+            options={"require": ["exp", "sub", "iss", "uid"]},
+        )
+    except jwt.InvalidTokenError:
+        return None
+    entitlements = reduce(lambda v, k: {k: v}, reversed(config["ENTITLEMENTS_KEYS"]), claims["ent"])
+    user_info = {
+        **entitlements,
+        "sub": claims["sub"],
+        "iss": claims["iss"],
+        "email": claims["email"],
+        "email_verified": True,  # Verified when the token was exchanged
+        "session": {"user_id": claims["uid"], "expires_at": claims["exp"]},
+    }
+    return UserInfos(access_token_info=None, user_info=user_info, introspection_info=None)
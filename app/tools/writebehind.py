@@ -0,0 +1,178 @@
+"""
+Write-behind module for the Drift Watch Backend.
+
+This module groups the inserts of concurrent drift creations into a single
+`insert_many`, so bursts of small requests share database round trips. The
+mode is enabled with DRIFTS_WRITE_BEHIND and is off by default.
+
+Each worker process owns a queue of accepted documents and a flusher thread.
+The flusher writes the queue once DRIFTS_WRITE_BEHIND_MAXSIZE documents are
+waiting or the oldest one has waited DRIFTS_WRITE_BEHIND_LINGER seconds.
+Requests wait on a future for the batch containing their document, so a
+response is only sent after its drift is stored and write errors are still
+reported to the client. The queue is drained when the process exits.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from flask import current_app
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
+
+# Marker queued to stop the flusher once the queue is drained
+_STOP = object()
+
+
+def init_app(app):
+    """
+    Initialize the drifts writer for the Flask application.
+
+    Args:
+        app (Flask): The Flask application instance to configure.
+
+    Side Effects:
+        - Sets app.config['drifts_writer'] to the group commit writer, or
+          None when DRIFTS_WRITE_BEHIND is disabled
+        - Registers a shutdown hook draining the writer queue
+    """
+    app.config["drifts_writer"] = None
+    if app.config["DRIFTS_WRITE_BEHIND"]:
+        writer = app.config["drifts_writer"] = GroupCommit(
+            max_size=app.config["DRIFTS_WRITE_BEHIND_MAXSIZE"],
+            max_linger=app.config["DRIFTS_WRITE_BEHIND_LINGER"],
+        )
+        atexit.register(writer.close)
+
+
+def insert(collection, document):
+    """
+    Insert a drift document, grouped with others when write-behind is on.
+
+    Args:
+        collection (Collection): Drift collection of the experiment.
+        document (dict): Drift record to insert.
+
+    Raises:
+        PyMongoError: If the document could not be written.
+    """
+    writer = current_app.config["drifts_writer"]
+    if writer is None:
+        collection.insert_one(document)
+    else:
+        writer.submit(collection, document).result()
+
+
+class GroupCommit:
+    """
+    Queue of documents written in batches by a background flusher.
+
+    The flusher thread is started on the first submission, so processes
+    forked after the application is created get their own thread.
+
+    Attributes:
+        max_size (int): Maximum number of documents per batch.
+        max_linger (float): Maximum time in seconds a document waits in
+            the queue before its batch is written.
+    """
+
+    def __init__(self, max_size, max_linger):
+        """
+        Initialize the writer settings, the flusher starts on first use.
+
+        Args:
+            max_size (int): Maximum number of documents per batch.
+            max_linger (float): Maximum wait of a document in seconds.
+        """
+        self.max_size = max_size
+        self.max_linger = max_linger
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+
+    def submit(self, collection, document):
+        """
+        Queue a document to be inserted in its collection.
+
+        Args:
+            collection (Collection): Collection to insert the document in.
+            document (dict): Document to insert.
+
+        Returns:
+            Future: Resolved when the batch containing the document is
+            written, with the write error as exception if it failed.
+        """
+        future = Future()
+        self._start().put((collection, document, future))
+        return future
+
+    def close(self, timeout=None):
+        """
+        Write the queued documents and stop the flusher.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+                Defaults to None to wait without limit.
+        """
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                return
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._queue, self._thread = None, None
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._queue, self._pid = queue.Queue(), os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="drifts-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._queue
+
+    def _run(self, pending):
+        stopping = False
+        while not stopping:
+            item = pending.get()
+            if item is _STOP:
+                return
+            batch, deadline = [item], time.monotonic() + self.max_linger
+            while len(batch) < self.max_size:
+                try:
+                    item = pending.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch):
+        collections = {}
+        for collection, document, future in batch:
+            entry = collections.setdefault(collection.full_name, (collection, []))
+            entry[1].append((document, future))
+        for collection, items in collections.values():
+            errors = {}
+            try:
+                collection.insert_many([document for document, _ in items], ordered=False)
+            except BulkWriteError as err:
+                for error in err.details["writeErrors"]:
+                    error_class = DuplicateKeyError if error["code"] == 11000 else WriteError
+                    errors[error["index"]] = error_class(error["errmsg"], error["code"], error)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                errors = dict.fromkeys(range(len(items)), err)
+            for index, (_, future) in enumerate(items):
+                if index in errors:
+                    future.set_exception(errors[index])
+                else:
+                    future.set_result(None)
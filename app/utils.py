@@ -8,7 +8,15 @@ consistent behavior across all API endpoints.
 
 Key functionality:
 - User authentication and registration validation
+- Cached registered user lookups with invalidation helpers
+- Request authorization context with the registered user loaded once
+- API keys granting Edit access to the drifts of a single experiment
 - Resource retrieval with proper error handling  
+- Completion of new drift records before insertion
+- Drift ids stored as strings or BSON UUIDs (DATABASE_BINARY_UUIDS)
+- Conversion of the ISO dates and drift ids in search queries
+- Cached experiment lookups with invalidation helpers
+- Atomic partial updates with optimistic concurrency (If-Match revision)
 - Permission-based access control system
 - Pagination utilities for list endpoints
 
@@ -23,13 +31,24 @@ Access Control:
 - Private resources require explicit permission grants
 - Admin users have full access to all resources
 - Permissions can be granted to individual users or groups via entitlements
+- Stored experiments are checked against the materialized ACL (see `acl`),
+  or their embedded permissions while they have no ACL rows
+- API keys grant Edit access only to the experiment they belong to
 """
 
+import copy
+import uuid
 from functools import reduce
 
-from flask import abort, current_app
+from bson.binary import Binary
+from flask import abort, current_app, request
+from pymongo import ReturnDocument
 
-from app.tools import authentication
+from app.tools import acl, authentication
+from app.tools.database import is_timeseries, parse_date, timeseries_meta, utcnow
+
+# Fields stored as BSON dates, compared as dates in search queries
+DATE_FIELDS = {"created_at"}
 
 
 def get_user(user_infos):
@@ -38,7 +57,7 @@ def get_user(user_infos):
     
     Searches for a user record matching the subject (sub) and issuer (iss) claims
     from the JWT token. This links authenticated tokens to registered user accounts
-    in the system.
+    in the system. The record is loaded once per request, see `get_context`.
     
     Args:
         user_infos (dict): User information extracted from JWT token containing:
@@ -61,53 +80,159 @@ def get_user(user_infos):
         user = get_user(user_infos)
         # Returns user record or raises 403 if not registered
     """
-    collection = current_app.config["db"]["app.users"]
-    sub, iss = user_infos["sub"], user_infos["iss"]
-    user = collection.find_one({"subject": sub, "issuer": iss})
-    return user or abort(403, "User not registered.")
+    # Return a copy so callers can modify the record safely
+    return dict(get_context(user_infos).user)
+
+
+def get_context(user_infos, api_key=False):
+    """
+    Return the request authorization context with the registered user loaded.
+
+    The context holds the user entitlements and user/admin flags computed once
+    per request (see `authentication.AuthContext`). The registered user record
+    is added on first use, from the users cache when possible; users not
+    registered are cached for a short time (USERS_CACHE_NEGATIVE_TTL) so
+    repeated unauthorized traffic does not reach the database.
+
+    Requests authenticated with an API key have no registered user. Their
+    context is returned as is when the endpoint accepts API keys.
+
+    Args:
+        user_infos (UserInfos): User information from the access token.
+        api_key (bool, optional): True if the endpoint accepts API keys.
+            Defaults to False.
+
+    Returns:
+        AuthContext: Authorization context with the `user` record loaded.
+
+    Raises:
+        403 Forbidden: If no registered user matches the token information
+            or the request uses an API key and the endpoint does not accept it
+    """
+    context = authentication.get_context(user_infos)
+    if context.api_key:
+        return context if api_key else abort(403, "API keys not accepted.")
+    if context.user is None:
+        context.user = _find_user(user_infos["sub"], user_infos["iss"])
+    return context if context.user else abort(403, "User not registered.")
+
+
+def _find_user(sub, iss):
+    cache = current_app.config["users_cache"]
+    user = cache.get((sub, iss))
+    if user is None:
+        collection = current_app.config["db"]["app.users"]
+        user = collection.find_one({"subject": sub, "issuer": iss}) or {}
+        ttl = None if user else current_app.config["USERS_CACHE_NEGATIVE_TTL"]
+        cache.set((sub, iss), user, ttl=ttl)
+    return user
+
+
+def invalidate_user(sub, iss):
+    """
+    Remove a user from the users cache after it is registered or modified.
+
+    Args:
+        sub (str): Subject claim of the user.
+        iss (str): Issuer claim of the user.
+    """
+    current_app.config["users_cache"].delete((sub, iss))
 
 
-def get_experiment(experiment_id):
+def get_experiment(experiment_id, use_cache=True):
     """
     Retrieve an experiment record from the database by its unique identifier.
     
     Experiments are the top-level containers for drift detection runs and contain
     metadata like name, description, permissions, and public visibility settings.
+    Experiments are read from the experiments cache when possible, so hot
+    experiments receiving many drift requests are fetched once per
+    EXPERIMENTS_CACHE_TTL, and cache hits do not query the database. The
+    worker modifying an experiment invalidates it, in every worker of the
+    node with the shared cache backend, and the other workers may serve
+    the previous version until it expires. Writes are therefore checked
+    against the stored record: experiment updates filter on its `revision`
+    and on experiments not `deleting`, and the deletion job waits for the
+    cached copies to expire before dropping the drifts.
     
     Args:
         experiment_id (str): The unique UUID identifier of the experiment
+        use_cache (bool, optional): False to read the experiment from the
+            database, for example before modifying it. Defaults to True.
         
     Returns:
-        dict: Experiment record containing:
+        dict: Copy of the experiment record, safe to modify, containing:
             - _id: Unique experiment identifier  
             - name: Human-readable experiment name
             - description: Optional experiment description
             - public: Boolean indicating if experiment is publicly accessible
             - permissions: List of permission objects granting access
+            - revision: Number of updates, missing on legacy records
             - created_at: Experiment creation timestamp
             
     Raises:
-        404 Not Found: If no experiment exists with the provided ID
+        404 Not Found: If no experiment exists with the provided ID, or it
+            is being deleted
         
     Example:
         experiment = get_experiment("550e8400-e29b-41d4-a716-446655440000")
         # Returns experiment record or raises 404 if not found
     """
+    cache = current_app.config["experiments_cache"]
+    experiment = cache.get(experiment_id) if use_cache else None
+    if experiment is not None:
+        return copy.deepcopy(experiment)
     collection = current_app.config["db"]["app.experiments"]
     experiment = collection.find_one({"_id": experiment_id})
-    return experiment or abort(404, "Experiment not found.")
+    if experiment is None or experiment.get("deleting"):
+        return abort(404, "Experiment not found.")
+    if use_cache:
+        cache.set(experiment_id, copy.deepcopy(experiment))
+    return experiment
+
+
+def invalidate_experiment(experiment_id):
+    """
+    Remove an experiment from the experiments cache after it is modified.
+
+    Args:
+        experiment_id (str): The unique UUID identifier of the experiment.
+    """
+    current_app.config["experiments_cache"].delete(experiment_id)
 
 
-def get_drifts(experiment_id, drift_id):
+def drift_collection(experiment):
+    """
+    Return the collection storing the drifts of an experiment.
+
+    Experiments have their own `app.{experiment_id}` collection, unless their
+    record sets `drifts_collection` to the shared collection. Shared drifts
+    carry an `experiment_id` field, so the returned scope must be included
+    in every query and document to select the drifts of the experiment.
+
+    Args:
+        experiment (dict): Experiment record, from `get_experiment`.
+
+    Returns:
+        tuple: The drift collection and the scope of the experiment in it,
+        an empty dict for collections of a single experiment.
+    """
+    database = current_app.config["db"]
+    if "drifts_collection" in experiment:
+        return database[experiment["drifts_collection"]], {"experiment_id": experiment["_id"]}
+    return database[f"app.{experiment['_id']}"], {}
+
+
+def get_drifts(experiment, drift_id):
     """
     Retrieve a specific drift detection record from an experiment's collection.
     
-    Each experiment has its own MongoDB collection storing drift detection runs.
-    This function fetches a specific drift record by ID from the appropriate
-    experiment collection.
+    Drifts are stored in the collection of the experiment, or in the shared
+    drifts collection, see `drift_collection`. This function fetches a
+    specific drift record by ID from the appropriate collection.
     
     Args:
-        experiment_id (str): UUID of the parent experiment
+        experiment (dict): Record of the parent experiment
         drift_id (str): UUID of the specific drift record to retrieve
         
     Returns:
@@ -125,26 +250,257 @@ def get_drifts(experiment_id, drift_id):
         404 Not Found: If no drift record exists with the provided ID
         
     Example:
-        drift = get_drifts("exp-uuid", "drift-uuid")
+        drift = get_drifts(get_experiment("exp-uuid"), "drift-uuid")
         # Returns drift record or raises 404 if not found
     """
-    collection = current_app.config["db"][f"app.{experiment_id}"]
-    drift = collection.find_one({"_id": drift_id})
+    collection, scope = drift_collection(experiment)
+    drift = collection.find_one({"_id": drift_key(drift_id), **scope})
     return drift or abort(404, "Drift not found.")
 
 
-def get_permission(resource, user_id, user_infos):
+def to_drift_id(value):
+    """
+    Return a drift id in the representation used to store new drifts.
+
+    Drift ids are stored as 16 bytes BSON UUIDs (binary subtype 4) when
+    DATABASE_BINARY_UUIDS is enabled, and as 36 characters strings
+    otherwise. Binary values are built explicitly, so they do not depend on
+    the `uuidRepresentation` of the client.
+
+    Args:
+        value (str | UUID): The drift id in any representation.
+
+    Returns:
+        Binary | str: The drift id to store.
+    """
+    if current_app.config["DATABASE_BINARY_UUIDS"]:
+        return Binary.from_uuid(uuid.UUID(str(value)))
+    return str(value)
+
+
+def drift_key(value):
+    """
+    Return the `_id` filter matching a drift by its id.
+
+    With DATABASE_BINARY_UUIDS enabled, drifts not migrated yet keep their
+    string ids, so both representations are matched. Both are looked up
+    in the `_id` index.
+
+    Args:
+        value (str | UUID): The drift id in any representation.
+
+    Returns:
+        dict | str: The filter value of the `_id` field.
+    """
+    if current_app.config["DATABASE_BINARY_UUIDS"]:
+        return {"$in": [Binary.from_uuid(uuid.UUID(str(value))), str(value)]}
+    return str(value)
+
+
+def new_drift(json, experiment):
+    """
+    Complete a validated drift payload into a drift record to insert.
+
+    Adds the fields assigned by the server to every new drift, whether it
+    is created alone or as part of a batch, and the fields required by the
+    storage of the experiment, see `drift_collection` and `timeseries_meta`.
+
+    Args:
+        json (dict): Drift payload validated with `schemas.CreateDrift`.
+        experiment (dict): Record of the parent experiment.
+
+    Returns:
+        dict: The same payload with the schema version, creation time,
+        UUID, new unless set by the client, and first revision.
+    """
+    json["schema_version"] = "1.0.0"
+    json["created_at"] = utcnow()
+    json["_id"] = to_drift_id(json.get("_id") or uuid.uuid4())
+    json["revision"] = 1
+    json.update(drift_collection(experiment)[1])
+    if is_timeseries(experiment):
+        json["meta"] = timeseries_meta(json)
+    return json
+
+
+def parse_dates(query):
+    """
+    Convert the ISO 8601 strings compared with date fields into datetimes.
+
+    Dates are stored as BSON dates, which never match a string, so search
+    queries such as `{"created_at": {"$gte": "2024-01-01"}}` are converted
+    before running them. Strings that are not valid dates are kept as is.
+
+    Args:
+        query (dict): MongoDB query from the request body.
+
+    Returns:
+        dict: A copy of the query with the dates converted.
+    """
+    return _parse_fields(query, DATE_FIELDS, lambda value: _parse_values(value, parse_date))
+
+
+def parse_drift_ids(query):
+    """
+    Convert the UUID strings compared with drift ids into BSON UUIDs.
+
+    Only applies when DATABASE_BINARY_UUIDS is enabled, so search queries
+    such as `{"_id": {"$in": [...]}}` match the drifts stored with binary
+    ids. Drifts not migrated yet keep their string ids, so, as in
+    `drift_key`, ids compared for equality, directly or with `$eq`, `$ne`,
+    `$in` and `$nin`, match both representations. Strings that are not
+    valid UUIDs are kept as is.
+
+    Args:
+        query (dict): MongoDB query from the request body.
+
+    Returns:
+        dict: A copy of the query with the drift ids converted.
+    """
+    if not current_app.config["DATABASE_BINARY_UUIDS"]:
+        return query
+    return _parse_fields(query, {"_id"}, _parse_drift_ids)
+
+
+def _parse_drift_ids(value):
+    if isinstance(value, str):
+        ids = _drift_ids([value])
+        return {"$in": ids} if len(ids) > 1 else value
+    if not isinstance(value, dict):
+        return _parse_values(value, _binary_uuid)
+    parsed = {}
+    for key, item in value.items():
+        match key:
+            case "$in" | "$nin" if isinstance(item, list):
+                parsed[key] = _drift_ids(item)
+            case "$eq" if isinstance(item, str) and "$in" not in value:
+                parsed["$in"] = _drift_ids([item])
+            case "$ne" if isinstance(item, str) and "$nin" not in value:
+                parsed["$nin"] = _drift_ids([item])
+            case "$not":
+                parsed[key] = _parse_drift_ids(item)
+            case _:
+                parsed[key] = _parse_values(item, _binary_uuid)
+    return parsed
+
+
+def _drift_ids(values):
+    ids = []
+    for value in values:
+        if isinstance(value, str):
+            try:
+                ids.append(_binary_uuid(value))
+            except ValueError:
+                pass
+        ids.append(value)
+    return ids
+
+
+def _binary_uuid(value):
+    return Binary.from_uuid(uuid.UUID(value))
+
+
+def _parse_fields(query, fields, parse):
+    if isinstance(query, list):
+        return [_parse_fields(item, fields, parse) for item in query]
+    if not isinstance(query, dict):
+        return query
+    return {key: parse(value) if key in fields else _parse_fields(value, fields, parse) for key, value in query.items()}
+
+
+def _parse_values(value, parse):
+    if isinstance(value, list):
+        return [_parse_values(item, parse) for item in value]
+    if isinstance(value, dict):
+        return {key: _parse_values(item, parse) for key, item in value.items()}
+    if isinstance(value, str):
+        try:
+            return parse(value)
+        except ValueError:
+            return value
+    return value
+
+
+def if_match():
+    """
+    Return the revision required by the If-Match header of the request.
+
+    Clients send the `revision` they read from a resource, for example
+    `If-Match: "3"`, so the update is applied only if the resource was not
+    modified since. Records created before revisions existed match 0.
+
+    Returns:
+        int: The required revision, or None if the header is not sent.
+
+    Raises:
+        412 Precondition Failed: If the header is not a revision number
+    """
+    value = request.headers.get("If-Match")
+    if value is None:
+        return None
+    try:
+        return int(value.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        return abort(412, "Invalid If-Match revision.")
+
+
+def patch_document(collection, document_id, update, revision=None, scope=None):
+    """
+    Apply a partial update to a document in a single round trip.
+
+    The update is executed with `find_one_and_update`, which increases the
+    document `revision` and returns the document after the update, so the
+    document is neither read beforehand nor rewritten as a whole.
+
+    Args:
+        collection (Collection): Collection containing the document.
+        document_id (str | dict): The unique UUID identifier of the
+            document, or a filter of its `_id` such as `drift_key`.
+        update (dict): MongoDB update operators such as `$set` and `$push`.
+        revision (int, optional): Revision the document must have, see
+            `if_match`. Defaults to None to update any revision.
+        scope (dict, optional): Extra conditions selecting the document,
+            see `drift_collection`. Defaults to None.
+
+    Returns:
+        dict: The updated document, or None if the document does not exist.
+
+    Raises:
+        412 Precondition Failed: If the document has a different revision
+
+    Example:
+        update = {"$set": {"job_status": "Completed"}}
+        drift = patch_document(drifts, drift_id, update, revision=if_match())
+    """
+    query = {"_id": document_id, **(scope or {})}
+    if revision is not None:
+        query["revision"] = revision or {"$in": [0, None]}
+    update = {**update, "$inc": {"revision": 1}}
+    document = collection.find_one_and_update(
+        query, update, return_document=ReturnDocument.AFTER
+    )
+    if document is None and revision is not None:
+        if collection.count_documents({"_id": document_id, **(scope or {})}, limit=1):
+            abort(412, "Revision does not match.")
+    return document
+
+
+def get_permission(resource, context, permissions=None):
     """
     Determine the highest permission level a user has for a specific resource.
     
-    Analyzes the resource's permission list to find access levels granted to the
-    user either directly or through group entitlements. Returns the most permissive
-    level found using the permission hierarchy.
+    Looks up the user id and each of the user entitlements in the map of
+    permissions of the resource, so the cost depends on the number of user
+    titles and not on the size of the resource permissions list. Returns the
+    most permissive level found using the permission hierarchy.
     
     Args:
         resource (dict): Resource object containing 'permissions' list
-        user_id (str): Unique identifier of the user
-        user_infos (dict): User authentication info containing entitlements
+        context (AuthContext): Request authorization context with the
+            user entitlements and registered user
+        permissions (dict, optional): Map of entity to level of the
+            resource, such as its ACL map. Computed from the resource
+            'permissions' list by default.
         
     Returns:
         str: Highest permission level found:
@@ -157,6 +513,7 @@ def get_permission(resource, user_id, user_infos):
     1. Checks direct user permissions (entity == user_id)
     2. Checks group permissions via entitlements  
     3. Returns the highest level found in the hierarchy
+    4. API keys have Edit permission only on their own experiment
     
     Example:
         resource = {
@@ -165,22 +522,18 @@ def get_permission(resource, user_id, user_infos):
                 {"entity": "admin-group", "level": "Manage"}
             ]
         }
-        level = get_permission(resource, "user123", user_infos) 
+        level = get_permission(resource, context) 
         # Returns "Edit" or "Manage" depending on user's group membership
     """
-    titles = authentication.get_entitlements(user_infos).union({user_id})
-    permissions = resource.get("permissions", [])
-    perms = set(p["level"] for p in permissions if p["entity"] in titles)
-    if "Manage" in perms:  # Top level permission
-        return "Manage"
-    if "Edit" in perms:  # Second level permission
-        return "Edit"
-    if "Read" in perms:  # Third level permission
-        return "Read"
-    return None  # No permission found
+    if context.api_key:
+        return "Edit" if resource.get("_id") == context.api_key["experiment_id"] else None
+    if permissions is None:
+        permissions = acl.permissions_map(resource.get("permissions", []))
+    levels = (permissions[title] for title in context.titles if title in permissions)
+    return max(levels, key=acl.LEVELS.get, default=None)
 
 
-def check_access(resource, user_id, user_infos, level="Read"):
+def check_access(resource, context, level="Read"):
     """
     Verify that a user has sufficient permissions to perform an operation on a resource.
     
@@ -190,8 +543,7 @@ def check_access(resource, user_id, user_infos, level="Read"):
     
     Args:
         resource (dict): Resource object with 'permissions' and optional 'public' fields
-        user_id (str): Unique identifier of the user (None for anonymous)
-        user_infos (dict): User authentication information (None for anonymous)  
+        context (AuthContext): Request authorization context (None for anonymous)
         level (str, optional): Required permission level. Defaults to "Read".
         
     Returns:
@@ -211,20 +563,21 @@ def check_access(resource, user_id, user_infos, level="Read"):
     
     Example:
         # Check if user can edit an experiment
-        check_access(experiment, user_id, user_infos, level="Edit")
+        check_access(experiment, context, level="Edit")
         # Raises 403 if user doesn't have Edit or Manage permissions
         
         # Public resource read access (always succeeds)  
         public_resource = {"public": True}
-        check_access(public_resource, None, None, level="Read")
+        check_access(public_resource, None, level="Read")
     """
     if resource.get("public", False) and level == "Read":
         return True
-    if not user_infos or not authentication.is_user(user_infos):
+    if not context or not (context.is_user or context.api_key):
         return abort(403, "Resource is not public.")
-    if authentication.is_admin(user_infos):
+    if context.is_admin:
         return True
-    match get_permission(resource, user_id, user_infos):
+    permissions = None if context.api_key else acl.get_map(resource)
+    match get_permission(resource, context, permissions):
         case "Manage":
             return True
         case "Edit" if level in ["Read", "Edit"]:
@@ -234,6 +587,32 @@ def check_access(resource, user_id, user_infos, level="Read"):
     return abort(403, "Insufficient permissions.")
 
 
+def access_filter(context):
+    """
+    Return a MongoDB filter matching the experiments a user can read.
+
+    The filter mirrors `check_access` for the Read level so listings can be
+    resolved by the database with the `public` index and the experiments
+    found in the materialized ACL, instead of filtering results afterwards.
+
+    Args:
+        context (AuthContext): Request authorization context (None for anonymous)
+
+    Returns:
+        dict: Filter to combine with the search query, empty for admins.
+
+    Example:
+        query = {"$and": [json, access_filter(context)]}
+        # Matches the experiments in json the user can read
+    """
+    if not context or not context.is_user:
+        return {"public": True}
+    if context.is_admin:
+        return {}
+    experiment_ids = acl.accessible_ids(context.titles)
+    return {"$or": [{"public": True}, {"_id": {"$in": experiment_ids}}]}
+
+
 def pagination_header(page, page_size, total):
     """
     Generate pagination metadata for API list responses.
@@ -1,10 +1,25 @@
 """Testing module for endpoint methods /entitlement."""
 
 # pylint: disable=redefined-outer-name
-from pytest import mark
+import os
+import sqlite3
+import threading
+import time
+from functools import reduce
+from pathlib import Path
+
+from flaat.user_infos import UserInfos
+from pytest import fixture, mark, raises
+from werkzeug.datastructures import Authorization
+
+from app.tools import authentication
+from app.tools.cache import MemoryCache, SQLiteCache
 
 from tests.constants import *
 
+# Every user information fixture, with and without entitlements
+USER_INFOS = sorted(x.stem for x in Path("tests/fixtures/user_infos").glob("*.json"))
+
 
 class CommonBaseTests:
     """Common tests for the /entitlement endpoint."""
@@ -42,3 +57,166 @@ class Entitlements(ValidAuth, Registered):
 
 class TestEmptyRequest(Entitlements):
     """Test the correct exchanges of emails by ids."""
+
+
+class TestTokenCache(Entitlements):
+    """Test the token is validated only once for repeated requests."""
+
+    def test_cached_token(self, response, client, path, request_kwds, accept_authorization):
+        """Test the OP is not contacted again for the same token."""
+        assert client.get(path, **request_kwds).status_code == 200
+        assert accept_authorization.call_count == 1
+
+    def test_counters(self, response, app, client, path, request_kwds):
+        """Test the cache counts a miss for a new token, then hits only."""
+        cache = app.config["auth_cache"]
+        hits, misses = cache.hits, cache.misses
+        assert misses == 1
+        assert client.get(path, **request_kwds).status_code == 200
+        assert cache.hits > hits and cache.misses == misses
+
+
+class TestTokenCacheEviction(Entitlements):
+    """Test the least recently used tokens are evicted from a full cache."""
+
+    @fixture(scope="class", autouse=True)
+    def small_cache(self, app, class_mocker):
+        """Replace the token cache by a cache of a single entry."""
+        class_mocker.patch.dict(app.config, {"auth_cache": MemoryCache(maxsize=1, ttl=300)})
+
+    def test_evicted(self, response, app, client, path, request_kwds, accept_authorization):
+        """Test a token evicted by another one is validated again."""
+        other = {**request_kwds, "auth": Authorization("bearer", token="other-token")}
+        assert client.get(path, **other).status_code == 200
+        assert client.get(path, **other).status_code == 200
+        assert accept_authorization.call_count == 2
+        assert len(app.config["auth_cache"]) == 1
+        assert client.get(path, **request_kwds).status_code == 200
+        assert accept_authorization.call_count == 3
+
+
+class TestAuthContext(Entitlements):
+    """Test the authorization context of a request is computed once."""
+
+    def test_built_once(self, response, client, path, request_kwds, mocker):
+        """Test a request builds a single context."""
+        context = mocker.spy(authentication, "AuthContext")
+        assert client.get(path, **request_kwds).status_code == 200
+        assert context.call_count == 1
+
+
+@mark.usefixtures("local_jwt")
+class TestLocalJWT(Entitlements):
+    """Test tokens verified locally with the issuer JWKS."""
+
+    @fixture(scope="class")
+    def auth(self, local_jwt):
+        """Inject a token signed by the mocked issuer."""
+        return Authorization("bearer", token=local_jwt)
+
+    def test_no_userinfo_call(self, response, accept_authorization):
+        """Test the OP userinfo endpoint is not contacted."""
+        assert accept_authorization.call_count == 0
+
+
+@mark.usefixtures("local_jwt")
+@mark.parametrize("claims", [{"exp": int(time.time()) + 250}], indirect=True)
+class TestTokenExpiration(Entitlements):
+    """Test cached tokens expire with the token, before the cache TTL."""
+
+    @fixture(scope="class")
+    def auth(self, local_jwt):
+        """Inject a token signed by the mocked issuer."""
+        return Authorization("bearer", token=local_jwt)
+
+    def test_expires_with_token(self, response, app, client, path, request_kwds, claims, mocker):
+        """Test the token is cached until its expiration only."""
+        cache, now, left = app.config["auth_cache"], time.monotonic(), claims["exp"] - time.time()
+        assert left < app.config["AUTH_CACHE_TTL"]
+        misses = cache.misses
+        mocker.patch("time.monotonic", return_value=now + left - 5)
+        assert client.get(path, **request_kwds).status_code == 200
+        assert cache.misses == misses
+        mocker.patch("time.monotonic", return_value=now + left + 1)
+        assert client.get(path, **request_kwds).status_code == 200
+        assert cache.misses == misses + 1
+
+
+@mark.usefixtures("shared_cache")
+class TestSharedCache(Entitlements):
+    """Test identity data is shared between workers through SQLite."""
+
+    def test_other_worker(self, response, app, client, path, request_kwds, shared_cache, accept_authorization):
+        """Test a second worker reads the token and user from the cache."""
+        app.config["auth_cache"] = SQLiteCache(shared_cache, "tokens", maxsize=1024, ttl=300)
+        app.config["users_cache"] = SQLiteCache(shared_cache, "users", maxsize=1024, ttl=300)
+        assert client.get(path, **request_kwds).status_code == 200
+        assert accept_authorization.call_count == 1
+        assert app.config["users_cache"].hits == 1
+
+    def test_private_file(self, response, shared_cache):
+        """Test the cache database is only accessible by its owner."""
+        assert os.stat(shared_cache).st_mode & 0o777 == 0o600
+
+    def test_other_owner(self, response, shared_cache, mocker):
+        """Test a cache database owned by another user is refused."""
+        mocker.patch("os.getuid", return_value=os.getuid() + 1)
+        with raises(PermissionError):
+            SQLiteCache(shared_cache, "tokens", maxsize=1024, ttl=300)
+
+    def test_one_connection(self, response, shared_cache, mocker):
+        """Test the threads of a worker share a single connection."""
+        cache = SQLiteCache(shared_cache, "tokens", maxsize=1024, ttl=300)
+        connect = mocker.spy(sqlite3, "connect")
+        threads = [threading.Thread(target=cache.get, args=("key",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert connect.call_count == 1
+        assert cache.misses == 8
+
+    def test_forked_worker(self, response, shared_cache, mocker):
+        """Test a forked worker opens its own connection."""
+        cache = SQLiteCache(shared_cache, "tokens", maxsize=1024, ttl=300)
+        connect = mocker.spy(sqlite3, "connect")
+        cache.get("key")
+        mocker.patch("os.getpid", return_value=os.getpid() + 1)
+        cache.get("key")
+        cache.get("key")
+        assert connect.call_count == 2
+
+
+@mark.parametrize("user_info", USER_INFOS, indirect=True)
+class TestEntitlementChecks:
+    """Test the context checks match the entitlements in the token."""
+
+    @fixture(scope="function")
+    def entitlements_path(self, app, mocker, user_info):
+        """Entitlements path of the provider issuing the user information."""
+        path = "eduperson_entitlement" if "eduperson_entitlement" in user_info else "realm_access/roles"
+        mocker.patch.dict(app.config, {"ENTITLEMENTS_PATH": path, "ENTITLEMENTS_KEYS": tuple(path.split("/"))})
+        return path
+
+    def test_same_checks(self, app, user_info, entitlements_path):
+        """Test the user and admin checks intersect the configured entitlements."""
+        user_infos = UserInfos(access_token_info=None, user_info=user_info, introspection_info=None)
+        roles = reduce(lambda d, k: d.get(k, []), entitlements_path.split("/"), user_info)
+        with app.test_request_context():
+            assert authentication.get_entitlements(user_infos) == set(roles)
+            assert authentication.is_user(user_infos) == bool(set(roles) & set(app.config["USERS_ENTITLEMENTS"]))
+            assert authentication.is_admin(user_infos) == bool(set(roles) & set(app.config["ADMIN_ENTITLEMENTS"]))
+
+    def test_same_context(self, app, user_info, entitlements_path, mocker):
+        """Test the checks of a request reuse the context of its first check."""
+        user_infos = UserInfos(access_token_info=None, user_info=user_info, introspection_info=None)
+        context = mocker.spy(authentication, "AuthContext")
+        with app.test_request_context():
+            app.preprocess_request()
+            first = authentication.get_context(user_infos)
+            authentication.is_user(user_infos), authentication.is_admin(user_infos)
+            assert authentication.get_context(user_infos) is first
+        with app.test_request_context():
+            app.preprocess_request()
+            assert authentication.get_context(user_infos) is not first
+        assert context.call_count == 2
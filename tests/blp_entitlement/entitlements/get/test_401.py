@@ -1,8 +1,10 @@
 """Testing module for endpoint methods /entitlement."""
 
 # pylint: disable=redefined-outer-name
-from pytest import mark
+from pytest import fixture, mark, raises
+from werkzeug.datastructures import Authorization
 
+from app import create_app
 from tests.constants import *
 
 
@@ -35,9 +37,83 @@ class UnknownIdentity(CommonBaseTests):
         assert response.json["message"] == "User identity could not be determined"
 
 
+@mark.parametrize("user_info", ["ai4eosc-read"], indirect=True)
+class LocalJWT(CommonBaseTests):
+    """Tests when the token is verified locally with the issuer JWKS."""
+
+    @fixture(scope="class")
+    def auth(self, local_jwt):
+        """Inject a token signed by the mocked issuer."""
+        return Authorization("bearer", token=local_jwt)
+
+
+@mark.parametrize("claims", [{"exp": 0}], indirect=True)
+class ExpiredToken(LocalJWT):
+    """Test when the locally verified token is expired."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "Could not verify JWT: Signature has expired"
+
+
+@mark.parametrize("claims", [{"iss": "https://untrusted.example.com"}], indirect=True)
+class UntrustedIssuer(LocalJWT):
+    """Test when the token issuer is not in the trusted list."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+
+
+@mark.parametrize("claims", [{"aud": "other-client"}], indirect=True)
+class OtherAudience(LocalJWT):
+    """Test when the token is issued for another client of the issuer."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "Could not verify JWT: Audience doesn't match"
+
+
+@mark.parametrize("claims", [{"aud": None}], indirect=True)
+class MissingAudience(LocalJWT):
+    """Test when the token has no audience."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == 'Could not verify JWT: Token is missing the "aud" claim'
+
+
 class TestMissingToken(NoAuthHeader):
     """Test the /entitlement endpoint with missing token."""
 
 
 class TestInvalidToken(UnknownIdentity):
     """Test the /entitlement endpoint with invalid token."""
+
+
+class TestExpiredToken(ExpiredToken):
+    """Test the /entitlement endpoint with an expired local token."""
+
+
+class TestUntrustedIssuer(UntrustedIssuer):
+    """Test the /entitlement endpoint with an untrusted issuer."""
+
+
+class TestOtherAudience(OtherAudience):
+    """Test the /entitlement endpoint with a token for another audience."""
+
+
+class TestMissingAudience(MissingAudience):
+    """Test the /entitlement endpoint with a token without audience."""
+
+
+class TestAudienceRequired:
+    """Test local JWT verification is not enabled without audience."""
+
+    def test_startup_error(self):
+        """Test the application does not start without audience."""
+        with raises(ValueError, match="AUTH_JWT_AUDIENCE is required"):
+            create_app(TESTING=True, AUTH_LOCAL_JWT=True, AUTH_JWT_AUDIENCE=[])
@@ -0,0 +1,24 @@
+"""Testing module for endpoint methods /api-key/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class")
+def path(request, experiment_id, api_key_id):
+    """Return the path for the request."""
+    if hasattr(request, "param") and request.param:
+        return request.param
+    return f"/experiment/{experiment_id}/api-key/{api_key_id}"
+
+
+@fixture(scope="class")
+def api_key_id(request):
+    """Return API key id from request param."""
+    return request.param if hasattr(request, "param") else None
+
+
+@fixture(scope="module")
+def collection(database):
+    """Return a collection connection to the database."""
+    return database["app.api_keys"]
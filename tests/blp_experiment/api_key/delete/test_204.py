@@ -1,4 +1,4 @@
-"""Testing module for endpoint methods /experiment."""
+"""Testing module for endpoint methods /api-key/<id>."""
 
 # pylint: disable=redefined-outer-name
 from pytest import mark
@@ -7,7 +7,7 @@ from tests.constants import *
 
 
 class CommonBaseTests:
-    """Common tests for the /experiment/<id> endpoint."""
+    """Common tests for the /api-key/<id> endpoint."""
 
     def test_status_code(self, response):
         """Test the 204 response."""
@@ -19,9 +19,15 @@ class CommonBaseTests:
 class WithDatabase(CommonBaseTests):
     """Base class for tests using database."""
 
-    def test_not_in_database(self, db_experiment):
-        """Test the response items are in the database."""
-        assert db_experiment is None
+    def test_not_in_database(self, response, collection, api_key_id):
+        """Test the API key is removed from the database."""
+        assert collection.find_one({"_id": api_key_id}) is None
+
+    def test_key_revoked(self, response, client, experiment_id):
+        """Test the API key is no longer accepted."""
+        path = f"/experiment/{experiment_id}/drift"
+        revoked = client.post(path, json={}, headers={"Authorization": f"Bearer {API_KEYS[0]}"})
+        assert revoked.status_code == 401, revoked.json
 
 
 @mark.parametrize("auth", ["mock-token"], indirect=True)
@@ -35,6 +41,7 @@ class CanManage(ValidAuth, WithDatabase):
     """Base class for group with manage entitlement tests."""
 
 
+@mark.parametrize("api_key_id", API_KEY_IDS, indirect=True)
 @mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
 class TestGroupWithManage(CanManage):
     """Test when group has manage rights on the experiment."""
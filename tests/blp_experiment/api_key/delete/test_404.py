@@ -0,0 +1,54 @@
+"""Testing module for endpoint methods /api-key/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /api-key/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 404 response."""
+        assert response.status_code == 404
+        assert response.json["code"] == 404
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", CAN_MANAGE, indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+@mark.parametrize("api_key_id", API_KEY_IDS, indirect=True)
+class TestOtherExperiment(CanManage):
+    """Test when the API key belongs to other experiment."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Not Found"
+        assert response.json["message"] == "API key not found."
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("api_key_id", UNKNOWN_API_KEY_IDS, indirect=True)
+class TestUnknownKey(CanManage):
+    """Test when the API key does not exist."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Not Found"
+        assert response.json["message"] == "API key not found."
@@ -0,0 +1,18 @@
+"""Testing module for endpoint methods /api-key."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class")
+def path(request, experiment_id):
+    """Return the path for the request."""
+    if hasattr(request, "param") and request.param:
+        return request.param
+    return f"/experiment/{experiment_id}/api-key"
+
+
+@fixture(scope="module")
+def collection(database):
+    """Return a collection connection to the database."""
+    return database["app.api_keys"]
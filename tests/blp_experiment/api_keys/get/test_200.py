@@ -0,0 +1,60 @@
+"""Testing module for endpoint methods /api-key."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /api-key endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+
+    def test_no_secrets(self, response):
+        """Test the response items do not include keys or hashes."""
+        for item in response.json:
+            assert "key" not in item
+            assert "hash" not in item
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_items(self, response, collection, experiment_id):
+        """Test the response items are the experiment API keys."""
+        items = collection.find({"experiment_id": experiment_id})
+        assert sorted(x["id"] for x in response.json) == sorted(x["_id"] for x in items)
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", CAN_MANAGE, indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class TestWithKeys(CanManage):
+    """Test the listing of an experiment with API keys."""
+
+    def test_length(self, response):
+        """Test the response includes the experiment key."""
+        assert [x["id"] for x in response.json] == API_KEY_IDS
+
+
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+class TestWithoutKeys(CanManage):
+    """Test the listing of an experiment without API keys."""
+
+    def test_length(self, response):
+        """Test the response is empty."""
+        assert response.json == []
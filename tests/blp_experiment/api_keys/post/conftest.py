@@ -0,0 +1,26 @@
+"""Testing module for endpoint methods /api-key."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class", name="response")
+def request(client, path, request_kwds):
+    """Create a request object."""
+    yield client.post(path, **request_kwds)
+
+
+@fixture(scope="class")
+def body(request, name):
+    """Inject and return a request body."""
+    kwds = request.param.copy() if hasattr(request, "param") else {}
+    if not isinstance(kwds, dict):
+        return kwds  # Return the body as is
+    kwds.update({"name": name} if name is not None else {})
+    return kwds if kwds else None
+
+
+@fixture(scope="class")
+def name(request):
+    """Inject and return an API key name."""
+    return request.param if hasattr(request, "param") else "ci_pipeline"
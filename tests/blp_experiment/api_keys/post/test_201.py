@@ -0,0 +1,73 @@
+"""Testing module for endpoint methods /api-key."""
+
+# pylint: disable=redefined-outer-name
+from datetime import datetime as dt
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from app.tools import apikeys
+from tests.constants import *
+
+
+@fixture(scope="class")
+def db_api_key(response, collection):
+    """Return the item from the database."""
+    return collection.find_one({"_id": response.json["id"]})
+
+
+class CommonBaseTests:
+    """Common tests for the /api-key endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 201 response."""
+        assert response.status_code == 201
+
+    def test_api_key_id(self, response):
+        """Test the response item have correct id."""
+        assert UUID(response.json["id"]).version == 4
+
+    def test_datetime(self, response):
+        """Test the response item has a correct date."""
+        assert dt.fromisoformat(response.json["created_at"])
+
+    def test_key(self, response):
+        """Test the response item includes the key and not its hash."""
+        assert apikeys.is_api_key(response.json["key"])
+        assert "hash" not in response.json
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_hash_in_database(self, response, db_api_key):
+        """Test only the key hash is stored in the database."""
+        assert db_api_key["hash"] == apikeys.hash_key(response.json["key"])
+        assert response.json["key"] not in db_api_key.values()
+
+    def test_experiment(self, response, db_api_key, experiment_id):
+        """Test the key is bound to the experiment."""
+        assert response.json["experiment_id"] == experiment_id
+        assert db_api_key["experiment_id"] == experiment_id
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class IsPrivate(WithDatabase):
+    """Base class for group with public as false."""
+
+
+@mark.parametrize("user_info", CAN_MANAGE, indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+class TestGroupWithManage(IsPrivate, CanManage):
+    """Test when group has manage rights on the experiment."""
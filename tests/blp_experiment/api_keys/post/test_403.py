@@ -0,0 +1,60 @@
+"""Testing module for endpoint methods /api-key."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /api-key endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class IsPrivate(WithDatabase):
+    """Base class for group with public as false."""
+
+
+@mark.parametrize("user_info", NO_MANAGE, indirect=True)
+class PermissionDenied(ValidAuth):
+    """Tests for message response when user does not have permission."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class WithApiKey(CommonBaseTests):
+    """Tests for message response when authenticated with an API key."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "API keys not accepted."
+
+
+class TestNoAccessPrivate(PermissionDenied, IsPrivate):
+    """Tests for message response for no permission."""
+
+
+class TestApiKey(WithApiKey, IsPrivate):
+    """Tests that API keys cannot create other API keys."""
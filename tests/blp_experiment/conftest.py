@@ -1,8 +1,13 @@
 """Testing module for endpoint methods /experiment."""
 
 # pylint: disable=redefined-outer-name
+from uuid import UUID
+
+from bson.binary import Binary
 from pytest import fixture
 
+from tests.utils import api_dates
+
 
 @fixture(scope="class")
 def experiment_id(request):
@@ -17,6 +22,8 @@ def db_experiment(response, database, experiment_id):
     item = database["app.experiments"].find_one({"_id": _id})
     if item is not None:
         item["id"] = item.pop("_id")
+        item.pop("drifts_collection", None)  # Storage field, not in responses
+        item = api_dates(item)
     return item
 
 
@@ -27,10 +34,28 @@ def drift_id(request):
 
 
 @fixture(scope="class")
-def db_drift(response, database, experiment_id, drift_id):
+def drift_collection(database, experiment_id):
+    """Return the collection with the drifts of the experiment."""
+    experiment = database["app.experiments"].find_one({"_id": experiment_id}) or {}
+    return database[experiment.get("drifts_collection", f"app.{experiment_id}")]
+
+
+@fixture(scope="class")
+def db_drift(response, drift_collection, experiment_id, drift_id):
     """Return the item from the database."""
-    _id = drift_id or response.json["id"]
-    item = database[f"app.{experiment_id}"].find_one({"_id": _id})
+    _id = str(drift_id or response.json["id"])
+    keys = [_id, Binary.from_uuid(UUID(_id))]  # Drift ids may be binary
+    query = {"_id": {"$in": keys}, "experiment_id": {"$in": [experiment_id, None]}}
+    item = drift_collection.find_one(query)
     if item is not None:
-        item["id"] = item.pop("_id")
+        stored_id = item.pop("_id")
+        item.pop("meta", None)  # Time-series field, not in responses
+        item.pop("experiment_id", None)  # Shared collection field
+        if "parameters_id" in item:  # Offloaded to the side collection
+            record = drift_collection.database["app.parameters"].find_one(
+                {"_id": item.pop("parameters_id")}
+            )
+            item["parameters"] = record["parameters"]
+        item["id"] = str(UUID(bytes=stored_id)) if isinstance(stored_id, bytes) else stored_id
+        item = api_dates(item)
     return item
@@ -1,8 +1,9 @@
 """Testing module for endpoint methods /drift."""
 
 # pylint: disable=redefined-outer-name
-from pytest import mark
+from pytest import fixture, mark
 
+from app.tools import parameters
 from tests.constants import *
 
 
@@ -39,3 +40,24 @@ class CanEdit(ValidAuth, WithDatabase):
 @mark.parametrize("drift_id", DRIFTS, indirect=True)
 class TestUserWithEdit(CanEdit, WithDatabase):
     """Test when user has edit rights on the experiment."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000002"], indirect=True)
+class TestOffloadedParameters(ValidAuth, WithDatabase):
+    """Test deleting a record with parameters stored apart."""
+
+    @fixture(scope="class", autouse=True)
+    def offloaded(self, app, class_mocker, with_context, with_database, database, experiment_id, drift_id):
+        """Offload the parameters of the drift before deleting it."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 0})
+        drifts = database[f"app.{experiment_id}"]
+        stored, record = parameters.split(drifts.find_one({"_id": drift_id}), experiment_id)
+        drifts.replace_one({"_id": drift_id}, stored)
+        parameters.save(record)
+        return record["_id"]
+
+    def test_parameters_deleted(self, response, database, offloaded):
+        """Test the offloaded parameters are deleted with the drift."""
+        assert database["app.parameters"].find_one({"_id": offloaded}) is None
@@ -2,10 +2,15 @@
 
 # pylint: disable=redefined-outer-name
 from datetime import datetime as dt
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from pytest import mark
+from bson.binary import Binary
+from mongomock.database import Database
+from pytest import fixture, mark
 
+from app.tools import acl, migrations
+from app.tools.database import SHARED_DRIFTS, utcnow
+from app.tools.migrations import COPIED_KEY, MOVING_KEY, migrate_drift_ids, migrate_shared_drifts, migrate_timeseries
 from tests.constants import *
 
 
@@ -76,3 +81,238 @@ class TestWithAccess(IsPrivate, CanRead, WithDatabase):
 @mark.parametrize("drift_id", DRIFTS, indirect=True)
 class TestPublic(IsPublic, NoAuthHeader, WithDatabase):
     """Test the responses items when the drift is public."""
+
+
+class WithoutAcl(CommonBaseTests):
+    """Base class for tests with experiments not indexed in the ACL."""
+
+    @fixture(scope="class", autouse=True)
+    def without_acl(self, with_database, database, experiment_id):
+        """Remove the ACL rows, as after upgrading from a version without them."""
+        database["app.acl"].delete_many({"experiment_id": experiment_id})
+
+    def test_build_missing(self, response, database, experiment_id):
+        """Test the ACL is built at startup only when it has no rows."""
+        assert acl.build_missing(database) == 0
+        database["app.acl"].delete_many({})
+        assert acl.build_missing(database) == database["app.experiments"].count_documents({})
+        assert database["app.acl"].count_documents({"experiment_id": experiment_id}) > 0
+
+
+class WithBinaryUuids(CommonBaseTests):
+    """Base class for tests with drift ids stored as BSON UUIDs."""
+
+    @fixture(scope="class", autouse=True)
+    def binary_uuids(self, app, class_mocker):
+        """Enable the binary drift ids."""
+        class_mocker.patch.dict(app.config, {"DATABASE_BINARY_UUIDS": True})
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestWithoutAcl(IsPrivate, CanRead, WithDatabase, WithoutAcl):
+    """Test the response when the experiment has no ACL rows."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestNotMigrated(IsPrivate, CanRead, WithDatabase, WithBinaryUuids):
+    """Test the drifts with string ids are found with binary ids enabled."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestMigrated(IsPublic, NoAuthHeader, WithDatabase, WithBinaryUuids):
+    """Test the drifts are found after migrating their ids."""
+
+    @fixture(scope="class", autouse=True)
+    def migrated(self, with_database, database, experiment_id):
+        """Migrate the drift ids of the experiment, with idempotency keys."""
+        drifts = database[f"app.{experiment_id}"]
+        for drift in drifts.find({}, {"_id": 1}):
+            drifts.update_one({"_id": drift["_id"]}, {"$set": {"idempotency_key": f"key-{drift['_id']}"}})
+        drift = drifts.find_one_and_update(  # Interrupted after copying a drift
+            {"_id": {"$ne": DRIFTS[0]}},
+            {"$rename": {"idempotency_key": MOVING_KEY}},
+            return_document=True,
+        )
+        drifts.insert_one({**drift, "_id": Binary.from_uuid(UUID(drift["_id"]))})
+        return migrate_drift_ids(drifts)
+
+    def test_migrated(self, response, migrated, database, experiment_id):
+        """Test the drift ids are stored as binary UUIDs."""
+        assert migrated == (10, [])
+        assert database[f"app.{experiment_id}"].count_documents({"_id": {"$type": "string"}}) == 0
+
+    def test_idempotency_keys(self, response, migrated, database, experiment_id):
+        """Test the drifts keep their idempotency keys."""
+        for drift in database[f"app.{experiment_id}"].find():
+            assert drift["idempotency_key"] == f"key-{drift['_id'].as_uuid()}"
+            assert MOVING_KEY not in drift
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestTimeseries(IsPrivate, CanRead, WithDatabase):
+    """Test the drifts are found after moving them to time-series."""
+
+    @fixture(scope="class", autouse=True)
+    def migrated(self, with_database, database, experiment_id, class_mocker):
+        """Move the drifts of the experiment to a time-series collection."""
+        create = Database.create_collection  # Time-series not in mongomock
+
+        def side_effect(self, name, **_):
+            return create(self, name)
+
+        class_mocker.patch.object(Database, "create_collection", autospec=True, side_effect=side_effect)
+        return migrate_timeseries(database, experiment_id)
+
+    def test_migrated(self, response, migrated, database, experiment_id):
+        """Test the drifts are moved with their meta field."""
+        assert migrated == (10, 0)
+        assert f"app.{experiment_id}.standard" not in database.list_collection_names()
+        assert database[f"app.{experiment_id}"].count_documents({"meta": {"$exists": False}}) == 0
+        experiment = database["app.experiments"].find_one({"_id": experiment_id})
+        assert experiment["storage"] == "timeseries"
+        assert experiment["revision"] == 1  # Updates with the previous revision fail
+
+    def test_id_index(self, response, migrated, database, experiment_id):
+        """Test the drifts are indexed by id, not done by time-series."""
+        indexes = database[f"app.{experiment_id}"].index_information().values()
+        assert any(list(x["key"]) == [("_id", 1)] for x in indexes if x.get("name") != "_id_")
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestSharedDrifts(IsPublic, NoAuthHeader, WithDatabase, WithBinaryUuids):
+    """Test the drifts are found after moving them to the shared collection."""
+
+    @fixture(scope="class", autouse=True)
+    def migrated(self, with_database, database, experiment_id):
+        """Move the drifts of the experiment to the shared collection."""
+        return migrate_shared_drifts(database, experiment_id)
+
+    def test_migrated(self, response, migrated, database, experiment_id):
+        """Test the drifts are moved with their experiment id."""
+        assert migrated == (10, 0)
+        assert f"app.{experiment_id}" not in database.list_collection_names()
+        assert database[SHARED_DRIFTS].count_documents({"experiment_id": experiment_id}) == 10
+        assert database[SHARED_DRIFTS].count_documents({COPIED_KEY: {"$exists": True}}) == 0
+        experiment = database["app.experiments"].find_one({"_id": experiment_id})
+        assert experiment["drifts_collection"] == SHARED_DRIFTS
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithWritesDuringCopy:
+    """Base class for shared drifts migrations while drifts are written."""
+
+    writes = 1  # Copy passes writing a new drift to the experiment collection
+    deletes = 0  # Copy passes deleting a drift from the experiment collection
+
+    @fixture(scope="class")
+    def experiment_id(self, database):
+        """Experiment with drifts copied from another one, with new ids."""
+        experiment_id, drifts = str(uuid4()), database["app.00000000-0000-0001-0001-000000000003"].find()
+        database["app.experiments"].insert_one({"_id": experiment_id, "name": experiment_id, "created_at": utcnow()})
+        database[f"app.{experiment_id}"].insert_many([{**x, "_id": str(uuid4())} for x in drifts])
+        return experiment_id
+
+    @fixture(scope="class")
+    def at_switch(self, class_mocker, database, experiment_id):
+        """Write drifts during the copy, return the drifts counts at switch time."""
+        copy_drifts, source = migrations.copy_drifts, database[f"app.{experiment_id}"]
+        writes, deletes, counts = iter(range(self.writes)), iter(range(self.deletes)), {}
+
+        def copy_and_write(*args):
+            result = copy_drifts(*args)
+            if next(writes, None) is not None:  # Written after the pass read them
+                source.insert_one({**source.find_one({}, {COPIED_KEY: 0}), "_id": str(uuid4())})
+            if next(deletes, None) is not None:  # Deleted after the pass copied them
+                source.delete_one({})
+            return result
+
+        def sleep(_):
+            drifts = database[SHARED_DRIFTS].count_documents({"experiment_id": experiment_id})
+            counts.update(shared=drifts, source=source.count_documents({}))
+            counts.update(self.after_switch(database, experiment_id))
+
+        class_mocker.patch.object(migrations, "copy_drifts", side_effect=copy_and_write)
+        class_mocker.patch.object(migrations.time, "sleep", side_effect=sleep)
+        return counts
+
+    def after_switch(self, database, experiment_id):
+        """Requests to the experiment after it is switched, return their details."""
+        return {}
+
+    @fixture(scope="class")
+    def migrated(self, at_switch, database, experiment_id):
+        """Move the drifts of the experiment to the shared collection."""
+        return migrate_shared_drifts(database, experiment_id)
+
+
+class TestWrittenDuringCopy(WithWritesDuringCopy):
+    """Test the drifts written during the copy are moved before switching."""
+
+    def test_migrated(self, migrated, database, experiment_id):
+        """Test every drift is moved and the experiment switched."""
+        assert migrated == (10, 0)
+        assert f"app.{experiment_id}" not in database.list_collection_names()
+        experiment = database["app.experiments"].find_one({"_id": experiment_id})
+        assert experiment["drifts_collection"] == SHARED_DRIFTS
+        assert experiment["revision"] == 1  # Updates with the previous revision fail
+
+    def test_complete_at_switch(self, migrated, at_switch):
+        """Test the shared collection holds every drift when switched."""
+        assert at_switch == {"shared": 10, "source": 10}
+
+
+class TestWrittenFasterThanCopied(WithWritesDuringCopy):
+    """Test an experiment is not switched while its copies miss drifts."""
+
+    writes = migrations.COPY_PASSES
+
+    def test_not_switched(self, migrated, database, experiment_id):
+        """Test the experiment keeps its collection, with every drift."""
+        assert migrated == (9 + migrations.COPY_PASSES - 1, 1)
+        assert database[f"app.{experiment_id}"].count_documents({}) == 9 + migrations.COPY_PASSES
+        assert "drifts_collection" not in database["app.experiments"].find_one({"_id": experiment_id})
+
+    def test_no_wait(self, migrated, at_switch):
+        """Test the migration stops before switching."""
+        assert at_switch == {}
+
+
+class TestDeletedDuringCopy(WithWritesDuringCopy):
+    """Test the drifts deleted during the copy are removed before switching."""
+
+    writes, deletes = 0, 1
+
+    def test_migrated(self, migrated, database, experiment_id):
+        """Test the remaining drifts are moved and the experiment switched."""
+        assert migrated == (9, 0)
+        assert database[SHARED_DRIFTS].count_documents({"experiment_id": experiment_id}) == 8
+        assert "drifts_collection" in database["app.experiments"].find_one({"_id": experiment_id})
+
+    def test_complete_at_switch(self, migrated, at_switch):
+        """Test the shared collection holds only the remaining drifts when switched."""
+        assert at_switch == {"shared": 8, "source": 8}
+
+
+class TestDeletedAfterSwitch(WithWritesDuringCopy):
+    """Test the drifts deleted after the switch are not copied back."""
+
+    writes = 0
+
+    def after_switch(self, database, experiment_id):
+        """Delete a drift through the API and write one with a cached copy."""
+        source = database[f"app.{experiment_id}"]
+        deleted = database[SHARED_DRIFTS].find_one({"experiment_id": experiment_id})
+        database[SHARED_DRIFTS].delete_one({"_id": deleted["_id"]})
+        source.insert_one({**source.find_one({}, {COPIED_KEY: 0}), "_id": str(uuid4())})
+        return {"deleted": deleted["_id"]}
+
+    def test_migrated(self, migrated, database, experiment_id):
+        """Test the drift written after the switch is moved too."""
+        assert migrated == (10, 0)
+        assert f"app.{experiment_id}" not in database.list_collection_names()
+        assert database[SHARED_DRIFTS].count_documents({"experiment_id": experiment_id}) == 9
+
+    def test_not_restored(self, migrated, at_switch, database):
+        """Test the drift deleted from the shared collection stays deleted."""
+        assert database[SHARED_DRIFTS].find_one({"_id": at_switch["deleted"]}) is None
@@ -1,8 +1,10 @@
 """Testing module for endpoint methods /drift."""
 
 # pylint: disable=redefined-outer-name
-from pytest import mark
+from pymongo import ReturnDocument
+from pytest import fixture, mark
 
+from app.tools import acl
 from tests.constants import *
 
 
@@ -57,6 +59,34 @@ class PermissionDenied(ValidAuth):
         assert response.json["message"] == "Insufficient permissions."
 
 
+@mark.parametrize("user_info", ["ai4eosc-read"], indirect=True)
+class RevokedElsewhere(ValidAuth):
+    """Base class for tests with the permission revoked through another worker."""
+
+    sync = True  # If the ACL rows of the new revision are written
+
+    @fixture(scope="class", autouse=True)
+    def revoked(self, app, accept_authorization, with_database, client, path, request_kwds, database, experiment_id):
+        """Cache the ACL map, then revoke the read permission as another worker would."""
+        assert client.get(path, **request_kwds).status_code == 200
+        experiments, previous = database["app.experiments"], database["app.experiments"].find_one(experiment_id)
+        entity = "urn:mace:egi.eu:group:vo_example1:role=read#x.0"
+        update = {"$pull": {"permissions": {"entity": entity}}, "$inc": {"revision": 1}}
+        experiment = experiments.find_one_and_update({"_id": experiment_id}, update, return_document=ReturnDocument.AFTER)
+        if self.sync:
+            acl.sync(experiment, database)
+        app.config["experiments_cache"].delete(experiment_id)  # Invalidated by the shared cache
+        yield
+        experiments.replace_one({"_id": experiment_id}, previous)
+        acl.sync(previous, database)
+        app.config["experiments_cache"].delete(experiment_id)
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
 @mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
 class IsPrivate(CommonBaseTests):
     """Base class for group with public as false."""
@@ -77,6 +107,33 @@ class TestNoAccessPrivate(PermissionDenied, IsPrivate, WithDatabase):
     """Tests for message response for no permission."""
 
 
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestNoAccessWithoutAcl(PermissionDenied, IsPrivate, WithDatabase):
+    """Tests for no permission when the experiment has no ACL rows."""
+
+    @fixture(scope="class", autouse=True)
+    def without_acl(self, with_database, database, experiment_id):
+        """Remove the ACL rows, as after upgrading from a version without them."""
+        database["app.acl"].delete_many({"experiment_id": experiment_id})
+
+
 @mark.parametrize("drift_id", DRIFTS, indirect=True)
 class TestMissingToken(NoAuthHeader, IsPrivate, WithDatabase):
     """Test the response when no token and is public."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestRevokedElsewhere(RevokedElsewhere, IsPrivate, WithDatabase):
+    """Test the cached ACL map of a previous revision is not used."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestRevokedWithoutRows(RevokedElsewhere, IsPrivate, WithDatabase):
+    """Test the embedded permissions are used when the ACL rows are not written."""
+
+    sync = False
+
+    def test_previous_rows(self, response, database, experiment_id):
+        """Test the ACL rows still grant the revoked permission."""
+        rows = database["app.acl"].find({"experiment_id": experiment_id})
+        assert "urn:mace:egi.eu:group:vo_example1:role=read#x.0" in [x["entity"] for x in rows]
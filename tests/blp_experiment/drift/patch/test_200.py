@@ -0,0 +1,162 @@
+"""Testing module for endpoint methods /drift."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from app.tools import parameters
+from tests.constants import *
+
+# Parameters larger than the maximum size of inline parameters in tests
+BIN_EDGES = {"bin_edges": [0.1 * i for i in range(20)]}
+
+
+class CommonBaseTests:
+    """Common tests for the /drift endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+
+    def test_subset(self, response, body):
+        """Test the response includes the updated fields."""
+        for key, value in body.items():
+            if key != "add_tags":
+                assert response.json[key] == value
+
+    def test_fields_kept(self, response):
+        """Test the fields not sent are kept in the response."""
+        assert response.json["schema_version"] == "1.0.0"
+        assert "created_at" in response.json
+        assert "job_status" in response.json
+        assert "model" in response.json
+        assert "parameters" in response.json
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, db_drift):
+        """Test the response items are in the database."""
+        assert db_drift is not None
+        assert response.json == db_drift
+
+    def test_revision(self, response):
+        """Test the response item revision is increased."""
+        assert response.json["revision"] == 1
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class CanEdit(ValidAuth, WithDatabase):
+    """Base class for group with edit entitlement tests."""
+
+
+@mark.parametrize("body", [{"job_status": "Failed"}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000001"], indirect=True)
+class TestChangeStatus(CanEdit):
+    """Test changing only the status of the drift."""
+
+
+@mark.parametrize("body", [{"add_tags": ["new_tag"]}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000002"], indirect=True)
+class TestAddTags(CanEdit):
+    """Test appending tags to the drift."""
+
+    def test_new_tags(self, response):
+        """Test the response items have the appended tags."""
+        assert response.json["tags"][-1] == "new_tag"
+        assert len(response.json["tags"]) > 1
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": '"0"'}}], indirect=True)
+@mark.parametrize("body", [{"model": "model_b", "drift_detected": False}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000003"], indirect=True)
+class TestIfMatch(CanEdit):
+    """Test updating a record without revision with If-Match 0."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+@mark.parametrize("body", [{"parameters": {"p_value": 0.2}}], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000004"], indirect=True)
+class TestApiKey(WithDatabase):
+    """Test the endpoint authenticated with the experiment API key."""
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": '"0"'}}], indirect=True)
+@mark.parametrize("body", [{"job_status": "Failed"}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000005"], indirect=True)
+class TestBinaryUuids(CanEdit):
+    """Test updating a record with string id when binary ids are enabled."""
+
+    @fixture(scope="class", autouse=True)
+    def binary_uuids(self, app, class_mocker):
+        """Enable the binary drift ids."""
+        class_mocker.patch.dict(app.config, {"DATABASE_BINARY_UUIDS": True})
+
+
+class WithParametersMaxsize(CommonBaseTests):
+    """Base class for tests with a small maximum size of inline parameters."""
+
+    @fixture(scope="class", autouse=True)
+    def parameters_maxsize(self, app, class_mocker):
+        """Reduce the maximum size of inline parameters."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 64})
+
+
+class WithOffloadedParameters(WithParametersMaxsize):
+    """Base class for tests on records with parameters stored apart."""
+
+    @fixture(scope="class", autouse=True)
+    def offloaded(self, parameters_maxsize, with_context, with_database, database, experiment_id, drift_id):
+        """Offload the parameters of the drift before the update."""
+        drifts = database[f"app.{experiment_id}"]
+        drift = {**drifts.find_one({"_id": drift_id}), "parameters": BIN_EDGES}
+        stored, record = parameters.split(drift, experiment_id)
+        drifts.replace_one({"_id": drift_id}, stored)
+        parameters.save(record)
+
+
+@mark.parametrize("body", [{"parameters": BIN_EDGES}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000006"], indirect=True)
+class TestOffloadParameters(CanEdit, WithParametersMaxsize):
+    """Test updating a record with large parameters."""
+
+    def test_offloaded(self, response, database, experiment_id, drift_id):
+        """Test the parameters are stored apart from the drift."""
+        drift = database[f"app.{experiment_id}"].find_one({"_id": drift_id})
+        assert "parameters" not in drift
+        record = database["app.parameters"].find_one({"_id": drift["parameters_id"]})
+        assert record["parameters"] == BIN_EDGES
+
+
+@mark.parametrize("body", [{"drift_detected": False}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000007"], indirect=True)
+class TestOffloadedKept(CanEdit, WithOffloadedParameters):
+    """Test updating other fields of a record with offloaded parameters."""
+
+    def test_parameters(self, response):
+        """Test the response includes the offloaded parameters."""
+        assert response.json["parameters"] == BIN_EDGES
+
+
+@mark.parametrize("body", [{"parameters": {"p_value": 0.2}}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000008"], indirect=True)
+class TestInlineParameters(CanEdit, WithOffloadedParameters):
+    """Test updating a record with offloaded parameters to small ones."""
+
+    def test_inline(self, response, database, experiment_id, drift_id):
+        """Test the parameters are stored back in the drift."""
+        drift = database[f"app.{experiment_id}"].find_one({"_id": drift_id})
+        assert drift["parameters"] == {"p_value": 0.2}
+        assert "parameters_id" not in drift
+        record_id = parameters.parameters_id(experiment_id, drift_id)
+        assert database["app.parameters"].find_one({"_id": record_id}) is None
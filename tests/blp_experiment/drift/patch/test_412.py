@@ -0,0 +1,58 @@
+"""Testing module for endpoint methods /drift."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 412 response."""
+        assert response.status_code == 412
+        assert response.json["code"] == 412
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class CanEdit(WithDatabase):
+    """Base class for tests with edit permissions."""
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": '"0"'}}], indirect=True)
+@mark.parametrize("body", [{"job_status": "Failed"}], indirect=True)
+class TestConcurrentUpdate(CanEdit):
+    """Test the second update sent with the same revision is rejected."""
+
+    @fixture(scope="class")
+    def first(self, client, path, request_kwds):
+        """Update the drift with the same revision before the test."""
+        return client.patch(path, **{**request_kwds, "json": {"model": "model_x"}})
+
+    @fixture(scope="class")
+    def response(self, client, path, request_kwds, first):
+        """Update the drift after the first update."""
+        return client.patch(path, **request_kwds)
+
+    def test_first_applied(self, response, first, db_drift):
+        """Test only the first update is stored in the database."""
+        assert first.status_code == 200
+        assert db_drift["model"] == "model_x"
+        assert db_drift["job_status"] != "Failed"
+        assert db_drift["revision"] == 1
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Precondition Failed"
+        assert response.json["message"] == "Revision does not match."
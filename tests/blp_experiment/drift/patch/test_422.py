@@ -0,0 +1,63 @@
+"""Testing module for endpoint methods /drift."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 422 response."""
+        assert response.status_code == 422
+        assert response.json["code"] == 422
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, db_drift):
+        """Test the drift is not modified in the database."""
+        assert "revision" not in db_drift
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class CanEdit(WithDatabase):
+    """Base class for tests with edit permissions."""
+
+
+@mark.parametrize("body", [{"job_status": "Unknown"}], indirect=True)
+class TestBadStatus(CanEdit):
+    """Test the response message for a wrong job status."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert "job_status" in response.json["errors"]["json"]
+
+
+@mark.parametrize("body", [{"tags": [], "add_tags": ["tag"]}], indirect=True)
+class TestReplaceAndAdd(CanEdit):
+    """Test the response when replacing and appending tags."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["add_tags"] == ["Cannot be used together with tags."]
+
+
+@mark.parametrize("body", [{"schema_version": "2.0.0"}], indirect=True)
+class TestUnknownField(CanEdit):
+    """Test the response message for unknown key in body."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["schema_version"] == ["Unknown field."]
@@ -0,0 +1,89 @@
+"""Testing module for endpoint methods /drift/parameters."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from app.tools import parameters
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/parameters endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+
+    def test_only_parameters(self, response):
+        """Test the response contains only the parameters."""
+        assert list(response.json) == ["parameters"]
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, db_drift):
+        """Test the response parameters are the drift parameters."""
+        assert db_drift is not None
+        assert response.json["parameters"] == db_drift["parameters"]
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("auth", [None], indirect=True)
+class NoAuthHeader:
+    """Tests when missing authentication header."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class IsPrivate(CommonBaseTests):
+    """Base class for group with public as false."""
+
+
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+class IsPublic(CommonBaseTests):
+    """Base class for group with public as true."""
+
+
+@mark.parametrize("user_info", CAN_READ, indirect=True)
+class CanRead(ValidAuth):
+    """Base class for group with read entitlement tests."""
+
+
+class WithOffloadedParameters(CommonBaseTests):
+    """Base class for tests with parameters stored apart."""
+
+    @fixture(scope="class", autouse=True)
+    def offloaded(self, app, class_mocker, with_context, with_database, database, experiment_id, drift_id):
+        """Offload the parameters of the drift."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 0})
+        drifts = database[f"app.{experiment_id}"]
+        stored, record = parameters.split(drifts.find_one({"_id": drift_id}), experiment_id)
+        drifts.replace_one({"_id": drift_id}, stored)
+        parameters.save(record)
+
+    def test_offloaded(self, response, database, experiment_id, drift_id):
+        """Test the drift is stored without parameters."""
+        drift = database[f"app.{experiment_id}"].find_one({"_id": drift_id})
+        assert "parameters" not in drift and "parameters_id" in drift
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestWithAccess(IsPrivate, CanRead, WithDatabase):
+    """Test the response when user has access."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestPublic(IsPublic, NoAuthHeader, WithDatabase):
+    """Test the response when the drift is public."""
+
+
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestOffloaded(IsPrivate, CanRead, WithDatabase, WithOffloadedParameters):
+    """Test the response when the parameters are offloaded."""
@@ -0,0 +1,10 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class", name="response")
+def request(client, path, request_kwds):
+    """Create a request object."""
+    yield client.post(path, **request_kwds)
@@ -0,0 +1,69 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/status endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 204 response."""
+        assert response.status_code == 204
+
+    def test_no_body(self, response):
+        """Test the response does not return the drift."""
+        assert response.data == b""
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, db_drift, body):
+        """Test the transition is saved in the database."""
+        for key, value in body.items():
+            assert db_drift[key] == value
+
+    def test_fields_kept(self, response, db_drift):
+        """Test the fields not sent are kept in the database."""
+        assert db_drift["schema_version"] == "1.0.0"
+        assert "created_at" in db_drift
+        assert "model" in db_drift
+
+    def test_revision(self, response, db_drift):
+        """Test the drift revision is increased."""
+        assert db_drift["revision"] == 1
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class CanEdit(ValidAuth, WithDatabase):
+    """Base class for group with edit entitlement tests."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class WithApiKey(WithDatabase):
+    """Base class for tests authenticated with an API key."""
+
+
+@mark.parametrize("body", [{"job_status": "Completed", "drift_detected": False}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000009"], indirect=True)
+class TestCompleted(CanEdit):
+    """Test a running drift transitioned to Completed."""
+
+
+@mark.parametrize("body", [{"job_status": "Failed", "parameters": {"error": "timeout"}}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000010"], indirect=True)
+class TestFailed(WithApiKey):
+    """Test a running drift transitioned to Failed with an API key."""
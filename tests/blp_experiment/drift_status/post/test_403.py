@@ -0,0 +1,48 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/status endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+@mark.parametrize("body", [{"job_status": "Completed"}], indirect=True)
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, response, db_drift):
+        """Test the drift is not modified in the database."""
+        assert db_drift["job_status"] == "Running"
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", NO_EDIT, indirect=True)
+class PermissionDenied(ValidAuth):
+    """Tests for message response when user does not have permission."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000009"], indirect=True)
+class TestNoAccessPrivate(PermissionDenied, WithDatabase):
+    """Tests for message response for no permission."""
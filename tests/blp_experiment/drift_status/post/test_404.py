@@ -0,0 +1,49 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/status endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 404 response."""
+        assert response.status_code == 404
+        assert response.json["code"] == 404
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("body", [{"job_status": "Completed"}], indirect=True)
+class CanEdit(WithDatabase):
+    """Base class for tests with edit permissions."""
+
+
+@mark.parametrize("experiment_id", UNKNOWN_EXPS, indirect=True)
+@mark.parametrize("drift_id", DRIFTS, indirect=True)
+class TestExperimentNotInDB(CanEdit):
+    """Test the response when the experiment does not exist."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["message"] == "Experiment not found."
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", UNKNWON_DRIFTS, indirect=True)
+class TestDriftNotInDB(CanEdit):
+    """Test the response when the drift does not exist."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["message"] == "Drift not found."
@@ -0,0 +1,50 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/status endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 409 response."""
+        assert response.status_code == 409
+        assert response.json["code"] == 409
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Conflict"
+        assert response.json["message"] == "Invalid status transition."
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, response, db_drift):
+        """Test the drift is not modified in the database."""
+        assert "revision" not in db_drift
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class CanEdit(WithDatabase):
+    """Base class for tests with edit permissions."""
+
+
+@mark.parametrize("body", [{"job_status": "Failed"}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000001"], indirect=True)
+class TestFromCompleted(CanEdit):
+    """Test a completed drift cannot be transitioned again."""
+
+
+@mark.parametrize("body", [{"job_status": "Completed"}], indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000007"], indirect=True)
+class TestFromFailed(CanEdit):
+    """Test a failed drift cannot be transitioned again."""
@@ -0,0 +1,63 @@
+"""Testing module for endpoint methods /drift/status."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/status endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 422 response."""
+        assert response.status_code == 422
+        assert response.json["code"] == 422
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, response, db_drift):
+        """Test the drift is not modified in the database."""
+        assert db_drift["job_status"] == "Running"
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("drift_id", ["00000000-0000-0000-0000-000000000009"], indirect=True)
+class CanEdit(WithDatabase):
+    """Base class for tests with edit permissions."""
+
+
+@mark.parametrize("body", [{"job_status": "Running"}], indirect=True)
+class TestBadStatus(CanEdit):
+    """Test the response message for a status that is not final."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert "job_status" in response.json["errors"]["json"]
+
+
+@mark.parametrize("body", [{"drift_detected": True}], indirect=True)
+class TestMissingStatus(CanEdit):
+    """Test the response message when the status is missing."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["job_status"] == ["Missing data for required field."]
+
+
+@mark.parametrize("body", [{"job_status": "Completed", "model": "other"}], indirect=True)
+class TestUnknownField(CanEdit):
+    """Test the response message for unknown key in body."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["model"] == ["Unknown field."]
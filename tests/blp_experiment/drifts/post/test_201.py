@@ -1,11 +1,15 @@
 """Testing module for endpoint methods /drift."""
 
 # pylint: disable=redefined-outer-name
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 from uuid import UUID
 
-from pytest import mark
+from bson.binary import Binary
+from pytest import fixture, mark
 
+from app.tools.database import SHARED_DRIFTS
+from app.tools.writebehind import GroupCommit
 from tests.constants import *
 
 
@@ -121,3 +125,206 @@ class TestConcept(WithConceptDrift, IsPrivate, CanEdit):
 
 class TestData(WithDataDrift, IsPrivate, CanEdit):
     """Test the endpoint with data drift."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class WithApiKey(CommonBaseTests):
+    """Base class for tests authenticated with an API key."""
+
+
+class TestApiKey(V100Drift, IsPrivate, WithApiKey):
+    """Test the endpoint authenticated with the experiment API key."""
+
+
+class WithWriteBehind(CommonBaseTests):
+    """Base class for tests with grouped drift inserts."""
+
+    @fixture(scope="class", autouse=True)
+    def drifts_writer(self, app, class_mocker):
+        """Enable the write-behind mode with a long linger."""
+        writer = GroupCommit(max_size=3, max_linger=0.5)
+        class_mocker.patch.dict(app.config, {"drifts_writer": writer})
+        yield writer
+        writer.close()
+
+
+class TestWriteBehind(V100Drift, IsPrivate, CanEdit, WithWriteBehind):
+    """Test the endpoint with write-behind inserts."""
+
+
+@mark.parametrize("model", ["model_grouped"], indirect=True)
+class TestGroupCommit(IsPrivate, CanEdit, WithWriteBehind):
+    """Test concurrent requests are written in a single batch."""
+
+    @fixture(scope="class")
+    def responses(self, client, path, request_kwds, database, experiment_id, class_mocker):
+        """Send concurrent requests, as many as the batch size."""
+        collection = database[f"app.{experiment_id}"]
+        spy = class_mocker.spy(type(collection), "insert_many")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            calls = [executor.submit(client.post, path, **request_kwds) for _ in range(3)]
+            return [call.result() for call in calls], spy
+
+    @fixture(scope="class")
+    def response(self, responses):
+        """Return the first response."""
+        return responses[0][0]
+
+    def test_all_created(self, responses):
+        """Test all the concurrent requests are created."""
+        assert [x.status_code for x in responses[0]] == [201, 201, 201]
+
+    def test_single_batch(self, responses):
+        """Test the drifts are written with a single insert."""
+        assert responses[1].call_count == 1
+        assert len(responses[1].call_args.args[1]) == 3
+
+
+class Replayed(CommonBaseTests):
+    """Base class for tests retrying the same creation."""
+
+    @fixture(scope="class")
+    def replayed(self, client, path, request_kwds, response):
+        """Send the request again, after the first response."""
+        return client.post(path, **request_kwds)
+
+    def test_first_not_replayed(self, response):
+        """Test the first response is not marked as replayed."""
+        assert "Idempotent-Replayed" not in response.headers
+
+    def test_replayed(self, replayed):
+        """Test the retried response is marked as replayed."""
+        assert replayed.status_code == 201
+        assert replayed.headers["Idempotent-Replayed"] == "true"
+
+    def test_same_drift(self, response, replayed):
+        """Test the retried response returns the original drift."""
+        assert replayed.json == response.json
+
+    def test_single_drift(self, response, replayed, drift_collection):
+        """Test a single drift is stored for both requests."""
+        keys = [response.json["id"], Binary.from_uuid(UUID(response.json["id"]))]
+        assert drift_collection.count_documents({"_id": {"$in": keys}}) == 1
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("request_kwds", [{"headers": {"Idempotency-Key": "retry-1"}}], indirect=True)
+class TestIdempotencyKey(V100Drift, IsPrivate, ValidAuth, Replayed):
+    """Test the endpoint retried with an idempotency key."""
+
+    def test_key(self, response):
+        """Test the response item has the idempotency key."""
+        assert response.json["idempotency_key"] == "retry-1"
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("body", [{"id": "00000000-0000-4000-8000-000000000001"}], indirect=True)
+class TestClientId(V100Drift, IsPrivate, ValidAuth, Replayed):
+    """Test the endpoint retried with a drift id set by the client."""
+
+    def test_drift_id(self, response):
+        """Test the response item has the client id."""
+        assert response.json["id"] == "00000000-0000-4000-8000-000000000001"
+
+
+class WithBinaryUuids(CommonBaseTests):
+    """Base class for tests with drift ids stored as BSON UUIDs."""
+
+    @fixture(scope="class", autouse=True)
+    def binary_uuids(self, app, class_mocker):
+        """Enable the binary drift ids."""
+        class_mocker.patch.dict(app.config, {"DATABASE_BINARY_UUIDS": True})
+
+    def test_binary_id(self, response, database, experiment_id):
+        """Test the drift id is stored as a binary UUID."""
+        _id = Binary.from_uuid(UUID(response.json["id"]))
+        assert database[f"app.{experiment_id}"].find_one({"_id": _id}) is not None
+
+
+class TestBinaryUuids(V100Drift, IsPrivate, CanEdit, WithBinaryUuids):
+    """Test the endpoint with binary drift ids."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("body", [{"id": "00000000-0000-4000-8000-000000000002"}], indirect=True)
+class TestBinaryClientId(V100Drift, IsPrivate, ValidAuth, Replayed, WithBinaryUuids):
+    """Test the endpoint retried with a client id and binary drift ids."""
+
+
+class WithTimeseries(CommonBaseTests):
+    """Base class for tests on experiments with time-series storage."""
+
+    @fixture(scope="class", autouse=True)
+    def timeseries(self, with_database, database, experiment_id):
+        """Switch the experiment to time-series storage."""
+        experiments = database["app.experiments"]
+        experiments.update_one({"_id": experiment_id}, {"$set": {"storage": "timeseries"}})
+        yield
+        experiments.update_one({"_id": experiment_id}, {"$unset": {"storage": ""}})
+
+    def test_meta(self, response, database, experiment_id):
+        """Test the drift is stored with the time-series meta field."""
+        drift = database[f"app.{experiment_id}"].find_one({"_id": response.json["id"]})
+        assert drift["meta"] == {"model": drift["model"], "tags": drift["tags"]}
+
+
+class TestTimeseries(V100Drift, IsPrivate, CanEdit, WithTimeseries):
+    """Test the endpoint with time-series storage."""
+
+
+class WithSharedDrifts(CommonBaseTests):
+    """Base class for tests on experiments with shared drift storage."""
+
+    @fixture(scope="class", autouse=True)
+    def shared_drifts(self, with_database, database, experiment_id):
+        """Switch the experiment to the shared drift collection."""
+        experiments = database["app.experiments"]
+        update = {"drifts_collection": SHARED_DRIFTS}
+        experiments.update_one({"_id": experiment_id}, {"$set": update})
+        yield
+        experiments.update_one({"_id": experiment_id}, {"$unset": update})
+
+    def test_shared(self, response, database, experiment_id):
+        """Test the drift is stored in the shared collection."""
+        drift = database[SHARED_DRIFTS].find_one({"_id": response.json["id"]})
+        assert drift["experiment_id"] == experiment_id
+        assert database[f"app.{experiment_id}"].find_one({"_id": response.json["id"]}) is None
+
+
+class TestSharedDrifts(V100Drift, IsPrivate, CanEdit, WithSharedDrifts):
+    """Test the endpoint with shared drift storage."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("request_kwds", [{"headers": {"Idempotency-Key": "retry-1"}}], indirect=True)
+class TestSharedIdempotencyKey(V100Drift, IsPrivate, ValidAuth, Replayed, WithSharedDrifts):
+    """Test the endpoint retried with an idempotency key and shared storage."""
+
+
+class WithOffloadedParameters(CommonBaseTests):
+    """Base class for tests with parameters larger than the inline size."""
+
+    @fixture(scope="class", autouse=True)
+    def parameters_maxsize(self, app, class_mocker):
+        """Reduce the maximum size of inline parameters."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 64})
+
+    def test_offloaded(self, response, database, experiment_id):
+        """Test the parameters are stored apart from the drift."""
+        drift = database[f"app.{experiment_id}"].find_one({"_id": response.json["id"]})
+        assert "parameters" not in drift
+        record = database["app.parameters"].find_one({"_id": drift["parameters_id"]})
+        assert record["experiment_id"] == experiment_id
+        assert record["parameters"] == response.json["parameters"]
+
+
+@mark.parametrize("parameters", [{"bin_edges": [0.1 * i for i in range(20)]}], indirect=True)
+class TestOffloadedParameters(V100Drift, IsPrivate, CanEdit, WithOffloadedParameters):
+    """Test the endpoint with large parameters."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+@mark.parametrize("request_kwds", [{"headers": {"Idempotency-Key": "retry-3"}}], indirect=True)
+@mark.parametrize("parameters", [{"bin_edges": [0.1 * i for i in range(20)]}], indirect=True)
+class TestOffloadedReplayed(V100Drift, IsPrivate, ValidAuth, Replayed, WithOffloadedParameters):
+    """Test the endpoint retried with large parameters."""
@@ -52,3 +52,17 @@ class TestMissingToken(NoAuthHeader, IsPrivate):
 
 class TestInvalidToken(UnknownIdentity, IsPrivate):
     """Test the /experiment endpoint with invalid token."""
+
+
+@mark.parametrize("auth", UNKNOWN_API_KEYS, indirect=True)
+class UnknownApiKey(CommonBaseTests):
+    """Test when the API key provided is unknown."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "Invalid API key."
+
+
+class TestUnknownApiKey(UnknownApiKey, IsPrivate, WithDatabase):
+    """Test the /experiment endpoint with an unknown API key."""
@@ -70,3 +70,18 @@ class TestNoAccessPublic(PermissionDenied, IsPublic, WithDatabase):
 @mark.parametrize("parameters", [{"p_value": 0.1}], indirect=True)
 class TestNoAccessPrivate(PermissionDenied, IsPrivate, WithDatabase):
     """Tests for message response for no permission."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class OtherExperimentKey(CommonBaseTests):
+    """Tests for message response when the API key is for other experiment."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
+@mark.parametrize("parameters", [{"p_value": 0.1}], indirect=True)
+class TestOtherExperimentKey(OtherExperimentKey, IsPublic, WithDatabase):
+    """Tests for message response for API key of other experiment."""
@@ -0,0 +1,75 @@
+"""Testing module for endpoint methods /drift."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 409 response."""
+        assert response.status_code == 409
+        assert response.json["code"] == 409
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class IsPrivate(WithDatabase):
+    """Base class for group with public as false."""
+
+
+@mark.parametrize("user_info", CAN_EDIT, indirect=True)
+class CanEdit(ValidAuth, WithDatabase):
+    """Base class for group with edit entitlement tests."""
+
+
+@mark.parametrize("body", [{"id": DRIFTS[0]}], indirect=True)
+@mark.parametrize("request_kwds", [{"headers": {"Idempotency-Key": "other-key"}}], indirect=True)
+class IdConflict(WithDatabase):
+    """Test the drift id exists with a different idempotency key."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Conflict"
+        assert response.json["message"] == "Drift id conflict."
+
+
+class TestIdConflict(IdConflict, IsPrivate, CanEdit):
+    """Test the conflict when the drift id is already used."""
+
+
+@mark.parametrize("request_kwds", [{"headers": {"Idempotency-Key": "key-1"}}], indirect=True)
+class IdempotentTimeseries(WithDatabase):
+    """Test an idempotent creation on time-series storage."""
+
+    @fixture(scope="class", autouse=True)
+    def timeseries(self, with_database, database, experiment_id):
+        """Switch the experiment to time-series storage."""
+        experiments = database["app.experiments"]
+        experiments.update_one({"_id": experiment_id}, {"$set": {"storage": "timeseries"}})
+        yield
+        experiments.update_one({"_id": experiment_id}, {"$unset": {"storage": ""}})
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Conflict"
+        message = "Idempotent creation not supported by time-series storage."
+        assert response.json["message"] == message
+
+
+class TestIdempotentTimeseries(IdempotentTimeseries, IsPrivate, CanEdit):
+    """Test the conflict when retrying creations on time-series storage."""
@@ -1,12 +1,18 @@
 """Testing module for endpoint methods /drift."""
 
 # pylint: disable=redefined-outer-name
+import json
 from datetime import datetime as dt
 from datetime import timezone as tz
 from uuid import UUID
 
-from pytest import mark
+from bson.binary import Binary
+from pytest import fixture, mark
 
+from app.tools import parameters
+from app.tools.database import SHARED_DRIFTS
+from app.tools.migrations import migrate_shared_drifts
+from app.tools.pagination import decode_cursor, keyset_filter
 from tests.constants import *
 
 
@@ -206,3 +212,236 @@ class TestV100ConceptFilter(NoAuthHeader, IsPublic, ConceptFilter):
 
 class TestV100DataFilter(NoAuthHeader, IsPublic, DataFilter):
     """Test the responses items."""
+
+
+class SharedStorage(WithDatabase):
+    """Base class for tests with shared drift storage."""
+
+    @fixture(scope="class", autouse=True)
+    def shared_drifts(self, with_database, database, experiment_id):
+        """Move the drifts to the shared collection, next to other drifts."""
+        migrate_shared_drifts(database, experiment_id)
+        drifts = database[SHARED_DRIFTS]
+        other = {**drifts.find_one(), "_id": "other", "experiment_id": PRIVATE_EXPS[0]}
+        drifts.replace_one({"_id": "other"}, other, upsert=True)
+
+
+class WithSharedDrifts(SharedStorage):
+    """Test the response items with shared drift storage."""
+
+    def test_experiment_scope(self, response):
+        """Test the response items are the drifts of the experiment."""
+        assert len(response.json) == 10
+        assert all(x["id"] != "other" for x in response.json)
+
+
+class TestSharedDrifts(NoAuthHeader, IsPublic, WithSharedDrifts):
+    """Test the responses items from the shared collection."""
+
+
+class WithOffloadedParameters(WithDatabase):
+    """Test the response items with parameters stored apart."""
+
+    @fixture(scope="class", autouse=True)
+    def offloaded(self, app, class_mocker, with_context, with_database, drift_collection, experiment_id):
+        """Offload the parameters of all the drifts of the experiment."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 0})
+        query = {"experiment_id": {"$in": [experiment_id, None]}}
+        for drift in drift_collection.find(query):
+            stored, record = parameters.split(drift, experiment_id)
+            drift_collection.replace_one({"_id": drift["_id"]}, stored)
+            parameters.save(record)
+
+    def test_offloaded(self, response, drift_collection, experiment_id):
+        """Test the drifts are stored without parameters."""
+        query = {"experiment_id": {"$in": [experiment_id, None]}}
+        assert all("parameters" not in x for x in drift_collection.find(query))
+
+
+class TestOffloadedParameters(NoAuthHeader, IsPublic, WithOffloadedParameters):
+    """Test the responses items with offloaded parameters."""
+
+    def test_parameters(self, response, database, experiment_id):
+        """Test the response items include the offloaded parameters."""
+        for item in response.json:
+            record_id = parameters.parameters_id(experiment_id, item["id"])
+            record = database["app.parameters"].find_one({"_id": record_id})
+            assert item["parameters"] == record["parameters"]
+
+
+@mark.parametrize("query", [{"exclude_parameters": True}], indirect=True)
+class ExcludeParameters(WithDatabase):
+    """Test the response items without parameters."""
+
+    def test_no_parameters(self, response):
+        """Test the response items do not include parameters."""
+        assert response.json
+        assert all("parameters" not in x for x in response.json)
+
+
+class TestExcludeParameters(NoAuthHeader, IsPublic, ExcludeParameters):
+    """Test the responses items excluding inline parameters."""
+
+
+class TestExcludeOffloaded(NoAuthHeader, IsPublic, ExcludeParameters, WithOffloadedParameters):
+    """Test the responses items excluding offloaded parameters."""
+
+
+@mark.parametrize("query", [{"page_size": 3}], indirect=True)
+@mark.parametrize("sort_by", ["created_at", "job_status", "drift_detected"], indirect=True)
+@mark.parametrize("order_by", ["asc", "desc"], indirect=True)
+class CursorPages(WithDatabase):
+    """Test the response items read page by page with cursors."""
+
+    @fixture(scope="class")
+    def pages(self, client, path, request_kwds, response):
+        """Follow the next cursors from the first page to the last one."""
+        pages, query = [response], request_kwds["query_string"]
+        while cursor := json.loads(pages[-1].headers["X-Pagination"])["next_cursor"]:
+            kwds = {**request_kwds, "query_string": {**query, "cursor": cursor}}
+            pages.append(client.post(path, **kwds))
+        return pages
+
+    @fixture(scope="class")
+    def listing(self, client, path, request_kwds):
+        """Return all the items in a single page."""
+        kwds = {**request_kwds, "query_string": {**request_kwds["query_string"], "page_size": 100}}
+        return client.post(path, **kwds).json
+
+    def test_pages(self, pages):
+        """Test the pages after the first one are read with cursors."""
+        assert len(pages) > 1
+        assert all(page.status_code == 200 for page in pages)
+        assert all(len(page.json) <= 3 for page in pages)
+
+    def test_cursor_header(self, pages):
+        """Test the pages read with cursors report only the next cursor."""
+        assert all(list(json.loads(page.headers["X-Pagination"])) == ["next_cursor"] for page in pages[1:])
+
+    def test_all_items(self, pages, listing):
+        """Test each item is returned once, in the order of a single page."""
+        assert [x["id"] for page in pages for x in page.json] == [x["id"] for x in listing]
+
+
+class TestCursorPages(NoAuthHeader, IsPublic, CursorPages):
+    """Test the responses items read with cursors."""
+
+
+class MixedIds(WithDatabase):
+    """Base class for tests with binary and string drift ids."""
+
+    @fixture(scope="class", autouse=True)
+    def mixed_ids(self, with_database, drift_collection, experiment_id):
+        """Store the id of half of the drifts as a binary UUID, the others as a string."""
+        query = {"experiment_id": {"$in": [experiment_id, None]}}
+        for index, drift in enumerate(list(drift_collection.find(query).sort("created_at", 1))):
+            drift_id = str(drift["_id"].as_uuid()) if isinstance(drift["_id"], Binary) else drift["_id"]
+            drift_collection.delete_one({"_id": drift["_id"]})
+            binary = index % 2 == 0
+            drift_collection.insert_one({**drift, "_id": Binary.from_uuid(UUID(drift_id)) if binary else drift_id})
+
+
+class TestCursorMixedIds(NoAuthHeader, IsPublic, CursorPages, MixedIds):
+    """Test the responses items read with cursors, with binary and string ids."""
+
+
+class IdFilter(MixedIds):
+    """Test the response items selected by id, with binary and string ids."""
+
+    selector = staticmethod(lambda ids: {"$in": ids[:2] + ids[-2:]})
+
+    @fixture(scope="class", autouse=True)
+    def binary_uuids(self, app, class_mocker):
+        """Enable the binary drift ids, with drifts not migrated yet."""
+        class_mocker.patch.dict(app.config, {"DATABASE_BINARY_UUIDS": True})
+
+    @fixture(scope="class")
+    def drift_ids(self, mixed_ids, drift_collection, experiment_id):
+        """Ids of the drifts of the experiment, the binary ones first."""
+        drifts = drift_collection.find({"experiment_id": {"$in": [experiment_id, None]}}, {"_id": 1})
+        ids = [x["_id"] for x in drifts]
+        return [str(x.as_uuid()) for x in ids if isinstance(x, Binary)] + [x for x in ids if isinstance(x, str)]
+
+    @fixture(scope="class")
+    def body(self, drift_ids):
+        """Search the drifts by id."""
+        return {"_id": self.selector(drift_ids)}
+
+    def test_selected(self, response, drift_ids):
+        """Test the response items are the selected drifts."""
+        assert {x["id"] for x in response.json} == {x for x in drift_ids if self.matches(x, drift_ids)}
+
+    def matches(self, drift_id, drift_ids):
+        """Return whether the selector matches a drift id."""
+        return drift_id in self.selector(drift_ids)["$in"]
+
+
+class TestIdFilter(NoAuthHeader, IsPublic, IdFilter):
+    """Test the responses items with ids in a list."""
+
+
+class TestIdExclusion(NoAuthHeader, IsPublic, IdFilter):
+    """Test the responses items with ids not in a list."""
+
+    selector = staticmethod(lambda ids: {"$nin": ids[:2] + ids[-2:]})
+
+    def matches(self, drift_id, drift_ids):
+        return drift_id not in self.selector(drift_ids)["$nin"]
+
+
+class TestIdEquality(NoAuthHeader, IsPublic, IdFilter):
+    """Test the responses items with an id, stored as a string."""
+
+    selector = staticmethod(lambda ids: ids[-1])
+
+    def matches(self, drift_id, drift_ids):
+        return drift_id == drift_ids[-1]
+
+
+class TestIdNotEqual(NoAuthHeader, IsPublic, IdFilter):
+    """Test the responses items without an id, stored as a string."""
+
+    selector = staticmethod(lambda ids: {"$ne": ids[-1]})
+
+    def matches(self, drift_id, drift_ids):
+        return drift_id != drift_ids[-1]
+
+
+@mark.parametrize("query", [{"page_size": 3}], indirect=True)
+@mark.parametrize("sort_by", ["created_at", "drift_detected"], indirect=True)
+@mark.parametrize("order_by", ["asc", "desc"], indirect=True)
+class CursorIndexes(WithDatabase):
+    """Test the ranges after a cursor are served by the drift indexes."""
+
+    def test_sort_index(self, response, drift_collection, sort_by, order_by):
+        """Test an index provides the sort, after the experiment equality."""
+        direction = 1 if order_by == "asc" else -1
+        prefix = [("experiment_id", 1)] if drift_collection.name == SHARED_DRIFTS else []
+        keys = [[(f, int(d)) for f, d in x["key"]] for x in drift_collection.index_information().values()]
+        sort = [(sort_by, direction), ("_id", direction)]
+        assert any(key in (prefix + sort, prefix + [(f, -d) for f, d in sort]) for key in keys)
+
+    def test_keyset_ranges(self, response, sort_by):
+        """Test each branch of the cursor filter only bounds the sort keys."""
+        cursor = decode_cursor(json.loads(response.headers["X-Pagination"])["next_cursor"])
+        for branch in keyset_filter(cursor)["$or"]:
+            assert _fields(branch) <= {sort_by, "_id"}
+
+
+def _fields(query):
+    """Return the fields constrained by a query."""
+    fields = set()
+    for key, value in query.items():
+        if key in ("$and", "$or"):
+            fields.update(*[_fields(x) for x in value])
+        else:
+            fields.add(key)
+    return fields
+
+
+class TestCursorIndexes(NoAuthHeader, IsPublic, CursorIndexes):
+    """Test the cursor ranges of drift collections are indexed."""
+
+
+class TestCursorSharedIndexes(NoAuthHeader, IsPublic, CursorIndexes, SharedStorage):
+    """Test the cursor ranges of the shared collection are indexed."""
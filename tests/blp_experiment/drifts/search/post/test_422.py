@@ -3,6 +3,7 @@
 # pylint: disable=redefined-outer-name
 from pytest import mark
 
+from app.tools.pagination import encode_cursor
 from tests.constants import *
 
 
@@ -59,9 +60,41 @@ class InvalidQuery(CommonBaseTests):
         assert error == ["Unknown field."]
 
 
+@mark.parametrize("query", [{"cursor": "not-a-cursor"}], indirect=True)
+class InvalidCursor(CommonBaseTests):
+    """Test the cursor parameter with an invalid value."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        error = response.json["errors"]["query"]["cursor"]
+        assert error == ["Invalid cursor."]
+
+
+@mark.parametrize(
+    "query",
+    [{"cursor": encode_cursor("model", "asc", {"_id": DRIFTS[0], "model": "model_1"})}],
+    indirect=True,
+)
+class CursorOtherSort(CommonBaseTests):
+    """Test the cursor parameter of a search with other sorting."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        error = response.json["errors"]["query"]["cursor"]
+        assert error == ["Cursor of a search with other sorting."]
+
+
 class TestStringBody(InvalidInput, IsPublic, WithDatabase):
     """Test the response when body is a string."""
 
 
+class TestInvalidCursor(InvalidCursor, IsPublic, WithDatabase):
+    """Test the response when the cursor is not valid."""
+
+
+class TestCursorOtherSort(CursorOtherSort, IsPublic, WithDatabase):
+    """Test the response when the cursor has other sorting."""
+
+
 # class TestUnknownQuery(InvalidQuery, IsPublic, WithDatabase):
 #     """Test the response when query arg is unknown."""
@@ -0,0 +1,21 @@
+"""Testing module for endpoint methods /drift/batch."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class", name="response")
+def request(client, path, request_kwds):
+    """Create a request object."""
+    yield client.post(path, **request_kwds)
+
+
+@fixture(scope="class")
+def body(request):
+    """Inject and return a request body, a list of drifts."""
+    if hasattr(request, "param"):
+        return request.param
+    return [
+        {"job_status": "Completed", "model": "model_a", "drift_detected": False},
+        {"job_status": "Running", "model": "model_b", "drift_detected": True},
+    ]
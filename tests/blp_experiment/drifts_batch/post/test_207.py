@@ -0,0 +1,148 @@
+"""Testing module for endpoint methods /drift/batch."""
+
+# pylint: disable=redefined-outer-name
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from tests.constants import *
+
+# Parameters larger than the maximum size of inline parameters in tests
+BIN_EDGES = {"bin_edges": [0.1 * i for i in range(20)]}
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/batch endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 207 response."""
+        assert response.status_code == 207
+
+    def test_items_order(self, response, body):
+        """Test the response has one result per item in order."""
+        assert [x["index"] for x in response.json["items"]] == list(range(len(body)))
+
+    def test_counts(self, response, body):
+        """Test the response counts add up to the batch size."""
+        assert response.json["created"] + response.json["failed"] == len(body)
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, database, experiment_id, body):
+        """Test the created items are in the database."""
+        collection = database[f"app.{experiment_id}"]
+        for result in response.json["items"]:
+            if result["status"] == 201:
+                drift = collection.find_one({"_id": result["id"]})
+                assert drift["model"] == body[result["index"]]["model"]
+                assert drift["schema_version"] == "1.0.0"
+                assert drift["revision"] == 1
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class IsPrivate(WithDatabase):
+    """Base class for group with public as false."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class CanEdit(ValidAuth, WithDatabase):
+    """Base class for group with edit entitlement tests."""
+
+
+class TestAllValid(IsPrivate, CanEdit):
+    """Test the endpoint with valid drifts only."""
+
+    def test_all_created(self, response):
+        """Test all the items are created."""
+        assert response.json["failed"] == 0
+        for result in response.json["items"]:
+            assert result["status"] == 201
+            assert UUID(result["id"]).version == 4
+
+
+@mark.parametrize(
+    "body",
+    [
+        [
+            {"job_status": "Completed", "model": "model_c", "drift_detected": False},
+            {"job_status": "Unknown", "model": "model_d", "drift_detected": False},
+            {"model": "model_e", "drift_detected": True, "unknown": "val"},
+            {"job_status": "Failed", "model": "model_f", "drift_detected": True},
+        ]
+    ],
+    indirect=True,
+)
+class TestPartialFailure(IsPrivate, CanEdit):
+    """Test the endpoint with some invalid drifts."""
+
+    def test_statuses(self, response):
+        """Test only the valid items are created."""
+        assert [x["status"] for x in response.json["items"]] == [201, 422, 422, 201]
+        assert response.json["created"] == 2
+
+    def test_error_msg(self, response):
+        """Test the rejected items contain useful information."""
+        errors = [x["errors"] for x in response.json["items"] if x["status"] == 422]
+        assert "job_status" in errors[0]
+        assert errors[1]["unknown"] == ["Unknown field."]
+        assert errors[1]["job_status"] == ["Missing data for required field."]
+
+    def test_not_saved(self, response, database, experiment_id):
+        """Test the rejected items are not in the database."""
+        collection = database[f"app.{experiment_id}"]
+        assert collection.count_documents({"model": {"$in": ["model_d", "model_e"]}}) == 0
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class TestApiKey(IsPrivate):
+    """Test the endpoint authenticated with the experiment API key."""
+
+
+@mark.parametrize(
+    "body",
+    [
+        [
+            {"job_status": "Completed", "model": "model_g", "drift_detected": False},
+            {"job_status": "Completed", "model": "model_h", "drift_detected": True, "parameters": BIN_EDGES},
+            {
+                "id": DRIFTS[0],
+                "job_status": "Completed",
+                "model": "model_i",
+                "drift_detected": True,
+                "parameters": BIN_EDGES,
+            },
+        ]
+    ],
+    indirect=True,
+)
+class TestOffloadedParameters(IsPrivate, CanEdit):
+    """Test the endpoint with large parameters."""
+
+    @fixture(scope="class", autouse=True)
+    def parameters_maxsize(self, app, class_mocker):
+        """Reduce the maximum size of inline parameters."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_PARAMETERS_MAXSIZE": 64})
+
+    def test_statuses(self, response):
+        """Test the drift with an existing id is rejected."""
+        assert [x["status"] for x in response.json["items"]] == [201, 201, 409]
+
+    def test_offloaded(self, response, database, experiment_id):
+        """Test only the large parameters of created drifts are stored apart."""
+        collection = database[f"app.{experiment_id}"]
+        assert "parameters_id" not in collection.find_one({"model": "model_g"})
+        drift = collection.find_one({"model": "model_h"})
+        assert "parameters" not in drift
+        records = list(database["app.parameters"].find({"experiment_id": experiment_id}))
+        assert [x["_id"] for x in records] == [drift["parameters_id"]]
+        assert records[0]["parameters"] == BIN_EDGES
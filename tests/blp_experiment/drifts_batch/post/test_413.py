@@ -0,0 +1,43 @@
+"""Testing module for endpoint methods /drift/batch."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/batch endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 413 response."""
+        assert response.status_code == 413
+        assert response.json["code"] == 413
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class TestTooManyItems(ValidAuth, WithDatabase):
+    """Test when the batch has more items than allowed."""
+
+    @fixture(scope="class", autouse=True)
+    def batch_maxsize(self, app, class_mocker):
+        """Reduce the maximum batch size below the body size."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_BATCH_MAXSIZE": 1})
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Request Entity Too Large"
+        assert response.json["message"] == "Too many drifts in batch."
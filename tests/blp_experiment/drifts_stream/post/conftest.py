@@ -0,0 +1,45 @@
+"""Testing module for endpoint methods /drift/stream."""
+
+# pylint: disable=redefined-outer-name
+import json
+
+from pytest import fixture
+
+
+@fixture(scope="class", name="response")
+def request(client, path, request_kwds):
+    """Create a request object."""
+    yield client.post(path, **request_kwds)
+
+
+@fixture(scope="class")
+def request_kwds(request, auth, content_type, body):
+    """Create a request kwds dict with the body as NDJSON data."""
+    kwds = {"data": body, "content_type": content_type, "auth": auth}
+    kwds.update(request.param if hasattr(request, "param") else {})
+    return kwds
+
+
+@fixture(scope="class")
+def content_type(request):
+    """Inject and return the request content type."""
+    return request.param if hasattr(request, "param") else "application/x-ndjson"
+
+
+@fixture(scope="class")
+def body(request):
+    """Inject and return a request body, one drift per line."""
+    if hasattr(request, "param"):
+        return request.param
+    drifts = [
+        {"job_status": "Completed", "model": "model_a", "drift_detected": False},
+        {"job_status": "Running", "model": "model_b", "drift_detected": True},
+        {"job_status": "Failed", "model": "model_c", "drift_detected": False},
+    ]
+    return "".join(json.dumps(drift) + "\n" for drift in drifts)
+
+
+@fixture(scope="class")
+def results(response):
+    """Return the NDJSON lines of the response."""
+    return [json.loads(line) for line in response.data.splitlines()]
@@ -0,0 +1,124 @@
+"""Testing module for endpoint methods /drift/stream."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/stream endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+
+    def test_summary(self, results, body):
+        """Test the last line summarizes the ingestion."""
+        summary = results[-1]
+        assert summary["done"] is True
+        assert summary["lines"] == len(body.splitlines())
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    @fixture(scope="class", autouse=True)
+    def initial_count(self, with_database, database, experiment_id):
+        """Return the number of drifts before the request."""
+        return database[f"app.{experiment_id}"].count_documents({})
+
+    def test_in_database(self, results, database, experiment_id, initial_count):
+        """Test the created items are in the database."""
+        collection = database[f"app.{experiment_id}"]
+        assert collection.count_documents({}) == initial_count + results[-1]["created"]
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class CanEdit(ValidAuth, WithDatabase):
+    """Base class for group with edit entitlement tests."""
+
+
+class TestAllValid(CanEdit):
+    """Test the endpoint with valid drifts only."""
+
+    def test_counts(self, results):
+        """Test all the lines are created in one chunk."""
+        assert results == [
+            {"lines": 3, "created": 3, "failed": 0},
+            {"lines": 3, "created": 3, "failed": 0, "done": True},
+        ]
+
+
+class TestChunks(CanEdit):
+    """Test the drifts are inserted in chunks."""
+
+    @fixture(scope="class", autouse=True)
+    def chunk_size(self, app, class_mocker):
+        """Reduce the chunk size below the number of lines."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_STREAM_CHUNKSIZE": 2})
+
+    def test_counts(self, results):
+        """Test the progress is reported after each chunk."""
+        assert results == [
+            {"lines": 2, "created": 2, "failed": 0},
+            {"lines": 3, "created": 3, "failed": 0},
+            {"lines": 3, "created": 3, "failed": 0, "done": True},
+        ]
+
+
+@mark.parametrize(
+    "body",
+    [
+        '{"job_status": "Completed", "model": "model_a", "drift_detected": false}\n'
+        "\n"
+        '{"job_status": "Unknown", "model": "model_b", "drift_detected": true}\n'
+        "not json\n"
+        '{"job_status": "Failed", "model": "model_c", "drift_detected": false}'
+    ],
+    indirect=True,
+)
+class TestInvalidLines(CanEdit):
+    """Test the endpoint with invalid lines."""
+
+    def test_summary(self, results):
+        """Test the blank line is skipped but counted."""
+        assert results[-1] == {"lines": 5, "created": 2, "failed": 2, "done": True}
+
+    def test_error_msg(self, results):
+        """Test the rejected lines contain useful information."""
+        errors = [x for x in results if "status" in x]
+        assert [x["line"] for x in errors] == [3, 4]
+        assert "job_status" in errors[0]["errors"]
+        assert errors[1]["errors"] == ["Invalid JSON."]
+
+
+class TestLineTooLong(CanEdit):
+    """Test the lines longer than the maximum are rejected."""
+
+    @fixture(scope="class", autouse=True)
+    def max_line(self, app, class_mocker):
+        """Reduce the maximum line length below the line length."""
+        class_mocker.patch.dict(app.config, {"DRIFTS_STREAM_MAX_LINE": 20})
+
+    def test_error_msg(self, results):
+        """Test every line is rejected as too long."""
+        errors = [x for x in results if "status" in x]
+        assert [x["line"] for x in errors] == [1, 2, 3]
+        assert errors[0]["errors"] == ["Line too long."]
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class TestApiKey(WithDatabase):
+    """Test the endpoint authenticated with the experiment API key."""
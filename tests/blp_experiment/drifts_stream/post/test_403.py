@@ -0,0 +1,43 @@
+"""Testing module for endpoint methods /drift/stream."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/stream endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, response, database, experiment_id):
+        """Test no drift of the stream is in the database."""
+        collection = database[f"app.{experiment_id}"]
+        assert collection.count_documents({"model": {"$in": ["model_a", "model_b"]}}) == 0
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-read"], indirect=True)
+class TestNoEdit(ValidAuth, WithDatabase):
+    """Test when the user does not have edit permission."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
@@ -0,0 +1,39 @@
+"""Testing module for endpoint methods /drift/stream."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /drift/stream endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 415 response."""
+        assert response.status_code == 415
+        assert response.json["code"] == 415
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("content_type", ["application/json"], indirect=True)
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class TestJsonContent(ValidAuth, WithDatabase):
+    """Test when the request is not NDJSON."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unsupported Media Type"
+        assert response.json["message"] == "Expected application/x-ndjson content."
@@ -0,0 +1,138 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from app.tools import jobs
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 202 response."""
+        assert response.status_code == 202
+
+    def test_job(self, response):
+        """Test the response is the pending deletion job."""
+        assert UUID(response.json["id"])
+        assert response.json["task"] == "delete_experiment"
+        assert response.json["status"] == "Pending"
+
+    def test_location(self, response):
+        """Test the response location points to the job."""
+        assert response.headers["Location"] == f"/job/{response.json['id']}"
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_in_database(self, finished, db_experiment):
+        """Test the experiment record is deleted by the job."""
+        assert db_experiment is None
+
+    def test_no_api_keys(self, response, database, experiment_id):
+        """Test the experiment API keys are removed."""
+        api_keys = database["app.api_keys"]
+        assert api_keys.count_documents({"experiment_id": experiment_id}) == 0
+
+    @fixture(scope="class", autouse=True)
+    def no_cache_wait(self, app, class_mocker):
+        """Run the jobs without waiting for the experiments cache."""
+        class_mocker.patch.dict(app.config, {"EXPERIMENTS_CACHE_TTL": 0})
+
+    @fixture(scope="class")
+    def finished(self, response):
+        """Wait until the background jobs are finished."""
+        jobs.join(timeout=10)
+        return response
+
+    def test_no_acl(self, finished, database, experiment_id):
+        """Test the experiment ACL rows are removed."""
+        assert database["app.acl"].count_documents({"experiment_id": experiment_id}) == 0
+
+    def test_no_drifts(self, finished, database, experiment_id):
+        """Test the experiment drift collection is dropped."""
+        assert f"app.{experiment_id}" not in database.list_collection_names()
+
+    def test_job_completed(self, finished, database):
+        """Test the job is completed in the database."""
+        job = database["app.jobs"].find_one({"_id": finished.json["id"]})
+        assert job["status"] == "Completed"
+        assert "finished_at" in job
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class PendingJob(CommonBaseTests):
+    """Base class for tests with the deletion job not executed yet."""
+
+    @fixture(scope="class", autouse=True)
+    def not_run(self, class_mocker):
+        """Keep the submitted jobs from running."""
+        class_mocker.patch.object(jobs, "_run")
+
+    def test_deleting(self, response, database, experiment_id):
+        """Test the experiment is marked as deleting."""
+        experiment = database["app.experiments"].find_one({"_id": experiment_id})
+        assert experiment["deleting"] is True and "deleted_at" in experiment
+
+    def test_stale_cache(self, response, app, client, path, request_kwds, database, experiment_id):
+        """Test a worker with the experiment cached cannot modify it."""
+        experiment = database["app.experiments"].find_one({"_id": experiment_id})
+        cached = {k: v for k, v in experiment.items() if k not in ["deleting", "deleted_at"]}
+        app.config["experiments_cache"].set(experiment_id, cached)
+        kwds = {**request_kwds, "json": {"description": "Deleted elsewhere."}}
+        assert client.patch(path, **kwds).status_code == 404
+        app.config["experiments_cache"].set(experiment_id, cached)
+        assert client.delete(path, **request_kwds).status_code == 404
+        assert database["app.jobs"].count_documents({"arguments.experiment_id": experiment_id}) == 1
+
+    def test_not_found(self, response, client, request_kwds, database, experiment_id):
+        """Test the experiment is not found, also to add drifts."""
+        assert client.get(f"/experiment/{experiment_id}", **request_kwds).status_code == 404
+        body = {"job_status": "Completed", "model": "model_a", "drift_detected": False}
+        kwds = {**request_kwds, "json": body}
+        assert client.post(f"/experiment/{experiment_id}/drift", **kwds).status_code == 404
+        assert database[f"app.{experiment_id}"].count_documents({"model": "model_a"}) == 0
+
+    def test_not_listed(self, response, client, request_kwds, experiment_id):
+        """Test the experiment is not returned by searches."""
+        kwds = {**request_kwds, "json": {}, "query_string": {"page_size": 100}}
+        listing = client.post("/experiment/search", **kwds).json
+        assert experiment_id not in [x["id"] for x in listing]
+
+    def test_job_deletes(self, response, app, database, experiment_id, mocker):
+        """Test the job waits for the cached copies, then deletes the record last."""
+        sleep = mocker.patch.object(jobs.time, "sleep")
+        mocker.patch.dict(app.config, {"EXPERIMENTS_CACHE_TTL": 30})
+        assert jobs.execute(response.json["id"]) == "Completed"
+        assert 25 < sleep.call_args.args[0] <= 30
+        assert database["app.experiments"].find_one({"_id": experiment_id}) is None
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", CAN_MANAGE, indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("experiment_id", PRIVATE_EXPS, indirect=True)
+class TestGroupWithManage(CanManage):
+    """Test when group has manage rights on the experiment."""
+
+
+@mark.parametrize("user_info", CAN_MANAGE[:1], indirect=True)
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+class TestPendingJob(ValidAuth, PendingJob):
+    """Test the experiment while its deletion job is pending."""
@@ -4,7 +4,10 @@
 from datetime import datetime as dt
 from uuid import UUID
 
-from pytest import mark
+from mongomock.collection import Collection
+from pytest import fixture, mark
+
+from app import utils
 
 from tests.constants import *
 
@@ -67,9 +70,45 @@ class AnyExperiment(WithDatabase):
     """Base class for group with manage entitlement tests."""
 
 
+class StaleCache(WithDatabase):
+    """Base class for tests with the experiment modified after caching it."""
+
+    @fixture(scope="class", autouse=True)
+    def modified(self, with_database, client, path, request_kwds, database, experiment_id):
+        """Cache the experiment, then update it as another worker would."""
+        client.get(path, **request_kwds)
+        update = {"$set": {"description": "Modified elsewhere."}, "$inc": {"revision": 1}}
+        database["app.experiments"].update_one({"_id": experiment_id}, update)
+
+    def test_in_database(self, response, db_experiment):
+        """Test the response is the cached experiment, until it expires."""
+        assert db_experiment["description"] == "Modified elsewhere."
+        assert response.json["description"] != "Modified elsewhere."
+
+    def test_no_query(self, response, experiment_id, mocker):
+        """Test a cache hit does not read the experiments collection."""
+        find_one = mocker.spy(Collection, "find_one")
+        utils.get_experiment(experiment_id)
+        assert find_one.call_count == 0
+
+    def test_invalidated(self, response, client, path, request_kwds, experiment_id):
+        """Test the modified experiment is returned once invalidated."""
+        utils.invalidate_experiment(experiment_id)
+        assert client.get(path, **request_kwds).json["description"] == "Modified elsewhere."
+
+    def test_cached_copy(self, response, experiment_id):
+        """Test the cached experiment is not modified through a result."""
+        utils.get_experiment(experiment_id)["name"] = "changed"
+        assert utils.get_experiment(experiment_id)["name"] != "changed"
+
+
 class TestMissingToken(NoAuthHeader, AnyExperiment):
     """Test the response when no token and is public."""
 
 
 class TestAnyAccess(AnyUser, AnyExperiment):
     """Test the responses item when user has access."""
+
+
+class TestStaleCache(NoAuthHeader, AnyExperiment, StaleCache):
+    """Test the response when the cached experiment is outdated."""
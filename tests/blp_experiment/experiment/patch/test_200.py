@@ -0,0 +1,121 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from datetime import datetime as dt
+from uuid import UUID
+
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+
+    def test_has_id(self, response):
+        """Test the response items have an id."""
+        assert "id" in response.json
+        assert UUID(response.json["id"])
+
+    def test_has_created_at(self, response):
+        """Test the response items have a created_at."""
+        assert "created_at" in response.json
+        assert dt.fromisoformat(response.json["created_at"])
+
+    def test_subset(self, response, body):
+        """Test the response includes the updated fields."""
+        for key, value in body.items():
+            if key != "add_permissions":
+                assert response.json[key] == value
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, db_experiment):
+        """Test the response items are in the database."""
+        assert db_experiment is not None
+        assert response.json == db_experiment
+
+    def test_revision(self, response):
+        """Test the response item revision is increased."""
+        assert response.json["revision"] == 1
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-manage"], indirect=True)
+class CanManage(ValidAuth):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("body", [{"name": "patched name 1"}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[0]], indirect=True)
+class TestChangeName(CanManage, WithDatabase):
+    """Test changing only the name of the experiment."""
+
+    def test_permissions_kept(self, response, database, experiment_id):
+        """Test the fields not sent are not modified."""
+        rows = database["app.acl"].find({"experiment_id": experiment_id})
+        acl_map = {row["entity"]: row["level"] for row in rows}
+        assert acl_map == {x["entity"]: x["level"] for x in response.json["permissions"]}
+        assert response.json["permissions"] != []
+
+
+@mark.parametrize("body", [{"add_permissions": NEW_PERMISSIONS[0]}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[1]], indirect=True)
+class TestAddPermissions(CanManage, WithDatabase):
+    """Test appending permissions to the experiment."""
+
+    def test_new_permissions(self, response, body):
+        """Test the response items have the appended permissions."""
+        permissions = response.json["permissions"]
+        assert permissions[-len(body["add_permissions"]) :] == body["add_permissions"]
+        assert len(permissions) > len(body["add_permissions"])
+
+    def test_acl_updated(self, response, database, experiment_id):
+        """Test the ACL contains the appended permissions."""
+        row = database["app.acl"].find_one({"experiment_id": experiment_id, "entity": "group"})
+        assert row is not None and row["level"] == "Read"
+
+
+@mark.parametrize("body", [{"permissions": [{"level": "Read", "entity": "a"}]}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[2]], indirect=True)
+class TestReplacePermissions(CanManage, WithDatabase):
+    """Test replacing the permissions of the experiment."""
+
+    def test_subset(self, response, body):
+        """Test the owner keeps managing the experiment."""
+        assert response.json["permissions"][:-1] == body["permissions"]
+
+    def test_owner_permission(self, response, db_user):
+        """Test the response items have the owner permission."""
+        owner_permission = {"level": "Manage", "entity": db_user["id"]}
+        assert response.json["permissions"][-1] == owner_permission
+
+    def test_acl_updated(self, response, database, experiment_id):
+        """Test the ACL contains only the new permissions."""
+        rows = database["app.acl"].find({"experiment_id": experiment_id})
+        acl_map = {row["entity"]: row["level"] for row in rows}
+        assert acl_map == {x["entity"]: x["level"] for x in response.json["permissions"]}
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": '"0"'}}], indirect=True)
+@mark.parametrize("body", [{"description": "patched description"}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[3]], indirect=True)
+class TestIfMatch(CanManage, WithDatabase):
+    """Test updating a record without revision with If-Match 0."""
+
+    def test_cache_invalidated(self, response, client, path):
+        """Test the updated experiment is returned after the update."""
+        assert client.get(path).json == response.json
@@ -0,0 +1,74 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, db_experiment, body):
+        """Test the experiment is not modified in the database."""
+        assert db_experiment["name"] != body["name"]
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-unregist"], indirect=True)
+class NotRegistered(ValidAuth):
+    """Tests for message response when user is not registered."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "User not registered."
+
+
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class NoManage(ValidAuth):
+    """Tests for message response when user does not have permission."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
+@mark.parametrize("body", [{"name": "forbidden name"}], indirect=True)
+@mark.parametrize("experiment_id", PUBLIC_EXPS, indirect=True)
+class IsPublic(CommonBaseTests):
+    """Base class for group with public as true."""
+
+
+class TestNotRegistered(NotRegistered, IsPublic, WithDatabase):
+    """Test the response when user is not registered."""
+
+
+class TestNoManage(NoManage, IsPublic, WithDatabase):
+    """Test the response when user does not have manage permission."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class TestApiKey(IsPublic, WithDatabase):
+    """Test the response when authenticated with an API key."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["message"] == "API keys not accepted."
@@ -0,0 +1,39 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 404 response."""
+        assert response.status_code == 404
+        assert response.json["code"] == 404
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-admin"], indirect=True)
+@mark.parametrize("body", [{"name": "new name"}], indirect=True)
+@mark.parametrize("experiment_id", UNKNOWN_EXPS, indirect=True)
+class TestNotFound(ValidAuth, WithDatabase):
+    """Test the response when the experiment does not exist."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Not Found"
+        assert response.json["message"] == "Experiment not found."
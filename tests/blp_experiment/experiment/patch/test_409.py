@@ -0,0 +1,43 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 409 response."""
+        assert response.status_code == 409
+        assert response.json["code"] == 409
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, db_experiment, body):
+        """Test the experiment is not modified in the database."""
+        assert db_experiment["name"] != body["name"]
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-manage"], indirect=True)
+@mark.parametrize("body", [{"name": "conflict_exp"}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[0]], indirect=True)
+class TestRepeatedName(ValidAuth, WithDatabase):
+    """Test the response when name exists in database."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Conflict"
+        assert response.json["message"] == "Name conflict."
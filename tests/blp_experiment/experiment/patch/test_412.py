@@ -0,0 +1,59 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 412 response."""
+        assert response.status_code == 412
+        assert response.json["code"] == 412
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, db_experiment, body):
+        """Test the experiment is not modified in the database."""
+        assert db_experiment["description"] != body["description"]
+        assert "revision" not in db_experiment
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-manage"], indirect=True)
+@mark.parametrize("body", [{"description": "stale description"}], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[0]], indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": '"3"'}}], indirect=True)
+class TestStaleRevision(CanManage):
+    """Test the response when the experiment was modified since read."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Precondition Failed"
+        assert response.json["message"] == "Revision does not match."
+
+
+@mark.parametrize("request_kwds", [{"headers": {"If-Match": "*"}}], indirect=True)
+class TestInvalidRevision(CanManage):
+    """Test the response when If-Match is not a revision."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Precondition Failed"
+        assert response.json["message"] == "Invalid If-Match revision."
@@ -0,0 +1,76 @@
+"""Testing module for endpoint methods /experiment."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /experiment endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 422 response."""
+        assert response.status_code == 422
+        assert response.json["code"] == 422
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_not_saved(self, db_experiment):
+        """Test the experiment is not modified in the database."""
+        assert "revision" not in db_experiment
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-manage"], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[0]], indirect=True)
+class CanManage(ValidAuth, WithDatabase):
+    """Base class for group with manage entitlement tests."""
+
+
+@mark.parametrize("body", [{"revision": 5}], indirect=True)
+class TestUnknownField(CanManage):
+    """Test the response message for unknown key in body."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["revision"] == ["Unknown field."]
+
+
+@mark.parametrize("body", [{"public": "str"}], indirect=True)
+class TestNoBoolPublic(CanManage):
+    """Test the response message for a wrong public type."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert "Not a valid boolean." in errors["public"]
+
+
+@mark.parametrize("body", [{"permissions": [], "add_permissions": []}], indirect=True)
+class TestReplaceAndAdd(CanManage):
+    """Test the response when replacing and appending permissions."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        errors = response.json["errors"]["json"]
+        assert errors["add_permissions"] == ["Cannot be used together with permissions."]
+
+
+@mark.parametrize("body", [{"permissions": BAD_PERMISSIONS[0]}], indirect=True)
+class TestBadPermissions(CanManage):
+    """Test the response message for a wrong permission level."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert "permissions" in response.json["errors"]["json"]
@@ -4,7 +4,7 @@
 from datetime import datetime as dt
 from uuid import UUID
 
-from pytest import mark
+from pytest import fixture, mark
 
 from tests.constants import *
 
@@ -46,6 +46,10 @@ class WithDatabase(CommonBaseTests):
         assert db_experiment is not None
         assert response.json == db_experiment
 
+    def test_revision(self, response):
+        """Test the response item revision is increased."""
+        assert response.json["revision"] == 1
+
 
 @mark.parametrize("auth", ["mock-token"], indirect=True)
 @mark.usefixtures("accept_authorization")
@@ -103,3 +107,33 @@ class TestChangePerm(CanManage, WithDatabase):
         owner_permission = {"level": "Manage", "entity": db_user["id"]}
         expected_permissions.append(owner_permission)
         assert response.json["permissions"] == expected_permissions
+
+    def test_acl_updated(self, response, database, experiment_id):
+        """Test the ACL contains only the new permissions."""
+        rows = database["app.acl"].find({"experiment_id": experiment_id})
+        acl_map = {row["entity"]: row["level"] for row in rows}
+        assert acl_map == {x["entity"]: x["level"] for x in response.json["permissions"]}
+
+
+@mark.parametrize("name", ["new name 5"], indirect=True)
+@mark.parametrize("experiment_id", [EDITABLE_EXPS[0]], indirect=True)
+class TestCachedExperiment(CanManage, WithDatabase):
+    """Test updating an experiment present in the experiments cache."""
+
+    @fixture(scope="class")
+    def cached(self, client, path):
+        """Request the experiment before updating it."""
+        return client.get(path).json
+
+    @fixture(scope="class")
+    def response(self, client, path, request_kwds, cached):
+        """Update the experiment after caching it."""
+        return client.put(path, **request_kwds)
+
+    def test_revision(self, response, cached):
+        """Test the response item revision is increased."""
+        assert response.json["revision"] == cached.get("revision", 0) + 1
+
+    def test_cache_invalidated(self, response, client, path):
+        """Test the updated experiment is returned after the update."""
+        assert client.get(path).json == response.json
@@ -2,10 +2,13 @@
 
 # pylint: disable=redefined-outer-name
 from datetime import datetime as dt
+from unittest import mock
 from uuid import UUID
 
-from pytest import mark
+from mongomock.database import Database
+from pytest import fixture, mark
 
+from app.tools.database import SHARED_DRIFTS, TIMESERIES, compare_indexes, declared_indexes
 from tests.constants import *
 
 
@@ -48,6 +51,18 @@ class WithDatabase(CommonBaseTests):
         assert db_experiment is not None
         assert response.json == db_experiment
 
+    def test_indexes(self, response, database):
+        """Test the collections, with the new drifts, have their indexes."""
+        for name, indexes in declared_indexes(database):
+            report = compare_indexes(database[name], indexes)
+            assert report == {"missing": [], "different": [], "unexpected": []}
+
+    def test_in_acl(self, response, database):
+        """Test the response item permissions are in the ACL."""
+        rows = database["app.acl"].find({"experiment_id": response.json["id"]})
+        acl_map = {row["entity"]: row["level"] for row in rows}
+        assert acl_map == {x["entity"]: x["level"] for x in response.json["permissions"]}
+
 
 @mark.parametrize("auth", ["mock-token"], indirect=True)
 @mark.usefixtures("accept_authorization")
@@ -80,6 +95,46 @@ class WithPublic(WithDatabase):
         assert response.json["public"] is True
 
 
+@mark.parametrize("body", [{"storage": "timeseries"}], indirect=True)
+class WithTimeseries(WithDatabase):
+    """Test the response items with time-series storage."""
+
+    @fixture(scope="class", autouse=True)
+    def create_collection(self, class_mocker):
+        """Mock the time-series collections, not supported by mongomock."""
+        create = Database.create_collection
+        return class_mocker.patch.object(
+            Database,
+            "create_collection",
+            autospec=True,
+            side_effect=lambda self, name, **_: create(self, name),
+        )
+
+    def test_storage(self, response):
+        """Test the response items have time-series storage."""
+        assert response.json["storage"] == "timeseries"
+
+    def test_collection(self, response, create_collection):
+        """Test the drift collection is created as time-series."""
+        name = f"app.{response.json['id']}"
+        create_collection.assert_called_once_with(mock.ANY, name, timeseries=TIMESERIES)
+
+
+class WithSharedDrifts(WithDatabase):
+    """Test the response items with shared drift storage."""
+
+    @fixture(scope="class", autouse=True)
+    def shared_drifts(self, app, class_mocker):
+        """Store the drifts of new experiments in the shared collection."""
+        class_mocker.patch.dict(app.config, {"DATABASE_SHARED_DRIFTS": True})
+
+    def test_shared(self, response, database):
+        """Test the experiment drifts are stored in the shared collection."""
+        experiment = database["app.experiments"].find_one({"_id": response.json["id"]})
+        assert experiment["drifts_collection"] == SHARED_DRIFTS
+        assert "drifts_collection" not in response.json
+
+
 @mark.parametrize("permissions", NEW_PERMISSIONS, indirect=True)
 class WithPermissions(WithDatabase):
     """Test the response items with extra permissions."""
@@ -110,3 +165,13 @@ class TestSharedExperiment(Registered, WithPermissions):
 @mark.parametrize("name", ["new_public_exp"], indirect=True)
 class TestPublicExperiment(Registered, WithPublic):
     """Test the /experiment endpoint with simple permissions."""
+
+
+@mark.parametrize("name", ["new_timeseries_exp"], indirect=True)
+class TestTimeseriesExperiment(Registered, WithTimeseries):
+    """Test the /experiment endpoint with time-series storage."""
+
+
+@mark.parametrize("name", ["new_shared_drifts_exp"], indirect=True)
+class TestSharedDriftsExperiment(Registered, WithSharedDrifts):
+    """Test the /experiment endpoint with shared drift storage."""
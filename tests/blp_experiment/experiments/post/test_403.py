@@ -39,3 +39,17 @@ class NotRegistered(ValidAuth):
 
 class TestNotRegistered(NotRegistered, WithDatabase):
     """Test the authentication response when user not registered."""
+
+
+@mark.parametrize("auth", API_KEYS, indirect=True)
+class WithApiKey(CommonBaseTests):
+    """Tests for message response when authenticated with an API key."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "API keys not accepted."
+
+
+class TestApiKey(WithApiKey, WithDatabase):
+    """Test the authentication response when using an API key."""
@@ -1,11 +1,12 @@
 """Testing module for endpoint methods /experiment."""
 
 # pylint: disable=redefined-outer-name
+import json
 from datetime import datetime as dt
 from datetime import timezone as tz
 from uuid import UUID
 
-from pytest import mark
+from pytest import fixture, mark
 
 from tests.constants import *
 
@@ -128,3 +129,76 @@ class TestNameFilter(NoAuthHeader, NameFilter):
 
 class TestSorting(NoAuthHeader, SortBy):
     """Test the response items contain the correct order."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("query", [{"accessible": True}], indirect=True)
+class Accessible(WithDatabase):
+    """Test the response items when listing accessible experiments."""
+
+
+class TestAccessiblePublic(NoAuthHeader, Accessible):
+    """Test anonymous users list only public experiments."""
+
+    def test_only_public(self, response):
+        """Test the response items are public."""
+        assert all(x["public"] for x in response.json)
+
+
+@mark.parametrize("user_info", ["ai4eosc-null"], indirect=True)
+class TestAccessibleNoPermission(ValidAuth, Accessible):
+    """Test users without permissions list only public experiments."""
+
+    def test_only_public(self, response):
+        """Test the response items are public."""
+        assert all(x["public"] for x in response.json)
+
+
+@mark.parametrize("user_info", ["ai4eosc-read"], indirect=True)
+class TestAccessibleWithPermission(ValidAuth, Accessible):
+    """Test users list the experiments they have permissions on."""
+
+    def test_includes_private(self, response):
+        """Test the response items include private experiments."""
+        assert PRIVATE_EXPS[0] in [x["id"] for x in response.json]
+
+
+@mark.parametrize("query", [{"page_size": 2}], indirect=True)
+@mark.parametrize("sort_by", ["created_at", "name", "public"], indirect=True)
+@mark.parametrize("order_by", ["asc", "desc"], indirect=True)
+class CursorPages(WithDatabase):
+    """Test the response items read page by page with cursors."""
+
+    @fixture(scope="class")
+    def pages(self, client, path, request_kwds, response):
+        """Follow the next cursors from the first page to the last one."""
+        pages, query = [response], request_kwds["query_string"]
+        while cursor := json.loads(pages[-1].headers["X-Pagination"])["next_cursor"]:
+            kwds = {**request_kwds, "query_string": {**query, "cursor": cursor}}
+            pages.append(client.post(path, **kwds))
+        return pages
+
+    @fixture(scope="class")
+    def listing(self, client, path, request_kwds):
+        """Return all the items in a single page."""
+        kwds = {**request_kwds, "query_string": {**request_kwds["query_string"], "page_size": 100}}
+        return client.post(path, **kwds).json
+
+    def test_pages(self, pages):
+        """Test the pages after the first one are read with cursors."""
+        assert len(pages) > 1
+        assert all(page.status_code == 200 for page in pages)
+        assert all(len(page.json) <= 2 for page in pages)
+
+    def test_all_items(self, pages, listing):
+        """Test each item is returned once, in the order of a single page."""
+        assert [x["id"] for page in pages for x in page.json] == [x["id"] for x in listing]
+
+
+class TestCursorPages(NoAuthHeader, CursorPages):
+    """Test the responses items read with cursors."""
@@ -0,0 +1,10 @@
+"""Testing module for endpoint methods /job."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class")
+def job_id(request):
+    """Return Job id from request param."""
+    return request.param if hasattr(request, "param") else None
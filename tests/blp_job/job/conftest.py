@@ -0,0 +1,12 @@
+"""Testing module for endpoint methods /job/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class")
+def path(request, job_id):
+    """Return the path for the request."""
+    if hasattr(request, "param") and request.param:
+        return request.param
+    return f"/job/{job_id}"
@@ -0,0 +1,10 @@
+"""Testing module for endpoint methods /job/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture
+
+
+@fixture(scope="class", name="response")
+def request(client, path, request_kwds):
+    """Create a request object."""
+    yield client.get(path, **request_kwds)
@@ -0,0 +1,51 @@
+"""Testing module for endpoint methods /job/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+from tests.utils import api_dates
+
+
+class CommonBaseTests:
+    """Common tests for the /job/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 200 response."""
+        assert response.status_code == 200
+
+    def test_status(self, response):
+        """Test the response item has a valid status."""
+        assert response.json["status"] in ["Pending", "Running", "Completed", "Failed"]
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_in_database(self, response, database, job_id):
+        """Test the response item is the job in the database."""
+        job = database["app.jobs"].find_one({"_id": job_id})
+        assert response.json == api_dates({"id": job.pop("_id"), **job})
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("job_id", JOBS, indirect=True)
+class IsJob(CommonBaseTests):
+    """Base class for existing jobs."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-manage"], indirect=True)
+class TestRequester(ValidAuth, IsJob, WithDatabase):
+    """Test when the user requested the job."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-admin"], indirect=True)
+class TestAdmin(ValidAuth, IsJob, WithDatabase):
+    """Test when the user is an administrator."""
@@ -0,0 +1,26 @@
+"""Testing module for endpoint methods /job/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /job/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 401 response."""
+        assert response.status_code == 401
+        assert response.json["code"] == 401
+
+
+@mark.parametrize("job_id", JOBS, indirect=True)
+@mark.parametrize("auth", [None], indirect=True)
+class TestNoAuthHeader(CommonBaseTests):
+    """Tests when missing authentication header."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "No authorization header"
@@ -0,0 +1,49 @@
+"""Testing module for endpoint methods /job/<id>."""
+
+# pylint: disable=redefined-outer-name
+from pytest import mark
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /job/<id> endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("job_id", JOBS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-edit"], indirect=True)
+class TestOtherUser(ValidAuth, WithDatabase):
+    """Test when the job was requested by other user."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Insufficient permissions."
+
+
+@mark.parametrize("job_id", JOBS, indirect=True)
+@mark.parametrize("user_info", ["ai4eosc-unregist"], indirect=True)
+class TestNotRegistered(ValidAuth, WithDatabase):
+    """Test when the user is not registered."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "User not registered."
@@ -4,7 +4,7 @@
 from datetime import datetime as dt
 from uuid import UUID
 
-from pytest import mark
+from pytest import fixture, mark
 
 from tests.constants import *
 
@@ -55,3 +55,19 @@ class Registered(ValidAuth):
 
 class TestSimpleInfo(Registered, WithDatabase):
     """Test the response when user is registered."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-unregist"], indirect=True)
+class NewlyRegistered(ValidAuth):
+    """Tests for a user registered after being rejected as unregistered."""
+
+    @fixture(scope="class")
+    def response(self, client, path, request_kwds):
+        """Request the user before and after registration."""
+        assert client.get(path, **request_kwds).status_code == 403
+        assert client.post("/user", **request_kwds).status_code == 201
+        return client.get(path, **request_kwds)
+
+
+class TestNewlyRegistered(NewlyRegistered, WithDatabase):
+    """Test the users cache is invalidated on registration."""
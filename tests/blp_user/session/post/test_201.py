@@ -0,0 +1,69 @@
+"""Testing module for endpoint methods /user/session."""
+
+# pylint: disable=redefined-outer-name
+from datetime import datetime as dt
+
+from pytest import fixture, mark
+from werkzeug.datastructures import Authorization
+
+from app.tools import sessions
+from tests.constants import *
+
+
+@fixture(scope="class")
+def session_auth(response):
+    """Return the authorization header with the session token."""
+    return Authorization("bearer", token=response.json["token"])
+
+
+class CommonBaseTests:
+    """Common tests for the /user/session endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 201 response."""
+        assert response.status_code == 201
+
+    def test_token(self, response):
+        """Test the response item has a session token."""
+        assert sessions.is_session_token(response.json["token"])
+
+    def test_expires_at(self, response):
+        """Test the response item has a correct expiration date."""
+        assert dt.fromisoformat(response.json["expires_at"]) > dt.now().astimezone()
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+    def test_user_id(self, response, database, user_info):
+        """Test the response item has the registered user id."""
+        user = database["app.users"].find_one({"subject": user_info["sub"]})
+        assert response.json["user_id"] == user["_id"]
+
+    def test_session_requests(self, client, session_auth, accept_authorization):
+        """Test the session token is accepted without contacting the OP."""
+        assert client.get("/user/self", auth=session_auth).status_code == 200
+        assert client.get("/entitlement", auth=session_auth).status_code == 200
+        assert accept_authorization.call_count == 1
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-admin"], indirect=True)
+class Registered(ValidAuth):
+    """Tests for a registered user exchanging the token."""
+
+
+class TestRegistered(Registered, WithDatabase):
+    """Test the session token issued to registered users."""
+
+    def test_entitlements(self, client, session_auth, user_info):
+        """Test the session token carries the user entitlements."""
+        response = client.get("/entitlement", auth=session_auth)
+        assert response.json["items"] == sorted(user_info["realm_access"]["roles"])
@@ -0,0 +1,77 @@
+"""Testing module for endpoint methods /user/session."""
+
+# pylint: disable=redefined-outer-name
+import time
+
+import jwt
+from pytest import fixture, mark
+from werkzeug.datastructures import Authorization
+
+from app.tools import sessions
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /user/session endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 401 response."""
+        assert response.status_code == 401
+        assert response.json["code"] == 401
+
+
+@mark.parametrize("auth", [None], indirect=True)
+class NoAuthHeader(CommonBaseTests):
+    """Tests when missing authentication header."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "No authorization header"
+
+
+class InvalidSession(CommonBaseTests):
+    """Tests when the session token is not valid."""
+
+    @fixture(scope="class")
+    def auth(self, app, claims, secret):
+        """Return a session token signed for the test."""
+        token = jwt.encode(claims, secret, algorithm=sessions.SESSION_ALGORITHM)
+        return Authorization("bearer", token=sessions.SESSION_TOKEN_PREFIX + token)
+
+    @fixture(scope="class")
+    def secret(self, app):
+        """Return the secret used to sign the session token."""
+        return app.config["SESSION_SECRET"]
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Unauthorized"
+        assert response.json["message"] == "Invalid or expired session token."
+
+
+@mark.parametrize("claims", [{"sub": "s", "iss": "i", "uid": "u", "exp": 1}], indirect=True)
+class ExpiredSession(InvalidSession):
+    """Tests when the session token is expired."""
+
+
+@mark.parametrize("claims", [{"sub": "s", "iss": "i", "uid": "u", "exp": time.time() + 60}], indirect=True)
+class ForgedSession(InvalidSession):
+    """Tests when the session token is signed with other secret."""
+
+    @fixture(scope="class")
+    def secret(self):
+        """Return a secret different from the application one."""
+        return "not-the-application-secret"
+
+
+class TestMissingToken(NoAuthHeader):
+    """Test the /user/session endpoint with missing token."""
+
+
+class TestExpiredSession(ExpiredSession):
+    """Test the /user/session endpoint with an expired session."""
+
+
+class TestForgedSession(ForgedSession):
+    """Test the /user/session endpoint with a forged session."""
@@ -0,0 +1,62 @@
+"""Testing module for endpoint methods /user/session."""
+
+# pylint: disable=redefined-outer-name
+from pytest import fixture, mark
+from werkzeug.datastructures import Authorization
+
+from tests.constants import *
+
+
+class CommonBaseTests:
+    """Common tests for the /user/session endpoint."""
+
+    def test_status_code(self, response):
+        """Test the 403 response."""
+        assert response.status_code == 403
+        assert response.json["code"] == 403
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_context", "with_database")
+class WithDatabase(CommonBaseTests):
+    """Base class for tests using database."""
+
+
+@mark.parametrize("auth", ["mock-token"], indirect=True)
+@mark.usefixtures("accept_authorization")
+class ValidAuth(CommonBaseTests):
+    """Base class for valid authenticated tests."""
+
+
+@mark.parametrize("user_info", ["ai4eosc-unregist"], indirect=True)
+class NotRegistered(ValidAuth):
+    """Tests for message response when user is not registered."""
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "User not registered."
+
+
+@mark.parametrize("user_info", ["ai4eosc-null"], indirect=True)
+class SessionExchange(ValidAuth):
+    """Tests for message response when exchanging a session token."""
+
+    @fixture(scope="class")
+    def response(self, client, path, request_kwds):
+        """Exchange the session token obtained from the access token."""
+        session = client.post(path, **request_kwds).json["token"]
+        return client.post(path, auth=Authorization("bearer", token=session))
+
+    def test_error_msg(self, response):
+        """Test message contains useful information."""
+        assert response.json["status"] == "Forbidden"
+        assert response.json["message"] == "Session tokens cannot be exchanged."
+
+
+class TestNotRegistered(NotRegistered, WithDatabase):
+    """Test the response when user not registered."""
+
+
+class TestSessionExchange(SessionExchange, WithDatabase):
+    """Test the response when exchanging a session token."""
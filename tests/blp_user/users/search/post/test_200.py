@@ -1,11 +1,12 @@
 """Testing module for endpoint methods /user."""
 
 # pylint: disable=redefined-outer-name
+import json
 from datetime import datetime as dt
 from datetime import timezone as tz
 from uuid import UUID
 
-from pytest import mark
+from pytest import fixture, mark
 
 
 class CommonBaseTests:
@@ -115,3 +116,39 @@ class TestBeforeFilter(IsAdmin, BeforeFilter):
 
 class TestSorting(IsAdmin, SortBy):
     """Test the response items contain the correct order."""
+
+
+@mark.parametrize("query", [{"page_size": 2}], indirect=True)
+@mark.parametrize("sort_by", ["created_at", "issuer"], indirect=True)
+@mark.parametrize("order_by", ["asc", "desc"], indirect=True)
+class CursorPages(WithDatabase):
+    """Test the response items read page by page with cursors."""
+
+    @fixture(scope="class")
+    def pages(self, client, path, request_kwds, response):
+        """Follow the next cursors from the first page to the last one."""
+        pages, query = [response], request_kwds["query_string"]
+        while cursor := json.loads(pages[-1].headers["X-Pagination"])["next_cursor"]:
+            kwds = {**request_kwds, "query_string": {**query, "cursor": cursor}}
+            pages.append(client.post(path, **kwds))
+        return pages
+
+    @fixture(scope="class")
+    def listing(self, client, path, request_kwds):
+        """Return all the items in a single page."""
+        kwds = {**request_kwds, "query_string": {**request_kwds["query_string"], "page_size": 100}}
+        return client.post(path, **kwds).json
+
+    def test_pages(self, pages):
+        """Test the pages after the first one are read with cursors."""
+        assert len(pages) > 1
+        assert all(page.status_code == 200 for page in pages)
+        assert all(len(page.json) <= 2 for page in pages)
+
+    def test_all_items(self, pages, listing):
+        """Test each item is returned once, in the order of a single page."""
+        assert [x["id"] for page in pages for x in page.json] == [x["id"] for x in listing]
+
+
+class TestCursorPages(IsAdmin, CursorPages):
+    """Test the responses items read with cursors."""
@@ -2,15 +2,22 @@
 
 # pylint: disable=redefined-outer-name
 import json
+import time
 import uuid
 
+import jwt
 import mongomock
+from cryptography.hazmat.primitives.asymmetric import rsa
 from flaat.user_infos import UserInfos
 from pytest import fixture
 from werkzeug.datastructures import Authorization
 
 from app import create_app
-from app.tools import authentication
+from app.tools import acl, authentication
+from app.tools.migrations import migrate_database
+from app.tools.cache import SQLiteCache
+from app.tools.database import create_indexes
+from tests.utils import api_dates
 
 MOCK_DATABASE_FILE = "tests/fixtures/database.json"
 
@@ -31,15 +38,41 @@ def database(app):
     """Return the database from the application."""
     database_patch = f"test-{uuid.uuid4()}"
     app.config["db"] = app.config["db_client"][database_patch]
+    create_indexes(app.config["db"])
     return app.config["db"]
 
 
+@fixture(scope="class", autouse=True)
+def clear_caches(app):
+    """Reset the application caches between test classes."""
+    app.config["auth_cache"].clear()
+    app.config["users_cache"].clear()
+    app.config["api_keys_cache"].clear()
+    app.config["experiments_cache"].clear()
+    app.config["acl_cache"].clear()
+
+
+@fixture(scope="class")
+def shared_cache(app, tmp_path_factory):
+    """Replaces the identity caches by caches shared through SQLite."""
+    path = str(tmp_path_factory.mktemp("cache") / "cache.sqlite3")
+    backup = {key: app.config[key] for key in ["auth_cache", "users_cache"]}
+    app.config["auth_cache"] = SQLiteCache(path, "tokens", maxsize=1024, ttl=300)
+    app.config["users_cache"] = SQLiteCache(path, "users", maxsize=1024, ttl=300)
+    yield path
+    app.config.update(backup)
+
+
 @fixture(scope="module")
-def with_database(database):
+def with_database(app, database):
     """Loads the database with data from data file."""
     with open(MOCK_DATABASE_FILE, "r", encoding="utf-8") as file:
         for section in json.load(file):
             database[section["collection"]].insert_many(section["items"])
+    create_indexes(database, experiments=True)
+    migrate_database(database)
+    with app.app_context():
+        acl.rebuild(database)
 
 
 @fixture(scope="module")
@@ -107,13 +140,39 @@ def accept_authorization(class_mocker, user_info, issuer):
         user_info=user_info if user_info else {},
         introspection_info=None,
     )
-    class_mocker.patch.object(
+    return class_mocker.patch.object(
         authentication.flaat,
         "get_user_infos_from_access_token",
         return_value=user_infos,
     )
 
 
+@fixture(scope="class")
+def claims(request):
+    """Inject and return extra claims for locally signed tokens."""
+    return request.param if hasattr(request, "param") else {}
+
+
+@fixture(scope="class")
+def local_jwt(app, tmp_path_factory, user_info, claims):
+    """Enables local JWT verification and returns a token signed for it."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwks_file = tmp_path_factory.mktemp("jwks") / "jwks.json"
+    jwks_file.write_text(json.dumps({"keys": [dict(jwk, kid="test-key")]}), encoding="utf-8")
+    settings = {
+        "AUTH_LOCAL_JWT": True,
+        "AUTH_JWT_AUDIENCE": ["drift-watch-api"],
+        "TRUSTED_OP_LIST": [user_info["iss"]],
+        "AUTH_JWKS_URIS": {user_info["iss"]: jwks_file.as_uri()},
+    }
+    backup = {key: app.config[key] for key in settings}
+    app.config.update(settings)
+    payload = {**user_info, "aud": "drift-watch-api", "exp": int(time.time()) + 600, **claims}
+    yield jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": "test-key"})
+    app.config.update(backup)
+
+
 @fixture(scope="class")
 def db_user(response, database, user_info):
     """Returns user from database after response."""
@@ -121,4 +180,5 @@ def db_user(response, database, user_info):
     user = database["app.users"].find_one(db_filter)
     if user is not None:
         user["id"] = user.pop("_id")
+        user = api_dates(user)
     return user
@@ -11,6 +11,16 @@ UNKNOWN_EXPS = ["00000000-0000-0001-0001-999999999999"]
 DRIFTS = ["00000000-0000-0000-0000-000000000001"]
 UNKNWON_DRIFTS = ["00000000-0000-0000-0000-999999999999"]
 
+# Constants for API keys, granting access to PRIVATE_EXPS[0]
+API_KEYS = ["dwk_private-experiment-key"]
+API_KEY_IDS = ["00000000-0000-0004-0001-000000000001"]
+UNKNOWN_API_KEYS = ["dwk_unknown-experiment-key"]
+UNKNOWN_API_KEY_IDS = ["00000000-0000-0004-0001-999999999999"]
+
+# Constants for background jobs, requested by ai4eosc-manage
+JOBS = ["00000000-0000-0005-0001-000000000001"]
+UNKNOWN_JOBS = ["00000000-0000-0005-0001-999999999999"]
+
 # Constants for drift statuses
 ALL_STATUS = ["Running", "Completed", "Failed"]
 
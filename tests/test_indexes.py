@@ -0,0 +1,138 @@
+"""Testing module for the database indexes and the indexes commands."""
+
+# pylint: disable=redefined-outer-name
+from pymongo import IndexModel
+from pytest import fixture, mark
+
+from app.tools.database import DRIFT_INDEXES, app_indexes, compare_indexes, create_indexes, declared_indexes
+from tests.constants import *
+
+# Empty comparison report, the collection has its declared indexes
+MATCHING = {"missing": [], "different": [], "unexpected": []}
+
+
+class TestCompareIndexes:
+    """Test the comparison of the indexes of a collection."""
+
+    @fixture(scope="class")
+    def collection(self, database):
+        """Collection with indexes on `a`, `b` unique and `c`."""
+        collection = database["test.compare"]
+        collection.create_index("a")
+        collection.create_index("b", unique=True)
+        collection.create_index("c")
+        return collection
+
+    def test_matching(self, collection):
+        """Test the declared indexes are not reported."""
+        indexes = [IndexModel("a"), IndexModel("b", unique=True), IndexModel("c")]
+        assert compare_indexes(collection, indexes) == MATCHING
+
+    def test_missing(self, collection):
+        """Test the declared indexes not in the collection are missing."""
+        indexes = [IndexModel("a"), IndexModel("b", unique=True), IndexModel("c"), IndexModel("d")]
+        assert compare_indexes(collection, indexes) == {**MATCHING, "missing": ["d_1"]}
+
+    def test_different(self, collection):
+        """Test the indexes with other keys or options are different."""
+        indexes = [IndexModel([("a", -1)], name="a_1"), IndexModel("b"), IndexModel("c")]
+        assert compare_indexes(collection, indexes) == {**MATCHING, "different": ["a_1", "b_1"]}
+
+    def test_unexpected(self, collection):
+        """Test the indexes not declared are unexpected."""
+        indexes = [IndexModel("b", unique=True)]
+        assert compare_indexes(collection, indexes) == {**MATCHING, "unexpected": ["a_1", "c_1"]}
+
+
+@mark.parametrize("with_database", ["database_1"], indirect=True)
+@mark.usefixtures("with_database")
+class WithoutDriftIndexes:
+    """Base class for tests with drift collections not indexed."""
+
+    @fixture(scope="class", autouse=True)
+    def drop_indexes(self, database, with_database):
+        """Replace the indexes of the drift collections by an old index."""
+        for name, _ in declared_indexes(database):
+            if name.startswith("app.0"):
+                database[name].drop_indexes()
+                database[name].create_index("public")
+
+    @fixture(scope="class")
+    def drift_collections(self, database, drop_indexes):
+        """Names of the drift collections of the experiments."""
+        return [name for name, _ in declared_indexes(database) if name.startswith("app.0")]
+
+
+class TestStartup(WithoutDriftIndexes):
+    """Test the indexes created on startup."""
+
+    @fixture(scope="class", autouse=True)
+    def errors(self, database, drop_indexes):
+        """Create the indexes as on startup."""
+        return create_indexes(database)
+
+    def test_no_errors(self, errors):
+        """Test every collection is indexed."""
+        assert errors == {}
+
+    def test_app_collections(self, database):
+        """Test the application collections have their indexes."""
+        for name, indexes in app_indexes():
+            assert compare_indexes(database[name], indexes) == MATCHING
+
+    def test_drift_collections(self, database, drift_collections):
+        """Test the drift collections are not indexed on startup."""
+        for name in drift_collections:
+            report = compare_indexes(database[name], DRIFT_INDEXES)
+            assert len(report["missing"]) == len(DRIFT_INDEXES)
+
+
+class TestReconcileDryRun(WithoutDriftIndexes):
+    """Test the reconcile command without changes."""
+
+    @fixture(scope="class")
+    def result(self, app, drop_indexes):
+        """Output of the reconcile command."""
+        return app.test_cli_runner().invoke(args=["indexes", "reconcile", "--dry-run"])
+
+    def test_exit_code(self, result):
+        """Test the command succeeds."""
+        assert result.exit_code == 0
+
+    def test_reported(self, result, drift_collections):
+        """Test the missing and unexpected indexes are reported."""
+        for name in drift_collections:
+            assert f"{name}: missing index idempotency_key_1." in result.output
+            assert f"{name}: unexpected index public_1." in result.output
+        assert f"Found {len(drift_collections) * len(DRIFT_INDEXES)} missing indexes." in result.output
+
+    def test_not_created(self, result, database, drift_collections):
+        """Test the missing indexes are not created."""
+        for name in drift_collections:
+            report = compare_indexes(database[name], DRIFT_INDEXES)
+            assert len(report["missing"]) == len(DRIFT_INDEXES)
+
+
+class TestReconcile(WithoutDriftIndexes):
+    """Test the reconcile command creating the missing indexes."""
+
+    @fixture(scope="class")
+    def result(self, app, drop_indexes):
+        """Output of the reconcile command."""
+        return app.test_cli_runner().invoke(args=["indexes", "reconcile"])
+
+    def test_exit_code(self, result):
+        """Test the command succeeds."""
+        assert result.exit_code == 0
+
+    def test_created(self, result, database, drift_collections):
+        """Test the missing indexes are created and the others kept."""
+        assert f"Created {len(drift_collections) * len(DRIFT_INDEXES)} indexes." in result.output
+        for name in drift_collections:
+            report = compare_indexes(database[name], DRIFT_INDEXES)
+            assert report == {**MATCHING, "unexpected": ["public_1"]}
+
+    def test_idempotent(self, result, app):
+        """Test a second run has no missing index."""
+        result = app.test_cli_runner().invoke(args=["indexes", "reconcile"])
+        assert "Created 0 indexes." in result.output
@@ -0,0 +1,12 @@
+"""Helper functions for the tests."""
+
+from datetime import datetime as dt
+from datetime import timezone as tz
+
+
+def api_dates(item):
+    """Return the item with its BSON dates in ISO format, as in the API."""
+    return {
+        key: value.replace(tzinfo=tz.utc).isoformat() if isinstance(value, dt) else value
+        for key, value in item.items()
+    }